@@ -1,6 +1,11 @@
+import asyncio
 import os
 
+from typing import Union
+
+from . import aio
 from .api import (
+    as_completed,
     async_execute,
     async_run,
     execute,
@@ -10,7 +15,22 @@ from .api import (
     sync_run,
     wait,
 )
+from .async_clients import (
+    AsyncATD,
+    AsyncATDJudge0CE,
+    AsyncATDJudge0ExtraCE,
+    AsyncClient,
+    AsyncRapid,
+    AsyncRapidJudge0CE,
+    AsyncRapidJudge0ExtraCE,
+    AsyncSulu,
+    AsyncSuluJudge0CE,
+    AsyncSuluJudge0ExtraCE,
+)
 from .base_types import Flavor, Language, LanguageAlias, Status, TestCase
+from .cache import DirectoryResultCache, MetadataCache, ResultCache
+from .callbacks import CallbackReceiver
+from .circuit import CircuitBreaker
 from .clients import (
     ATD,
     ATDJudge0CE,
@@ -24,30 +44,64 @@ from .clients import (
     SuluJudge0ExtraCE,
 )
 from .filesystem import File, Filesystem
-from .retry import MaxRetries, MaxWaitTime, RegularPeriodRetry
+from .poller import Poller
+from .pool import ClientPool
+from .ratelimit import FileRateLimiter, RateLimiter
+from .retry import (
+    EstimatedTimeRetry,
+    ExponentialBackoffRetry,
+    MaxRetries,
+    MaxWaitTime,
+    RegularPeriodRetry,
+    RequestRetryPolicy,
+)
 from .submission import Submission
 
 __all__ = [
     "ATD",
     "ATDJudge0CE",
     "ATDJudge0ExtraCE",
+    "AsyncATD",
+    "AsyncATDJudge0CE",
+    "AsyncATDJudge0ExtraCE",
+    "AsyncClient",
+    "AsyncRapid",
+    "AsyncRapidJudge0CE",
+    "AsyncRapidJudge0ExtraCE",
+    "AsyncSulu",
+    "AsyncSuluJudge0CE",
+    "AsyncSuluJudge0ExtraCE",
+    "CallbackReceiver",
+    "CircuitBreaker",
     "Client",
+    "ClientPool",
+    "DirectoryResultCache",
+    "EstimatedTimeRetry",
+    "ExponentialBackoffRetry",
     "File",
+    "FileRateLimiter",
     "Filesystem",
     "Language",
     "LanguageAlias",
     "MaxRetries",
+    "MetadataCache",
     "MaxWaitTime",
+    "Poller",
     "Rapid",
     "RapidJudge0CE",
     "RapidJudge0ExtraCE",
+    "RateLimiter",
     "RegularPeriodRetry",
+    "RequestRetryPolicy",
+    "ResultCache",
     "Status",
     "Submission",
     "Sulu",
     "SuluJudge0CE",
     "SuluJudge0ExtraCE",
     "TestCase",
+    "aio",
+    "as_completed",
     "async_execute",
     "execute",
     "get_client",
@@ -60,9 +114,73 @@ __all__ = [
 
 JUDGE0_IMPLICIT_CE_CLIENT = None
 JUDGE0_IMPLICIT_EXTRA_CE_CLIENT = None
+# Implicit async clients by flavor, with the event loop they were created in.
+# The connection pool of an async client belongs to that loop, so a client is
+# replaced when it is needed in another loop, e.g. on every `asyncio.run`.
+JUDGE0_IMPLICIT_ASYNC_CLIENTS = {}
+
+
+def _load_dotenv():
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except:  # noqa: E722
+        pass
 
 
-def _get_implicit_client(flavor: Flavor) -> Client:
+def _get_implicit_client_kwargs() -> dict:
+    # Implicit clients cache their metadata on disk only if the user opted in
+    # by setting the cache directory.
+    if os.getenv("JUDGE0_CACHE_DIR"):
+        return {"metadata_cache": MetadataCache()}
+    return {}
+
+
+def _find_client_from_env(client_classes):
+    # Try to find one of the predefined keys JUDGE0_{SULU,RAPID,ATD}_API_KEY
+    # in environment variables.
+    for client_class in client_classes:
+        api_key = os.getenv(client_class.API_KEY_ENV)
+        if api_key is not None:
+            return client_class(api_key, **_get_implicit_client_kwargs())
+    return None
+
+
+def _find_failover_client_from_env(client_classes):
+    # Failover is opt-in: with JUDGE0_CLIENT_SELECTION set and keys of several
+    # providers, requests go to the provider chosen by it, either the first
+    # one ("priority") or the one with the lowest round-trip time ("latency"),
+    # and fail over to the other ones while its circuit is open.
+    strategy = os.getenv("JUDGE0_CLIENT_SELECTION")
+    configured_clients = [
+        (client_class, os.getenv(client_class.API_KEY_ENV))
+        for client_class in client_classes
+        if os.getenv(client_class.API_KEY_ENV) is not None
+    ]
+    if strategy is None or len(configured_clients) <= 1:
+        return _find_client_from_env(client_classes)
+
+    if strategy not in ("priority", "latency"):
+        raise ValueError(
+            "Expected JUDGE0_CLIENT_SELECTION to be one of 'priority' or "
+            f"'latency', got {strategy!r}."
+        )
+
+    return ClientPool(
+        [
+            client_class(
+                api_key,
+                circuit_breaker=CircuitBreaker(),
+                **_get_implicit_client_kwargs(),
+            )
+            for client_class, api_key in configured_clients
+        ],
+        strategy=strategy,
+    )
+
+
+def _get_implicit_client(flavor: Flavor) -> Union[Client, ClientPool]:
     global JUDGE0_IMPLICIT_CE_CLIENT, JUDGE0_IMPLICIT_EXTRA_CE_CLIENT
 
     # Implicit clients are already set.
@@ -73,34 +191,28 @@ def _get_implicit_client(flavor: Flavor) -> Client:
 
     from .clients import CE, EXTRA_CE
 
-    try:
-        from dotenv import load_dotenv
-
-        load_dotenv()
-    except:  # noqa: E722
-        pass
+    _load_dotenv()
 
     if flavor == Flavor.CE:
         client_classes = CE
     else:
         client_classes = EXTRA_CE
 
-    # Try to find one of the predefined keys JUDGE0_{SULU,RAPID,ATD}_API_KEY
-    # in environment variables.
-    client = None
-    for client_class in client_classes:
-        api_key = os.getenv(client_class.API_KEY_ENV)
-        if api_key is not None:
-            client = client_class(api_key)
-            break
+    client = _find_failover_client_from_env(client_classes)
 
     # If we didn't find any of the possible predefined keys, initialize
     # the preview Sulu client based on the flavor.
     if client is None:
         if flavor == Flavor.CE:
-            client = SuluJudge0CE(retry_strategy=RegularPeriodRetry(0.5))
+            client = SuluJudge0CE(
+                retry_strategy=RegularPeriodRetry(0.5),
+                **_get_implicit_client_kwargs(),
+            )
         else:
-            client = SuluJudge0ExtraCE(retry_strategy=RegularPeriodRetry(0.5))
+            client = SuluJudge0ExtraCE(
+                retry_strategy=RegularPeriodRetry(0.5),
+                **_get_implicit_client_kwargs(),
+            )
 
     if flavor == Flavor.CE:
         JUDGE0_IMPLICIT_CE_CLIENT = client
@@ -110,6 +222,45 @@ def _get_implicit_client(flavor: Flavor) -> Client:
     return client
 
 
+def _get_implicit_async_client(flavor: Flavor) -> AsyncClient:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    client_loop, client = JUDGE0_IMPLICIT_ASYNC_CLIENTS.get(flavor, (None, None))
+    if loop is not None and client_loop is loop:
+        return client
+
+    from .async_clients import CE, EXTRA_CE
+
+    _load_dotenv()
+
+    if flavor == Flavor.CE:
+        client_classes = CE
+    else:
+        client_classes = EXTRA_CE
+
+    client = _find_client_from_env(client_classes)
+
+    if client is None:
+        if flavor == Flavor.CE:
+            client = AsyncSuluJudge0CE(
+                retry_strategy=RegularPeriodRetry(0.5),
+                **_get_implicit_client_kwargs(),
+            )
+        else:
+            client = AsyncSuluJudge0ExtraCE(
+                retry_strategy=RegularPeriodRetry(0.5),
+                **_get_implicit_client_kwargs(),
+            )
+
+    if loop is not None:
+        JUDGE0_IMPLICIT_ASYNC_CLIENTS[flavor] = (loop, client)
+
+    return client
+
+
 CE = Flavor.CE
 EXTRA_CE = Flavor.EXTRA_CE
 
@@ -0,0 +1,392 @@
+"""Asynchronous counterparts of the functions in :mod:`judge0.api`.
+
+All functions are coroutines that work with :class:`judge0.AsyncClient`
+objects, so thousands of submissions can be created and waited for from a
+single event loop.
+"""
+
+import asyncio
+
+from typing import AsyncIterator, Optional, Union
+
+from .api import (
+    _as_submissions_list,
+    _batch_error,
+    _WaitState,
+    create_submissions_from_test_cases,
+    POLLING_FIELDS,
+)
+from .async_clients import AsyncClient
+from .base_types import Flavor, Iterable, TestCases, TestCaseType
+from .common import batched
+from .errors import ClientResolutionError
+from .retry import RetryStrategy
+from .submission import Submission, Submissions
+
+# Maximum number of batches of submissions sent concurrently by default.
+DEFAULT_MAX_WORKERS = 10
+
+
+def get_client(flavor: Flavor = Flavor.CE) -> AsyncClient:
+    """Resolve async client from API keys from environment or default to
+    preview client.
+
+    Parameters
+    ----------
+    flavor : Flavor
+        Flavor of Judge0 Client.
+
+    Returns
+    -------
+    AsyncClient
+        An object of base type AsyncClient and the specified flavor.
+    """
+    from . import _get_implicit_async_client
+
+    if isinstance(flavor, Flavor):
+        return _get_implicit_async_client(flavor=flavor)
+    else:
+        raise ValueError(
+            "Expected argument flavor to be of of type enum Flavor, "
+            f"got {type(flavor)}."
+        )
+
+
+async def _resolve_client(
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions]] = None,
+) -> AsyncClient:
+    """Resolve an async client from flavor or submission(s) arguments.
+
+    Raises
+    ------
+    ClientResolutionError
+        If there is no implemented client that supports all the languages specified
+        in the submissions.
+    """
+    if isinstance(client, AsyncClient):
+        return client
+
+    if isinstance(client, Flavor):
+        return get_client(client)
+
+    if client is None and isinstance(submissions, Iterable) and len(submissions) == 0:
+        raise ValueError("Client cannot be determined from empty submissions.")
+
+    if isinstance(submissions, Submission):
+        submissions = [submissions]
+
+    languages = [submission.language for submission in submissions]
+
+    for flavor in Flavor:
+        client = get_client(flavor)
+        if client is None:
+            continue
+        if not await client.get_unsupported_languages(languages):
+            return client
+
+    raise ClientResolutionError(
+        "Failed to resolve the client from submissions argument. "
+        "None of the implicit clients supports all languages from the submissions. "
+        "Please explicitly provide the client argument."
+    )
+
+
+async def _gather_batches(client: AsyncClient, func, submissions, max_workers):
+    if max_workers < 1:
+        raise ValueError(
+            f"Maximum number of workers must be at least 1, got {max_workers}."
+        )
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run_batch(submission_batch):
+        async with semaphore:
+            return await func(submission_batch)
+
+    batches = list(batched(submissions, client.config.max_submission_batch_size))
+    # As in the sync API, a failed batch does not cancel the other ones.
+    results = await asyncio.gather(
+        *(run_batch(submission_batch) for submission_batch in batches),
+        return_exceptions=True,
+    )
+
+    result_submissions = []
+    errors = {}
+    for batch_idx, result in enumerate(results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception) or len(batches) == 1:
+                raise result
+            errors[batch_idx] = result
+        else:
+            result_submissions.extend(result)
+
+    if errors:
+        raise _batch_error(errors, len(batches))
+
+    return result_submissions
+
+
+async def create_submissions(
+    *,
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Union[Submission, Submissions]:
+    """Create submissions to the client.
+
+    Batches of submissions are sent concurrently.
+
+    Parameters
+    ----------
+    client : AsyncClient or Flavor, optional
+        A client or client flavor where submissions should be created.
+    submissions: Submission or Submissions, optional
+        Submission(s) to create.
+    max_workers : int, optional
+        Maximum number of batches sent concurrently.
+
+    Raises
+    ------
+    ClientResolutionError
+        Raised if client resolution fails.
+    SubmissionBatchError
+        Raised if some of the concurrently sent batches failed. Submissions
+        from the successful batches still have their tokens set.
+    """
+    client = await _resolve_client(client=client, submissions=submissions)
+
+    if isinstance(submissions, Submission):
+        return await client.create_submission(submissions)
+
+    await client.bootstrap()
+
+    async def create_batch(submission_batch):
+        if len(submission_batch) > 1:
+            return await client.create_submissions(submission_batch)
+        else:
+            return [await client.create_submission(submission_batch[0])]
+
+    return await _gather_batches(client, create_batch, submissions, max_workers)
+
+
+async def get_submissions(
+    *,
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions]] = None,
+    fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Union[Submission, Submissions]:
+    """Get submission (status) from a client.
+
+    Batches of submissions are requested concurrently.
+
+    Parameters
+    ----------
+    client : AsyncClient or Flavor, optional
+        A client or client flavor where submissions should be checked.
+    submissions : Submission or Submissions, optional
+        Submission(s) to update.
+    fields : str or sequence of str, optional
+        Submission attributes that need to be updated. Defaults to all attributes.
+    max_workers : int, optional
+        Maximum number of batches requested concurrently.
+
+    Raises
+    ------
+    ClientResolutionError
+        Raised if client resolution fails.
+    SubmissionBatchError
+        Raised if some of the concurrently requested batches failed.
+    """
+    client = await _resolve_client(client=client, submissions=submissions)
+
+    if isinstance(submissions, Submission):
+        return await client.get_submission(submissions, fields=fields)
+
+    await client.bootstrap()
+
+    async def get_batch(submission_batch):
+        if len(submission_batch) > 1:
+            return await client.get_submissions(submission_batch, fields=fields)
+        else:
+            return [await client.get_submission(submission_batch[0], fields=fields)]
+
+    return await _gather_batches(client, get_batch, submissions, max_workers)
+
+
+async def as_completed(
+    *,
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions, str, Iterable[str]]] = None,
+    retry_strategy: Optional[RetryStrategy] = None,
+    fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> AsyncIterator[Submission]:
+    """Asynchronously iterate over the submissions in the order they finish.
+
+    Asynchronous counterpart of :func:`judge0.api.as_completed`.
+
+    Parameters
+    ----------
+    client : AsyncClient or Flavor, optional
+        A client or client flavor where submissions should be checked.
+    submissions : Submission, Submissions, str or sequence of str
+        Submission(s) or submission token(s) to wait for. The client should be
+        provided explicitly when tokens are passed.
+    retry_strategy : RetryStrategy, optional
+        A retry strategy.
+    fields : str or sequence of str, optional
+        Submission attributes fetched for the finished submissions. Defaults
+        to all attributes.
+    max_workers : int, optional
+        Maximum number of batches polled concurrently.
+
+    Yields
+    ------
+    Submission
+        A finished submission.
+
+    Raises
+    ------
+    ClientResolutionError
+        Raised if client resolution fails.
+    """
+    submissions_list = _as_submissions_list(submissions)
+    client = await _resolve_client(client, submissions_list)
+    state = _WaitState(client, submissions_list, retry_strategy)
+
+    while not state.is_done():
+        await get_submissions(
+            client=client,
+            submissions=state.pending,
+            fields=POLLING_FIELDS,
+            max_workers=max_workers,
+        )
+        finished_submissions = state.collect_finished()
+        if finished_submissions:
+            await get_submissions(
+                client=client,
+                submissions=finished_submissions,
+                fields=fields,
+                max_workers=max_workers,
+            )
+        state.end_round(finished_submissions)
+        for submission in finished_submissions:
+            yield submission
+
+        # Don't wait if there is no submissions to check for anymore.
+        if len(state.pending) == 0:
+            break
+
+        await state.retry_strategy.async_wait()
+        state.retry_strategy.step()
+
+
+async def wait(
+    *,
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions]] = None,
+    retry_strategy: Optional[RetryStrategy] = None,
+    fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Union[Submission, Submissions]:
+    """Wait for all the submissions to finish without blocking the event loop.
+
+    While waiting, only the status of the submissions is polled. Requested
+    fields of a submission are fetched once, after the submission is done.
+
+    Parameters
+    ----------
+    client : AsyncClient or Flavor, optional
+        A client or client flavor where submissions should be checked.
+    submissions : Submission or Submissions
+        Submission(s) to wait for.
+    retry_strategy : RetryStrategy, optional
+        A retry strategy.
+    fields : str or sequence of str, optional
+        Submission attributes fetched for the finished submissions. Defaults
+        to all attributes.
+    max_workers : int, optional
+        Maximum number of batches polled concurrently.
+
+    Raises
+    ------
+    ClientResolutionError
+        Raised if client resolution fails.
+    """
+    async for _ in as_completed(
+        client=client,
+        submissions=submissions,
+        retry_strategy=retry_strategy,
+        fields=fields,
+        max_workers=max_workers,
+    ):
+        pass
+
+    return submissions
+
+
+async def execute(
+    *,
+    client: Optional[Union[AsyncClient, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions]] = None,
+    source_code: Optional[str] = None,
+    test_cases: Optional[Union[TestCaseType, TestCases]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> Union[Submission, Submissions]:
+    """Create submission(s) and wait for their finish.
+
+    Aliases: `run`.
+
+    Parameters
+    ----------
+    client : AsyncClient or Flavor, optional
+        A client where submissions should be created. If None, will try to be
+        resolved.
+    submissions : Submission or Submissions, optional
+        Submission(s) for execution.
+    source_code: str, optional
+        A source code of a program.
+    test_cases: TestCaseType or TestCases, optional
+        A single test or a list of test cases
+    max_workers : int, optional
+        Maximum number of batches sent concurrently.
+
+    Returns
+    -------
+    Submission or Submissions
+        A single submission if submissions arguments is of type Submission or
+        source_code argument is provided, and test_cases argument is of type
+        TestCase. Otherwise returns a list of submissions.
+
+    Raises
+    ------
+    ClientResolutionError
+        If client cannot be resolved from the submissions or the flavor.
+    ValueError
+        If both or neither submissions and source_code arguments are provided.
+    """
+    if submissions is not None and source_code is not None:
+        raise ValueError(
+            "Both submissions and source_code arguments are provided. "
+            "Provide only one of the two."
+        )
+    if submissions is None and source_code is None:
+        raise ValueError("Neither source_code nor submissions argument are provided.")
+
+    if source_code is not None:
+        submissions = Submission(source_code=source_code, **kwargs)
+
+    client = await _resolve_client(client=client, submissions=submissions)
+    all_submissions = create_submissions_from_test_cases(submissions, test_cases)
+    all_submissions = await create_submissions(
+        client=client, submissions=all_submissions, max_workers=max_workers
+    )
+
+    return await wait(
+        client=client, submissions=all_submissions, max_workers=max_workers
+    )
+
+
+run = execute
@@ -1,16 +1,45 @@
-from typing import Optional, Union
+import copy
+import json
+import queue
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Iterator, Optional, Union
+
+import requests
 
 from .base_types import Flavor, Iterable, TestCase, TestCases, TestCaseType
+
+from .cache import ResultCache
+from .callbacks import CallbackReceiver, DEFAULT_CALLBACK_TIMEOUT_SEC
 from .clients import Client
 from .common import batched
-from .errors import ClientResolutionError
-from .retry import RegularPeriodRetry, RetryStrategy
-from .submission import Submission, Submissions
-
-
-def get_client(flavor: Flavor = Flavor.CE) -> Client:
+from .errors import ClientResolutionError, SubmissionBatchError
+from .packing import (
+    group_by_program,
+    MULTI_FILE_LANGUAGE_ID,
+    pack_submissions,
+    split_by_time_limits,
+    unpack_submissions,
+)
+from .poller import get_poller, POLLING_FIELDS
+from .pool import ClientPool
+from .retry import _get_retry_strategy, RetryStrategy
+from .submission import RESPONSE_FIELDS, Submission, Submissions
+
+# Time the server is given to respond with a finished submission on top of
+# its time limits, to account for queueing and compilation.
+SERVER_WAIT_TIMEOUT_MARGIN_SEC = 60.0
+
+
+def get_client(flavor: Flavor = Flavor.CE) -> Union[Client, ClientPool]:
     """Resolve client from API keys from environment or default to preview client.
 
+    If JUDGE0_CLIENT_SELECTION is set to "priority" or "latency" and keys of
+    several providers are found, the client is a :class:`ClientPool` that
+    fails over between them.
+
     Parameters
     ----------
     flavor : Flavor
@@ -18,8 +47,9 @@ def get_client(flavor: Flavor = Flavor.CE) -> Client:
 
     Returns
     -------
-    Client
-        An object of base type Client and the specified flavor.
+    Client or ClientPool
+        An object of base type Client and the specified flavor, or a pool of
+        such clients.
     """
     from . import _get_implicit_client
 
@@ -40,8 +70,9 @@ def _resolve_client(
 
     Parameters
     ----------
-    client : Client or Flavor, optional
-        A Client object or flavor of client. Returns the client if not None.
+    client : Client, ClientPool or Flavor, optional
+        A Client object, a pool of clients or flavor of client. Returns the
+        client if not None.
     submissions: Submission or Submissions, optional
         Submission(s) used to determine the suitable client.
 
@@ -56,8 +87,8 @@ def _resolve_client(
         If there is no implemented client that supports all the languages specified
         in the submissions.
     """
-    # User explicitly passed a client.
-    if isinstance(client, Client):
+    # User explicitly passed a client or a pool of clients.
+    if isinstance(client, (Client, ClientPool)):
         return client
 
     # NOTE: At the moment, we do not support the option to check if explicit
@@ -80,9 +111,7 @@ def _resolve_client(
 
     for flavor in Flavor:
         client = get_client(flavor)
-        if client is not None and all(
-            (client.is_language_supported(lang) for lang in languages)
-        ):
+        if client is not None and not client.get_unsupported_languages(languages):
             return client
 
     raise ClientResolutionError(
@@ -92,10 +121,78 @@ def _resolve_client(
     )
 
 
+def _batch_error(errors: dict, n_batches: int) -> SubmissionBatchError:
+    return SubmissionBatchError(
+        f"{len(errors)} out of {n_batches} batches failed: "
+        + "; ".join(f"batch {idx}: {err!r}" for idx, err in errors.items()),
+        errors=errors,
+    )
+
+
+def _dispatch_batches(
+    client: Client,
+    func: Callable[[tuple[Submission, ...]], list[Submission]],
+    submissions: Submissions,
+    max_workers: Optional[int] = None,
+) -> Submissions:
+    """Apply func to the client-sized batches of submissions.
+
+    Batches are processed sequentially unless max_workers is greater than one,
+    in which case they are sent concurrently over the client's session. The
+    order of the returned submissions always matches the order of the input.
+    """
+    batches = list(batched(submissions, client.config.max_submission_batch_size))
+
+    if max_workers is None or max_workers <= 1 or len(batches) <= 1:
+        return [submission for batch in batches for submission in func(batch)]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = [executor.submit(func, batch) for batch in batches]
+
+    result_submissions = []
+    errors = {}
+    for batch_idx, future in enumerate(futures):
+        exception = future.exception()
+        if exception is not None:
+            errors[batch_idx] = exception
+        else:
+            result_submissions.extend(future.result())
+
+    if errors:
+        raise _batch_error(errors, len(batches))
+
+    return result_submissions
+
+
+def _create_batch(client: Client, submission_batch: Submissions) -> Submissions:
+    if len(submission_batch) > 1:
+        return client.create_submissions(submission_batch)
+    else:
+        return [client.create_submission(submission_batch[0])]
+
+
+def _group_identical(client: Client, submissions: Submissions) -> list[Submissions]:
+    """Group the submissions with identical request bodies, in the order of
+    their first occurrence.
+    """
+    groups = {}
+    for submission in submissions:
+        key = json.dumps(submission.as_body(client), sort_keys=True)
+        groups.setdefault(key, []).append(submission)
+    return list(groups.values())
+
+
+def _copy_result(source: Submission, target: Submission) -> None:
+    for attr in RESPONSE_FIELDS | {"post_execution_filesystem"}:
+        setattr(target, attr, copy.deepcopy(getattr(source, attr)))
+
+
 def create_submissions(
     *,
     client: Optional[Union[Client, Flavor]] = None,
     submissions: Optional[Union[Submission, Submissions]] = None,
+    max_workers: Optional[int] = None,
+    deduplicate: bool = False,
 ) -> Union[Submission, Submissions]:
     """Universal function for creating submissions to the client.
 
@@ -105,27 +202,44 @@ def create_submissions(
         A client or client flavor where submissions should be created.
     submissions: Submission or Submissions, optional
         Submission(s) to create.
+    max_workers : int, optional
+        Maximum number of batches sent concurrently. By default, batches are
+        sent sequentially.
+    deduplicate : bool, optional
+        If True, submissions with identical request bodies are created once
+        and the duplicates share the token of the created submission.
 
     Raises
     ------
     ClientResolutionError
         Raised if client resolution fails.
+    SubmissionBatchError
+        Raised if some of the concurrently sent batches failed. Submissions
+        from the successful batches still have their tokens set.
     """
     client = _resolve_client(client=client, submissions=submissions)
 
     if isinstance(submissions, Submission):
         return client.create_submission(submissions)
 
-    result_submissions = []
-    for submission_batch in batched(
-        submissions, client.config.max_submission_batch_size
-    ):
-        if len(submission_batch) > 1:
-            result_submissions.extend(client.create_submissions(submission_batch))
-        else:
-            result_submissions.append(client.create_submission(submission_batch[0]))
+    if not deduplicate:
+        return _dispatch_batches(
+            client, partial(_create_batch, client), submissions, max_workers
+        )
 
-    return result_submissions
+    groups = _group_identical(client, submissions)
+    try:
+        _dispatch_batches(
+            client,
+            partial(_create_batch, client),
+            [group[0] for group in groups],
+            max_workers,
+        )
+    finally:
+        for group in groups:
+            for duplicate in group[1:]:
+                duplicate.token = group[0].token
+    return list(submissions)
 
 
 def get_submissions(
@@ -133,6 +247,7 @@ def get_submissions(
     client: Optional[Union[Client, Flavor]] = None,
     submissions: Optional[Union[Submission, Submissions]] = None,
     fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: Optional[int] = None,
 ) -> Union[Submission, Submissions]:
     """Get submission (status) from a client.
 
@@ -144,31 +259,310 @@ def get_submissions(
         Submission(s) to update.
     fields : str or sequence of str, optional
         Submission attributes that need to be updated. Defaults to all attributes.
+    max_workers : int, optional
+        Maximum number of batches requested concurrently. By default, batches
+        are requested sequentially.
 
     Raises
     ------
     ClientResolutionError
         Raised if client resolution fails.
+    SubmissionBatchError
+        Raised if some of the concurrently requested batches failed.
     """
     client = _resolve_client(client=client, submissions=submissions)
 
     if isinstance(submissions, Submission):
         return client.get_submission(submissions, fields=fields)
 
-    result_submissions = []
-    for submission_batch in batched(
-        submissions, client.config.max_submission_batch_size
-    ):
+    def get_batch(submission_batch):
         if len(submission_batch) > 1:
-            result_submissions.extend(
-                client.get_submissions(submission_batch, fields=fields)
-            )
+            return client.get_submissions(submission_batch, fields=fields)
         else:
-            result_submissions.append(
-                client.get_submission(submission_batch[0], fields=fields)
-            )
+            return [client.get_submission(submission_batch[0], fields=fields)]
 
-    return result_submissions
+    return _dispatch_batches(client, get_batch, submissions, max_workers)
+
+
+def _as_submissions_list(
+    submissions: Union[Submission, Submissions, str, Iterable[str]],
+) -> list[Submission]:
+    if isinstance(submissions, (Submission, str)):
+        submissions = [submissions]
+    return [
+        Submission(token=submission) if isinstance(submission, str) else submission
+        for submission in submissions
+    ]
+
+
+def as_completed(
+    *,
+    client: Optional[Union[Client, Flavor]] = None,
+    submissions: Optional[Union[Submission, Submissions, str, Iterable[str]]] = None,
+    retry_strategy: Optional[RetryStrategy] = None,
+    fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: Optional[int] = None,
+) -> Iterator[Submission]:
+    """Iterate over the submissions in the order they finish.
+
+    Submissions are polled in batches and each submission is yielded as soon
+    as it is done, so the results can be processed while the rest of the
+    submissions are still running. Submissions that are not done when the
+    retry strategy gives up, or when their own `max_wait_time` expires, are
+    not yielded.
+
+    Parameters
+    ----------
+    client : Client or Flavor, optional
+        A client or client flavor where submissions should be checked.
+    submissions : Submission, Submissions, str or sequence of str
+        Submission(s) or submission token(s) to wait for. The client should be
+        provided explicitly when tokens are passed.
+    retry_strategy : RetryStrategy, optional
+        A retry strategy.
+    fields : str or sequence of str, optional
+        Submission attributes fetched for the finished submissions. Defaults
+        to all attributes.
+    max_workers : int, optional
+        Maximum number of batches polled concurrently.
+
+    Yields
+    ------
+    Submission
+        A finished submission.
+
+    Raises
+    ------
+    ClientResolutionError
+        Raised if client resolution fails.
+    """
+    submissions_list = _as_submissions_list(submissions)
+    client = _resolve_client(client, submissions_list)
+    state = _WaitState(client, submissions_list, retry_strategy)
+
+    while not state.is_done():
+        finished_submissions = _poll(client, state, fields, max_workers)
+        for submission in finished_submissions:
+            yield submission
+
+        # Don't wait if there is no submissions to check for anymore.
+        if len(state.pending) == 0:
+            break
+
+        state.retry_strategy.wait()
+        state.retry_strategy.step()
+
+
+class _WaitState:
+    """State of a wait for submissions, shared by the sync and async waits.
+
+    Every polling round, the status of the `pending` submissions is fetched,
+    the finished ones are taken out with :meth:`collect_finished`, their
+    fields are fetched and the round is closed with :meth:`end_round`.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        submissions: Submissions,
+        retry_strategy: Optional[RetryStrategy] = None,
+    ):
+        self.retry_strategy = _get_retry_strategy(client, retry_strategy)
+        self.start_time = time.monotonic()
+        self.pending = list(submissions)
+
+    def is_done(self) -> bool:
+        """Check if nothing is pending or the retry strategy gave up."""
+        return len(self.pending) == 0 or self.retry_strategy.is_done()
+
+    def collect_finished(self) -> list[Submission]:
+        """Take the finished submissions out of the pending ones."""
+        finished_submissions = [
+            submission for submission in self.pending if submission.is_done()
+        ]
+        self.pending = [
+            submission for submission in self.pending if not submission.is_done()
+        ]
+        return finished_submissions
+
+    def end_round(self, finished_submissions: list[Submission]) -> None:
+        """Close a polling round in which the submissions finished.
+
+        Drops the pending submissions whose `max_wait_time`, counted from the
+        start of the wait, expired and lets the retry strategy observe the
+        round.
+        """
+        elapsed_time = time.monotonic() - self.start_time
+        self.pending = [
+            submission
+            for submission in self.pending
+            if submission.max_wait_time is None
+            or elapsed_time < submission.max_wait_time
+        ]
+        self.retry_strategy.observe(self.pending, finished_submissions)
+
+
+def _poll(
+    client: Client,
+    state: _WaitState,
+    fields: Optional[Union[str, Iterable[str]]],
+    max_workers: Optional[int],
+) -> list[Submission]:
+    """Poll the status of the pending submissions once.
+
+    Fetches the fields of the finished submissions and returns them.
+    """
+    get_submissions(
+        client=client,
+        submissions=state.pending,
+        fields=POLLING_FIELDS,
+        max_workers=max_workers,
+    )
+    finished_submissions = state.collect_finished()
+    if finished_submissions:
+        get_submissions(
+            client=client,
+            submissions=finished_submissions,
+            fields=fields,
+            max_workers=max_workers,
+        )
+    state.end_round(finished_submissions)
+    return finished_submissions
+
+
+def _create_and_wait(
+    client: Client,
+    submissions: Submissions,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> Submissions:
+    """Create the submissions batch by batch and wait for them.
+
+    Polling for the created batches starts right away and overlaps with the
+    creation of the following batches, which are created in the background.
+    At most `max_in_flight` submissions, defaulting to the client's
+    `max_queue_size`, are created but not yet finished at any time, and a
+    new batch is admitted only when earlier submissions finish.
+
+    Raises
+    ------
+    ValueError
+        Raised if `max_in_flight` is smaller than one.
+    SubmissionBatchError
+        Raised if creation of some of the batches failed, after the
+        submissions of the other batches are done, or if the retry strategy
+        gave up before all batches were admitted into the window.
+    """
+    if max_in_flight is None:
+        max_in_flight = client.config.max_queue_size
+    if max_in_flight < 1:
+        raise ValueError(
+            f"Maximum number of submissions in flight must be at least 1, got "
+            f"{max_in_flight}."
+        )
+    state = _WaitState(client, [])
+    batch_size = min(client.config.max_submission_batch_size, max_in_flight)
+    batches = list(batched(submissions, batch_size))
+    created_batches = queue.Queue()
+    errors = {}
+
+    n_admitted_batches = 0
+    n_pending_batches = 0
+    n_creating_submissions = 0
+
+    def on_batch_created(batch_idx, future):
+        created_batches.put((batch_idx, future))
+
+    with ThreadPoolExecutor(max_workers=max_workers or 1) as executor:
+        while (
+            n_admitted_batches < len(batches)
+            or n_pending_batches > 0
+            or len(state.pending) > 0
+        ):
+            # Admit new batches while they fit into the in-flight window.
+            while n_admitted_batches < len(batches):
+                batch = batches[n_admitted_batches]
+                n_in_flight = n_creating_submissions + len(state.pending)
+                if n_in_flight + len(batch) > max_in_flight:
+                    break
+                future = executor.submit(_create_batch, client, batch)
+                future.add_done_callback(partial(on_batch_created, n_admitted_batches))
+                n_admitted_batches += 1
+                n_pending_batches += 1
+                n_creating_submissions += len(batch)
+
+            # Block for the next created batch only if there is nothing to
+            # poll for in the meantime.
+            block = len(state.pending) == 0
+            while n_pending_batches > 0:
+                try:
+                    batch_idx, future = created_batches.get(block=block)
+                except queue.Empty:
+                    break
+                block = False
+                n_pending_batches -= 1
+                n_creating_submissions -= len(batches[batch_idx])
+                if future.exception() is not None:
+                    errors[batch_idx] = future.exception()
+                else:
+                    state.pending.extend(future.result())
+
+            if len(state.pending) == 0:
+                continue
+            if state.is_done():
+                break
+
+            _poll(client, state, None, max_workers)
+
+            if len(state.pending) > 0:
+                state.retry_strategy.wait()
+                state.retry_strategy.step()
+
+    # Creation of the batches pending when the retry strategy gave up has
+    # finished once the executor is shut down.
+    while not created_batches.empty():
+        batch_idx, future = created_batches.get()
+        if future.exception() is not None:
+            errors[batch_idx] = future.exception()
+    for batch_idx in range(n_admitted_batches, len(batches)):
+        errors[batch_idx] = RuntimeError(
+            "Batch was not created, as the retry strategy gave up waiting for "
+            "the earlier submissions."
+        )
+
+    if errors:
+        raise _batch_error(errors, len(batches))
+
+    return submissions
+
+
+def _get_server_wait_timeout(client: Client, submission: Submission) -> float:
+    wall_time_limit = submission.wall_time_limit or client.config.wall_time_limit
+    number_of_runs = submission.number_of_runs or client.config.number_of_runs
+    return wall_time_limit * number_of_runs + SERVER_WAIT_TIMEOUT_MARGIN_SEC
+
+
+def _create_with_server_wait(
+    client: Client, submission: Submission, wait_timeout: Optional[float]
+) -> Submission:
+    """Create a submission that the server responds to once it is done.
+
+    Falls back to polling if the server does not wait for the submission, or
+    if the connection could not be established in time, in which case the
+    submission is created again without waiting. A request that timed out
+    while reading the response was already accepted by the server, so it is
+    not sent again and the timeout is raised instead.
+    """
+    if wait_timeout is None:
+        wait_timeout = _get_server_wait_timeout(client, submission)
+    try:
+        client.create_submission(submission, wait=True, wait_timeout=wait_timeout)
+    except requests.ConnectTimeout:
+        client.create_submission(submission)
+
+    if not submission.is_done():
+        wait(client=client, submissions=submission)
+    return submission
 
 
 def wait(
@@ -176,9 +570,20 @@ def wait(
     client: Optional[Union[Client, Flavor]] = None,
     submissions: Optional[Union[Submission, Submissions]] = None,
     retry_strategy: Optional[RetryStrategy] = None,
+    fields: Optional[Union[str, Iterable[str]]] = None,
+    max_workers: Optional[int] = None,
+    callback_receiver: Optional[CallbackReceiver] = None,
+    callback_timeout: Optional[float] = DEFAULT_CALLBACK_TIMEOUT_SEC,
+    shared_poller: bool = False,
 ) -> Union[Submission, Submissions]:
     """Wait for all the submissions to finish.
 
+    While waiting, only the status of the submissions is polled. Requested
+    fields of a submission are fetched once, after the submission is done.
+    Submissions created with the callback URL of a callback receiver are
+    resolved by their callbacks instead, and only the submissions whose
+    callback did not arrive in time are polled for.
+
     Parameters
     ----------
     client : Client or Flavor, optional
@@ -187,45 +592,68 @@ def wait(
         Submission(s) to wait for.
     retry_strategy : RetryStrategy, optional
         A retry strategy.
+    fields : str or sequence of str, optional
+        Submission attributes fetched for the finished submissions. Defaults
+        to all attributes.
+    max_workers : int, optional
+        Maximum number of batches polled concurrently.
+    callback_receiver : CallbackReceiver, optional
+        Receiver of the callbacks of the submissions. Submissions resolved by
+        their callbacks have the attributes Judge0 sends, regardless of
+        `fields`.
+    callback_timeout : float, optional
+        Time to wait for the callbacks, in seconds, before polling for the
+        remaining submissions.
+    shared_poller : bool, optional
+        If True, the submissions are polled by the client's background poller,
+        see :func:`judge0.poller.get_poller`, together with the submissions of
+        all other threads waiting with the same client. The poller schedules
+        its rounds with the client's retry strategy, `retry_strategy` is not
+        used in that case.
 
     Raises
     ------
     ClientResolutionError
         Raised if client resolution fails.
     """
-    client = _resolve_client(client, submissions)
-
-    if retry_strategy is None:
-        if client.retry_strategy is None:
-            retry_strategy = RegularPeriodRetry()
-        else:
-            retry_strategy = client.retry_strategy
-
-    if isinstance(submissions, Submission):
-        submissions_list = [submissions]
-    else:
-        submissions_list = submissions
-
-    submissions_to_check = {
-        submission.token: submission for submission in submissions_list
-    }
-
-    while len(submissions_to_check) > 0 and not retry_strategy.is_done():
-        get_submissions(client=client, submissions=list(submissions_to_check.values()))
-        finished_submissions = [
-            token
-            for token, submission in submissions_to_check.items()
-            if submission.is_done()
+    submissions_to_poll = submissions
+    if callback_receiver is not None:
+        # Callbacks of submissions with another callback URL never reach the
+        # receiver, so those are polled for right away.
+        submissions_list = _as_submissions_list(submissions)
+        callback_url = callback_receiver.callback_url
+        submissions_to_poll = [
+            submission
+            for submission in submissions_list
+            if submission.callback_url != callback_url
         ]
-        for token in finished_submissions:
-            submissions_to_check.pop(token)
+        submissions_to_poll.extend(
+            callback_receiver.wait(
+                [
+                    submission
+                    for submission in submissions_list
+                    if submission.callback_url == callback_url
+                ],
+                timeout=callback_timeout,
+            )
+        )
+        if len(submissions_to_poll) == 0:
+            return submissions
 
-        # Don't wait if there is no submissions to check for anymore.
-        if len(submissions_to_check) == 0:
-            break
+    if shared_poller:
+        submissions_list = _as_submissions_list(submissions_to_poll)
+        client = _resolve_client(client, submissions_list)
+        get_poller(client).wait(submissions_list, fields=fields)
+        return submissions
 
-        retry_strategy.wait()
-        retry_strategy.step()
+    for _ in as_completed(
+        client=client,
+        submissions=submissions_to_poll,
+        retry_strategy=retry_strategy,
+        fields=fields,
+        max_workers=max_workers,
+    ):
+        pass
 
     return submissions
 
@@ -297,6 +725,15 @@ def create_submissions_from_test_cases(
         return all_submissions
 
 
+def _supports_packing(client: Client) -> bool:
+    if isinstance(client, ClientPool):
+        # Members of a pool might not agree on the compile and run commands.
+        return False
+    return client.config.enable_additional_files and client.is_language_supported(
+        MULTI_FILE_LANGUAGE_ID
+    )
+
+
 def _execute(
     *,
     client: Optional[Union[Client, Flavor]] = None,
@@ -304,6 +741,18 @@ def _execute(
     source_code: Optional[str] = None,
     test_cases: Optional[Union[TestCaseType, TestCases]] = None,
     wait_for_result: bool = False,
+    max_workers: Optional[int] = None,
+    pipeline: bool = False,
+    max_in_flight: Optional[int] = None,
+    server_wait: bool = False,
+    server_wait_timeout: Optional[float] = None,
+    callback_receiver: Optional[CallbackReceiver] = None,
+    callback_timeout: Optional[float] = DEFAULT_CALLBACK_TIMEOUT_SEC,
+    shared_poller: bool = False,
+    deduplicate: bool = False,
+    result_cache: Optional[ResultCache] = None,
+    deterministic_only: bool = True,
+    pack_test_cases: bool = False,
     **kwargs,
 ) -> Union[Submission, Submissions]:
 
@@ -319,12 +768,143 @@ def _execute(
     if source_code is not None:
         submissions = Submission(source_code=source_code, **kwargs)
 
+    if pack_test_cases and not wait_for_result:
+        raise ValueError(
+            "Packed test cases can only be unpacked when waiting for the result."
+        )
+
+    if callback_receiver is not None and (
+        pipeline or max_in_flight is not None or server_wait
+    ):
+        raise ValueError(
+            "Callback receiver cannot be combined with pipelined execution or "
+            "server-side wait."
+        )
+
     client = _resolve_client(client=client, submissions=submissions)
     all_submissions = create_submissions_from_test_cases(submissions, test_cases)
-    all_submissions = create_submissions(client=client, submissions=all_submissions)
+
+    # Results are cached only when waiting for them, as otherwise the caller
+    # expects created submissions rather than finished ones.
+    if result_cache is not None and wait_for_result:
+        submissions_list = _as_submissions_list(all_submissions)
+        missed = []
+        for submission in submissions_list:
+            key = result_cache.key(client, submission)
+            if not result_cache.load(key, submission):
+                missed.append((submission, key))
+        if not missed:
+            return all_submissions
+
+        missed_submissions = [submission for submission, _ in missed]
+        results = _execute(
+            client=client,
+            submissions=(
+                missed_submissions[0]
+                if isinstance(all_submissions, Submission)
+                else missed_submissions
+            ),
+            wait_for_result=wait_for_result,
+            max_workers=max_workers,
+            pipeline=pipeline,
+            max_in_flight=max_in_flight,
+            server_wait=server_wait,
+            server_wait_timeout=server_wait_timeout,
+            callback_receiver=callback_receiver,
+            callback_timeout=callback_timeout,
+            shared_poller=shared_poller,
+            deduplicate=deduplicate,
+            pack_test_cases=pack_test_cases,
+        )
+        for (submission, key), result in zip(missed, _as_submissions_list(results)):
+            _copy_result(result, submission)
+            if result_cache.is_cacheable(submission, deterministic_only):
+                result_cache.store(key, submission)
+        return all_submissions
+
+    if deduplicate and not isinstance(all_submissions, Submission):
+        groups = _group_identical(client, all_submissions)
+        results = _execute(
+            client=client,
+            submissions=[group[0] for group in groups],
+            wait_for_result=wait_for_result,
+            max_workers=max_workers,
+            pipeline=pipeline,
+            max_in_flight=max_in_flight,
+            callback_receiver=callback_receiver,
+            callback_timeout=callback_timeout,
+            shared_poller=shared_poller,
+            pack_test_cases=pack_test_cases,
+        )
+        for group, result in zip(groups, results):
+            for submission in group:
+                _copy_result(result, submission)
+        return all_submissions
+
+    if (
+        pack_test_cases
+        and not isinstance(all_submissions, Submission)
+        and _supports_packing(client)
+    ):
+        groups = [
+            chunk
+            for group in group_by_program(client, all_submissions)
+            for chunk in split_by_time_limits(client, group)
+        ]
+        results = _execute(
+            client=client,
+            submissions=[
+                pack_submissions(client, group) if len(group) > 1 else group[0]
+                for group in groups
+            ],
+            wait_for_result=wait_for_result,
+            max_workers=max_workers,
+            pipeline=pipeline,
+            max_in_flight=max_in_flight,
+            callback_receiver=callback_receiver,
+            callback_timeout=callback_timeout,
+            shared_poller=shared_poller,
+        )
+        for group, result in zip(groups, results):
+            if len(group) > 1:
+                unpack_submissions(result, group)
+            else:
+                _copy_result(result, group[0])
+        return all_submissions
+
+    if callback_receiver is not None:
+        for submission in _as_submissions_list(all_submissions):
+            if submission.callback_url is None:
+                submission.callback_url = callback_receiver.callback_url
+
+    if (
+        wait_for_result
+        and (pipeline or max_in_flight is not None)
+        and not isinstance(all_submissions, Submission)
+    ):
+        return _create_and_wait(
+            client,
+            all_submissions,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+
+    if wait_for_result and server_wait and isinstance(all_submissions, Submission):
+        return _create_with_server_wait(client, all_submissions, server_wait_timeout)
+
+    all_submissions = create_submissions(
+        client=client, submissions=all_submissions, max_workers=max_workers
+    )
 
     if wait_for_result:
-        return wait(client=client, submissions=all_submissions)
+        return wait(
+            client=client,
+            submissions=all_submissions,
+            max_workers=max_workers,
+            callback_receiver=callback_receiver,
+            callback_timeout=callback_timeout,
+            shared_poller=shared_poller,
+        )
     else:
         return all_submissions
 
@@ -335,6 +915,7 @@ def async_execute(
     submissions: Optional[Union[Submission, Submissions]] = None,
     source_code: Optional[str] = None,
     test_cases: Optional[Union[TestCaseType, TestCases]] = None,
+    max_workers: Optional[int] = None,
     **kwargs,
 ) -> Union[Submission, Submissions]:
     """Create submission(s).
@@ -352,6 +933,8 @@ def async_execute(
         A source code of a program.
     test_cases: TestCaseType or TestCases, optional
         A single test or a list of test cases
+    max_workers : int, optional
+        Maximum number of batches of submissions sent concurrently.
 
     Returns
     -------
@@ -373,6 +956,7 @@ def async_execute(
         source_code=source_code,
         test_cases=test_cases,
         wait_for_result=False,
+        max_workers=max_workers,
         **kwargs,
     )
 
@@ -383,6 +967,18 @@ def sync_execute(
     submissions: Optional[Union[Submission, Submissions]] = None,
     source_code: Optional[str] = None,
     test_cases: Optional[Union[TestCaseType, TestCases]] = None,
+    max_workers: Optional[int] = None,
+    pipeline: bool = False,
+    max_in_flight: Optional[int] = None,
+    server_wait: bool = False,
+    server_wait_timeout: Optional[float] = None,
+    callback_receiver: Optional[CallbackReceiver] = None,
+    callback_timeout: Optional[float] = DEFAULT_CALLBACK_TIMEOUT_SEC,
+    shared_poller: bool = False,
+    deduplicate: bool = False,
+    result_cache: Optional[ResultCache] = None,
+    deterministic_only: bool = True,
+    pack_test_cases: bool = False,
     **kwargs,
 ) -> Union[Submission, Submissions]:
     """Create submission(s) and wait for their finish.
@@ -400,6 +996,59 @@ def sync_execute(
         A source code of a program.
     test_cases: TestCaseType or TestCases, optional
         A single test or a list of test cases
+    max_workers : int, optional
+        Maximum number of batches of submissions sent concurrently.
+    pipeline : bool, optional
+        If True, polling for the created batches of submissions starts right
+        away and overlaps with the creation of the following batches, so the
+        first results are available sooner. Batches are admitted only while
+        the number of unfinished submissions fits into the client's
+        `max_queue_size`.
+    max_in_flight : int, optional
+        Maximum number of created but unfinished submissions of a pipelined
+        execution. Implies `pipeline`. Defaults to the client's
+        `max_queue_size`.
+    server_wait : bool, optional
+        If True, a single submission is created with a request the server
+        responds to once the submission is done, which saves the polling
+        round trips, provided the client's config enables waiting for the
+        result. Falls back to polling otherwise.
+    server_wait_timeout : float, optional
+        Time to wait for the server's response, in seconds. Defaults to the
+        wall time limit of all runs of the submission plus a margin for
+        queueing. A submission whose response times out is not created again,
+        as the server already runs it, and the timeout error is raised.
+    callback_receiver : CallbackReceiver, optional
+        Receiver whose callback URL is set on the submissions without one, so
+        their results are received instead of polled for. Cannot be combined
+        with `pipeline` or `server_wait`.
+    callback_timeout : float, optional
+        Time to wait for the callbacks, in seconds, before polling for the
+        remaining submissions.
+    shared_poller : bool, optional
+        If True, the submissions are polled by the client's background poller
+        together with the submissions of all other threads. Not used by
+        pipelined execution.
+    deduplicate : bool, optional
+        If True, submissions with identical request bodies, e.g. repeated
+        runs of the same program on the same input, are executed once and
+        their result is copied to the duplicates.
+    result_cache : ResultCache, optional
+        Cache of results of earlier runs. Submissions whose result is cached
+        are not executed again, and the results of the executed submissions
+        are stored in the cache.
+    deterministic_only : bool, optional
+        If True, results that might differ between runs, i.e. time limit
+        exceeded, internal errors and runs with network access, are not
+        stored in the result cache. Set to False to cache every result.
+    pack_test_cases : bool, optional
+        If True, the test cases of every program are packed into a single
+        multi-file submission, so the program is compiled once and run on all
+        test cases, see :func:`judge0.packing.pack_submissions`. The limits
+        of the submission apply to all its test cases together, and the time
+        of a test case is its wall time. Falls back to a submission per test
+        case if the client does not support multi-file programs. Requires
+        waiting for the result.
 
     Returns
     -------
@@ -414,6 +1063,8 @@ def sync_execute(
         If client cannot be resolved from the submissions or the flavor.
     ValueError
         If both or neither submissions and source_code arguments are provided.
+    SubmissionBatchError
+        If creation of some of the batches of submissions failed.
     """
     return _execute(
         client=client,
@@ -421,6 +1072,18 @@ def sync_execute(
         source_code=source_code,
         wait_for_result=True,
         test_cases=test_cases,
+        max_workers=max_workers,
+        pipeline=pipeline,
+        max_in_flight=max_in_flight,
+        server_wait=server_wait,
+        server_wait_timeout=server_wait_timeout,
+        callback_receiver=callback_receiver,
+        callback_timeout=callback_timeout,
+        shared_poller=shared_poller,
+        deduplicate=deduplicate,
+        result_cache=result_cache,
+        deterministic_only=deterministic_only,
+        pack_test_cases=pack_test_cases,
         **kwargs,
     )
 
@@ -0,0 +1,577 @@
+import asyncio
+
+from typing import ClassVar, Optional, Union
+
+from .base_types import Config, Iterable, Language
+from .cache import MetadataCache
+from .circuit import CircuitBreaker
+from .clients import (
+    _BaseClient,
+    _RequestRetries,
+    ATD,
+    ATDJudge0CE,
+    ATDJudge0ExtraCE,
+    RapidJudge0CE,
+    RapidJudge0ExtraCE,
+    SuluJudge0CE,
+    SuluJudge0ExtraCE,
+)
+from .ratelimit import RateLimiter
+from .registry import LanguageType
+from .retry import RequestRetryPolicy, RetryStrategy
+from .submission import Submission, Submissions
+from .utils import handle_too_many_requests_error_for_async_preview_client
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_IDLE_TIMEOUT = 5.0
+
+
+class AsyncClient(_BaseClient):
+    """Asynchronous counterpart of :class:`judge0.clients.Client`.
+
+    All network calls are awaitable and share a single ``httpx.AsyncClient``
+    connection pool, so many submissions can be driven from one event loop.
+    Client metadata (languages, config and version) is fetched concurrently
+    on first use or explicitly with :meth:`bootstrap`, unless it is found in
+    the metadata cache. The client can be used as an async context manager,
+    which bootstraps it on enter and closes the underlying connections on
+    exit.
+
+    Requires the optional ``httpx`` dependency (``pip install judge0[async]``).
+
+    Parameters
+    ----------
+    endpoint : str
+        Base URL of the Judge0 API.
+    auth_headers : dict, optional
+        Headers used to authenticate requests.
+    retry_strategy : RetryStrategy, optional
+        Default retry strategy used while waiting for submissions.
+    metadata_cache : MetadataCache, optional
+        Cache of the languages, config info and version of the client.
+    timeout : float or tuple of float, optional
+        Timeout of every request, in seconds, as a single value or a
+        (connect timeout, read timeout) pair. By default, requests never time
+        out.
+    max_connections : int, optional
+        Maximum number of concurrent connections. None means no limit.
+    max_keepalive_connections : int, optional
+        Maximum number of idle connections kept alive. None means no limit.
+    keep_alive : bool, optional
+        If False, connections are closed after every request.
+    idle_timeout : float, optional
+        Close pooled connections that were idle for longer than this many
+        seconds.
+    rate_limiter : RateLimiter, optional
+        Limiter that paces the client's requests and retries requests rejected
+        with status 429 (Too Many Requests).
+    request_retry : RequestRetryPolicy, optional
+        Policy for retrying requests that failed with a transient error.
+    circuit_breaker : CircuitBreaker, optional
+        Circuit breaker that rejects requests while the endpoint is failing.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        auth_headers,
+        *,
+        retry_strategy: Optional[RetryStrategy] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        timeout: Optional[Union[float, tuple[float, float]]] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keep_alive: bool = True,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_retry: Optional[RequestRetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                f"{type(self).__name__} requires httpx. Install it with "
+                "`pip install judge0[async]`."
+            ) from e
+
+        super().__init__(
+            endpoint,
+            auth_headers,
+            retry_strategy=retry_strategy,
+            metadata_cache=metadata_cache,
+            rate_limiter=rate_limiter,
+            request_retry=request_retry,
+            circuit_breaker=circuit_breaker,
+        )
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        else:
+            timeout = httpx.Timeout(timeout)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections if keep_alive else 0,
+            keepalive_expiry=idle_timeout,
+        )
+        self.session = httpx.AsyncClient(timeout=timeout, limits=limits)
+
+        self._bootstrap_lock = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.bootstrap()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def _request(self, method: str, path: str, *, route: str, **kwargs):
+        """Send a request to the client's endpoint.
+
+        Applies the client's headers and raises an HTTPStatusError for error
+        responses. The route names the API operation, see
+        :meth:`judge0.clients.Client._request`. Rate limiting and request
+        retries are applied as in the synchronous client.
+        """
+        import httpx
+
+        retries = _RequestRetries()
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.async_acquire()
+            start_time = self._before_request()
+            try:
+                response = await self.session.request(
+                    method,
+                    f"{self.endpoint}{path}",
+                    headers=self._get_request_headers(route),
+                    **kwargs,
+                )
+            except httpx.TransportError as e:
+                connected = not isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+                )
+                delay = self._get_error_retry_delay(
+                    method, start_time, retries, connected=connected
+                )
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except httpx.HTTPError:
+                self._record_outcome(False, start_time)
+                raise
+            except BaseException:
+                self._release_circuit()
+                raise
+
+            delay = self._get_response_retry_delay(
+                method, response, start_time, retries
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return response
+
+    async def bootstrap(self) -> None:
+        """Concurrently fetch languages, config info and version of the client.
+
+        Does nothing if the client is already bootstrapped.
+        """
+        if self.is_bootstrapped:
+            return
+
+        # The lock has to be created inside of a running event loop.
+        if self._bootstrap_lock is None:
+            self._bootstrap_lock = asyncio.Lock()
+
+        async with self._bootstrap_lock:
+            if self.is_bootstrapped:
+                return
+
+            metadata, missing_names = self._load_cached_metadata()
+            try:
+                values = await asyncio.gather(
+                    *(self._fetch_metadata(name) for name in missing_names)
+                )
+            except Exception as e:
+                raise self._authentication_error() from e
+
+            self._set_metadata(metadata, dict(zip(missing_names, values)))
+
+    async def _fetch_metadata(self, name: str):
+        getter = getattr(self, self._get_metadata_getter(name))
+        return self._dump_metadata(name, await getter())
+
+    def _ensure_bootstrapped(self) -> None:
+        if not self.is_bootstrapped:
+            raise RuntimeError(
+                f"Client {type(self).__name__} is not bootstrapped. Await "
+                "bootstrap() or use the client as an async context manager."
+            )
+
+    def invalidate_metadata(self) -> None:
+        """Drop the loaded and cached metadata, so it is fetched again on next
+        use.
+        """
+        self._clear_metadata()
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_about(self) -> dict:
+        response = await self._request("GET", "/about", route="about")
+        return response.json()
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_config_info(self) -> Config:
+        response = await self._request("GET", "/config_info", route="config_info")
+        return Config(**response.json())
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_language(self, language_id: int) -> Language:
+        response = await self._request(
+            "GET", f"/languages/{language_id}", route="language"
+        )
+        return Language(**response.json())
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_languages(self) -> list[Language]:
+        response = await self._request("GET", "/languages", route="languages")
+        return [Language(**lang_dict) for lang_dict in response.json()]
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_statuses(self) -> list[dict]:
+        response = await self._request("GET", "/statuses", route="statuses")
+        return response.json()
+
+    async def is_language_supported(self, language: LanguageType) -> bool:
+        """Check if language is supported by the client."""
+        await self.bootstrap()
+        return self.language_registry.is_supported(language)
+
+    async def get_unsupported_languages(
+        self, languages: Iterable[LanguageType]
+    ) -> list[LanguageType]:
+        """Get the languages that are not supported by the client."""
+        await self.bootstrap()
+        return self.language_registry.unsupported(languages)
+
+    def _get_wait_timeout(self, wait_timeout: float):
+        import httpx
+
+        return httpx.Timeout(
+            None, connect=self.session.timeout.connect, read=wait_timeout
+        )
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def create_submission(
+        self,
+        submission: Submission,
+        *,
+        wait: bool = False,
+        wait_timeout: Optional[float] = None,
+    ) -> Submission:
+        """Send submission for execution to a client.
+
+        Parameters
+        ----------
+        submission : Submission
+            A submission to create.
+        wait : bool, optional
+            If True and the client's config enables waiting for the result,
+            the server responds only after the submission is done. See
+            :meth:`judge0.clients.Client.create_submission`.
+        wait_timeout : float, optional
+            Read timeout of a waiting request, in seconds. Defaults to the
+            client's timeout.
+
+        Returns
+        -------
+        Submission
+            A submission with updated token attribute and, if the server
+            waited for it, the attributes of the finished submission.
+        """
+        await self.bootstrap()
+        response = await self._request(
+            **self._create_submission_request(submission, wait, wait_timeout)
+        )
+
+        submission.set_attributes(response.json())
+
+        return submission
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_submission(
+        self,
+        submission: Submission,
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Submission:
+        """Get submissions status.
+
+        Parameters
+        ----------
+        submission : Submission
+            Submission to update.
+
+        Returns
+        -------
+        Submission
+            A Submission with updated attributes.
+        """
+        response = await self._request(
+            **self._get_submission_request(submission, fields)
+        )
+
+        submission.set_attributes(response.json())
+
+        return submission
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def create_submissions(self, submissions: Submissions) -> Submissions:
+        """Send submissions for execution to a client.
+
+        Cannot handle more submissions than the client supports.
+
+        Parameters
+        ----------
+        submissions : Submissions
+            A sequence of submissions to create.
+
+        Returns
+        -------
+        Submissions
+            A sequence of submissions with updated token attribute.
+        """
+        await self.bootstrap()
+        response = await self._request(**self._create_submissions_request(submissions))
+
+        for submission, attrs in zip(submissions, response.json()):
+            submission.set_attributes(attrs)
+
+        return submissions
+
+    @handle_too_many_requests_error_for_async_preview_client
+    async def get_submissions(
+        self,
+        submissions: Submissions,
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Submissions:
+        """Get submissions status.
+
+        Cannot handle more submissions than the client supports.
+
+        Parameters
+        ----------
+        submissions : Submissions
+            Submissions to update.
+
+        Returns
+        -------
+        Submissions
+            A sequence of submissions with updated attributes.
+        """
+        response = await self._request(
+            **self._get_submissions_request(submissions, fields)
+        )
+
+        for submission, attrs in zip(submissions, response.json()["submissions"]):
+            submission.set_attributes(attrs)
+
+        return submissions
+
+
+class AsyncATD(AsyncClient):
+    """Base class for all asynchronous AllThingsDev clients."""
+
+    API_KEY_ENV: ClassVar[str] = "JUDGE0_ATD_API_KEY"
+
+    def __init__(self, endpoint, host_header_value, api_key, **kwargs):
+        self.api_key = api_key
+        super().__init__(
+            endpoint,
+            {
+                "x-apihub-host": host_header_value,
+                "x-apihub-key": api_key,
+            },
+            **kwargs,
+        )
+
+    _get_request_headers = ATD._get_request_headers
+
+
+class AsyncATDJudge0CE(AsyncATD):
+    """Asynchronous AllThingsDev client for CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = ATDJudge0CE.DEFAULT_ENDPOINT
+    DEFAULT_HOST: ClassVar[str] = ATDJudge0CE.DEFAULT_HOST
+    HOME_URL: ClassVar[str] = ATDJudge0CE.HOME_URL
+
+    DEFAULT_ABOUT_ENDPOINT: ClassVar[str] = ATDJudge0CE.DEFAULT_ABOUT_ENDPOINT
+    DEFAULT_CONFIG_INFO_ENDPOINT: ClassVar[str] = (
+        ATDJudge0CE.DEFAULT_CONFIG_INFO_ENDPOINT
+    )
+    DEFAULT_LANGUAGE_ENDPOINT: ClassVar[str] = ATDJudge0CE.DEFAULT_LANGUAGE_ENDPOINT
+    DEFAULT_LANGUAGES_ENDPOINT: ClassVar[str] = ATDJudge0CE.DEFAULT_LANGUAGES_ENDPOINT
+    DEFAULT_STATUSES_ENDPOINT: ClassVar[str] = ATDJudge0CE.DEFAULT_STATUSES_ENDPOINT
+    DEFAULT_CREATE_SUBMISSION_ENDPOINT: ClassVar[str] = (
+        ATDJudge0CE.DEFAULT_CREATE_SUBMISSION_ENDPOINT
+    )
+    DEFAULT_GET_SUBMISSION_ENDPOINT: ClassVar[str] = (
+        ATDJudge0CE.DEFAULT_GET_SUBMISSION_ENDPOINT
+    )
+    DEFAULT_CREATE_SUBMISSIONS_ENDPOINT: ClassVar[str] = (
+        ATDJudge0CE.DEFAULT_CREATE_SUBMISSIONS_ENDPOINT
+    )
+    DEFAULT_GET_SUBMISSIONS_ENDPOINT: ClassVar[str] = (
+        ATDJudge0CE.DEFAULT_GET_SUBMISSIONS_ENDPOINT
+    )
+
+    def __init__(self, api_key, **kwargs):
+        super().__init__(
+            self.DEFAULT_ENDPOINT,
+            self.DEFAULT_HOST,
+            api_key,
+            **kwargs,
+        )
+
+
+class AsyncATDJudge0ExtraCE(AsyncATD):
+    """Asynchronous AllThingsDev client for Extra CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = ATDJudge0ExtraCE.DEFAULT_ENDPOINT
+    DEFAULT_HOST: ClassVar[str] = ATDJudge0ExtraCE.DEFAULT_HOST
+    HOME_URL: ClassVar[str] = ATDJudge0ExtraCE.HOME_URL
+
+    DEFAULT_ABOUT_ENDPOINT: ClassVar[str] = ATDJudge0ExtraCE.DEFAULT_ABOUT_ENDPOINT
+    DEFAULT_CONFIG_INFO_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_CONFIG_INFO_ENDPOINT
+    )
+    DEFAULT_LANGUAGE_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_LANGUAGE_ENDPOINT
+    )
+    DEFAULT_LANGUAGES_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_LANGUAGES_ENDPOINT
+    )
+    DEFAULT_STATUSES_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_STATUSES_ENDPOINT
+    )
+    DEFAULT_CREATE_SUBMISSION_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_CREATE_SUBMISSION_ENDPOINT
+    )
+    DEFAULT_GET_SUBMISSION_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_GET_SUBMISSION_ENDPOINT
+    )
+    DEFAULT_CREATE_SUBMISSIONS_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_CREATE_SUBMISSIONS_ENDPOINT
+    )
+    DEFAULT_GET_SUBMISSIONS_ENDPOINT: ClassVar[str] = (
+        ATDJudge0ExtraCE.DEFAULT_GET_SUBMISSIONS_ENDPOINT
+    )
+
+    def __init__(self, api_key, **kwargs):
+        super().__init__(
+            self.DEFAULT_ENDPOINT,
+            self.DEFAULT_HOST,
+            api_key,
+            **kwargs,
+        )
+
+
+class AsyncRapid(AsyncClient):
+    """Base class for all asynchronous RapidAPI clients."""
+
+    API_KEY_ENV: ClassVar[str] = "JUDGE0_RAPID_API_KEY"
+
+    def __init__(self, endpoint, host_header_value, api_key, **kwargs):
+        self.api_key = api_key
+        super().__init__(
+            endpoint,
+            {
+                "x-rapidapi-host": host_header_value,
+                "x-rapidapi-key": api_key,
+            },
+            **kwargs,
+        )
+
+
+class AsyncRapidJudge0CE(AsyncRapid):
+    """Asynchronous RapidAPI client for CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = RapidJudge0CE.DEFAULT_ENDPOINT
+    DEFAULT_HOST: ClassVar[str] = RapidJudge0CE.DEFAULT_HOST
+    HOME_URL: ClassVar[str] = RapidJudge0CE.HOME_URL
+
+    def __init__(self, api_key, **kwargs):
+        super().__init__(
+            self.DEFAULT_ENDPOINT,
+            self.DEFAULT_HOST,
+            api_key,
+            **kwargs,
+        )
+
+
+class AsyncRapidJudge0ExtraCE(AsyncRapid):
+    """Asynchronous RapidAPI client for Extra CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = RapidJudge0ExtraCE.DEFAULT_ENDPOINT
+    DEFAULT_HOST: ClassVar[str] = RapidJudge0ExtraCE.DEFAULT_HOST
+    HOME_URL: ClassVar[str] = RapidJudge0ExtraCE.HOME_URL
+
+    def __init__(self, api_key, **kwargs):
+        super().__init__(
+            self.DEFAULT_ENDPOINT,
+            self.DEFAULT_HOST,
+            api_key,
+            **kwargs,
+        )
+
+
+class AsyncSulu(AsyncClient):
+    """Base class for all asynchronous Sulu clients."""
+
+    API_KEY_ENV: ClassVar[str] = "JUDGE0_SULU_API_KEY"
+
+    def __init__(self, endpoint, api_key=None, **kwargs):
+        self.api_key = api_key
+        super().__init__(
+            endpoint,
+            {"Authorization": f"Bearer {api_key}"} if api_key else None,
+            **kwargs,
+        )
+
+
+class AsyncSuluJudge0CE(AsyncSulu):
+    """Asynchronous Sulu client for CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = SuluJudge0CE.DEFAULT_ENDPOINT
+    HOME_URL: ClassVar[str] = SuluJudge0CE.HOME_URL
+
+    def __init__(self, api_key=None, **kwargs):
+        super().__init__(
+            self.DEFAULT_ENDPOINT,
+            api_key,
+            **kwargs,
+        )
+
+
+class AsyncSuluJudge0ExtraCE(AsyncSulu):
+    """Asynchronous Sulu client for Extra CE flavor."""
+
+    DEFAULT_ENDPOINT: ClassVar[str] = SuluJudge0ExtraCE.DEFAULT_ENDPOINT
+    HOME_URL: ClassVar[str] = SuluJudge0ExtraCE.HOME_URL
+
+    def __init__(self, api_key=None, **kwargs):
+        super().__init__(self.DEFAULT_ENDPOINT, api_key, **kwargs)
+
+
+CE = (AsyncRapidJudge0CE, AsyncSuluJudge0CE, AsyncATDJudge0CE)
+EXTRA_CE = (AsyncRapidJudge0ExtraCE, AsyncSuluJudge0ExtraCE, AsyncATDJudge0ExtraCE)
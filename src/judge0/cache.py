@@ -0,0 +1,399 @@
+"""Persistent caches used by Judge0 clients."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, TYPE_CHECKING, Union
+
+from .base_types import Status
+from .common import encode
+from .submission import (
+    DATETIME_FIELDS,
+    ENCODED_RESPONSE_FIELDS,
+    RESPONSE_FIELDS,
+    Submission,
+)
+
+if TYPE_CHECKING:
+    from .clients import Client
+
+# Names of the metadata endpoints that are cached, i.e. /languages,
+# /config_info and /about.
+METADATA_NAMES = ("languages", "config_info", "about")
+
+DEFAULT_METADATA_TTL_SEC = 24 * 60 * 60
+
+DEFAULT_RESULT_TTL_SEC = 7 * 24 * 60 * 60
+DEFAULT_RESULT_MAX_ENTRIES = 100_000
+
+# Results that depend on the load of the server rather than on the program.
+NONDETERMINISTIC_STATUSES = (Status.TIME_LIMIT_EXCEEDED, Status.INTERNAL_ERROR)
+
+# Request fields that do not affect the result of a submission.
+_NON_RESULT_REQUEST_FIELDS = ("callback_url",)
+
+# Cached response fields. Tokens are left out, as they name a submission of
+# the original run.
+_CACHED_RESPONSE_FIELDS = (RESPONSE_FIELDS - {"token"}) | {"post_execution_filesystem"}
+
+
+def get_default_cache_directory() -> Path:
+    """Get the default cache directory.
+
+    Uses `JUDGE0_CACHE_DIR` environment variable if set, otherwise
+    `$XDG_CACHE_HOME/judge0` (defaulting to `~/.cache/judge0`).
+    """
+    cache_dir = os.getenv("JUDGE0_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "judge0"
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            fp.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class MetadataCache:
+    """On-disk cache of client metadata.
+
+    Stores the responses of the /languages, /config_info and /about endpoints
+    per client endpoint, so that short-lived processes do not have to fetch
+    them on every start. Entries older than `ttl_sec` seconds are ignored.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Cache directory. Defaults to :func:`get_default_cache_directory`.
+    ttl_sec : float, optional
+        Time to live of cache entries, in seconds. Defaults to one day.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        ttl_sec: float = DEFAULT_METADATA_TTL_SEC,
+    ):
+        if directory is None:
+            directory = get_default_cache_directory()
+        self.directory = Path(directory) / "metadata"
+        self.ttl_sec = ttl_sec
+
+    def _path(self, endpoint: str, name: str) -> Path:
+        endpoint_hash = hashlib.sha256(endpoint.encode()).hexdigest()[:16]
+        return self.directory / f"{endpoint_hash}-{name}.json"
+
+    def get(self, endpoint: str, name: str) -> Optional[Any]:
+        """Get the cached response of the endpoint's metadata, if fresh."""
+        try:
+            entry = json.loads(self._path(endpoint, name).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("endpoint") != endpoint:
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.ttl_sec:
+            return None
+        return entry.get("value")
+
+    def set(self, endpoint: str, name: str, value: Any) -> None:
+        """Store the response of the endpoint's metadata."""
+        entry = {"endpoint": endpoint, "stored_at": time.time(), "value": value}
+        try:
+            _atomic_write_text(self._path(endpoint, name), json.dumps(entry))
+        except OSError:
+            # Caching is best effort, e.g. the directory might be read-only.
+            pass
+
+    def invalidate(
+        self, endpoint: Optional[str] = None, name: Optional[str] = None
+    ) -> None:
+        """Remove cache entries.
+
+        Parameters
+        ----------
+        endpoint : str, optional
+            Remove only the entries of this endpoint. Defaults to all endpoints.
+        name : str, optional
+            Remove only the entries of this metadata (one of "languages",
+            "config_info" or "about"). Defaults to all metadata.
+        """
+        if endpoint is not None:
+            names = METADATA_NAMES if name is None else (name,)
+            paths = [self._path(endpoint, n) for n in names]
+        else:
+            pattern = "*.json" if name is None else f"*-{name}.json"
+            paths = self.directory.glob(pattern)
+
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def load(self, endpoint: str) -> dict[str, Any]:
+        """Get all fresh cached metadata of the endpoint."""
+        metadata = {}
+        for name in METADATA_NAMES:
+            value = self.get(endpoint, name)
+            if value is not None:
+                metadata[name] = value
+        return metadata
+
+    def store(self, endpoint: str, metadata: dict[str, Any]) -> None:
+        """Store all metadata of the endpoint."""
+        for name, value in metadata.items():
+            self.set(endpoint, name, value)
+
+
+class ResultCache:
+    """Persistent cache of the results of finished submissions.
+
+    Results are stored in an SQLite database and keyed by a hash of the
+    submission's request fields, the language id resolved by the client and
+    the client's Judge0 version, so a cached result is used only for exactly
+    the same program, input and limits. Entries older than `ttl_sec` seconds
+    are ignored, and the least recently used entries are evicted once there
+    are more than `max_entries` of them.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Cache directory. Defaults to :func:`get_default_cache_directory`.
+    ttl_sec : float, optional
+        Time to live of cache entries, in seconds. Defaults to one week.
+    max_entries : int, optional
+        Maximum number of cached results.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        *,
+        ttl_sec: float = DEFAULT_RESULT_TTL_SEC,
+        max_entries: int = DEFAULT_RESULT_MAX_ENTRIES,
+    ):
+        if directory is None:
+            directory = get_default_cache_directory()
+        self.directory = Path(directory)
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._init_storage()
+
+    def key(self, client: "Client", submission: Submission) -> str:
+        """Get the cache key of the submission's result on the client."""
+        body = submission.as_body(client)
+        for field in _NON_RESULT_REQUEST_FIELDS:
+            body.pop(field, None)
+        content = json.dumps({"body": body, "version": client.version}, sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    def is_cacheable(submission: Submission, deterministic_only: bool = True) -> bool:
+        """Check if the result of the submission can be cached.
+
+        Only finished submissions are cached. If `deterministic_only` is True,
+        submissions with network access and results that depend on the load
+        of the server, i.e. time limit exceeded and internal errors, are not.
+        """
+        if not submission.is_done():
+            return False
+        if not deterministic_only:
+            return True
+        return (
+            submission.status not in NONDETERMINISTIC_STATUSES
+            and not submission.enable_network
+        )
+
+    def load(self, key: str, submission: Submission) -> bool:
+        """Set the cached result on the submission.
+
+        Returns
+        -------
+        bool
+            True if the result was cached, False otherwise.
+        """
+        try:
+            value = self._get_value(key)
+        except (OSError, sqlite3.Error, ValueError):
+            return False
+        if value is None:
+            return False
+        submission.set_attributes(json.loads(value))
+        return True
+
+    def store(self, key: str, submission: Submission) -> None:
+        """Store the result of the finished submission.
+
+        Storing is best effort, errors of the storage are ignored.
+        """
+        result = {}
+        for field in _CACHED_RESPONSE_FIELDS:
+            value = getattr(submission, field)
+            if value is None:
+                continue
+            if field in ENCODED_RESPONSE_FIELDS or field == "post_execution_filesystem":
+                value = encode(value)
+            elif field == "status":
+                value = {"id": value.value}
+            elif field in DATETIME_FIELDS:
+                value = value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            result[field] = value
+
+        try:
+            self._set_value(key, json.dumps(result))
+        except (OSError, sqlite3.Error):
+            pass
+
+    def _init_storage(self) -> None:
+        self.path = self.directory / "results.sqlite3"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation, so the cache can be shared by threads
+        # and processes. Changes are committed when the block exits.
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                yield connection
+
+    def _get_value(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM results WHERE key = ? AND stored_at >= ?",
+                (key, now - self.ttl_sec),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE results SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return row[0]
+
+    def _set_value(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            connection.execute(
+                "DELETE FROM results WHERE stored_at < ?", (now - self.ttl_sec,)
+            )
+            connection.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results "
+                "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+
+
+def _get_mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+class DirectoryResultCache(ResultCache):
+    """Persistent cache of the results of finished submissions, stored as one
+    file per result.
+
+    Works like :class:`ResultCache`, but does not depend on SQLite, e.g. for
+    network file systems where SQLite locking is unreliable. The entries are
+    counted as they are stored, and once there are more than `max_entries`,
+    the least recently used tenth of them is evicted at once, so the
+    directory is scanned only every so many stores. Entries stored by other
+    processes are only counted at the next scan.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Cache directory. Defaults to :func:`get_default_cache_directory`.
+    ttl_sec : float, optional
+        Time to live of cache entries, in seconds. Defaults to one week.
+    max_entries : int, optional
+        Maximum number of cached results.
+    """
+
+    def _init_storage(self) -> None:
+        self.path = self.directory / "results"
+        self._lock = threading.Lock()
+        # Number of entries, counted by the first store.
+        self._n_entries = None
+
+    def _path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def _get_value(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+            if time.time() - entry["stored_at"] > self.ttl_sec:
+                return None
+            # The modification time orders the entries by their last use.
+            os.utime(path)
+        except (FileNotFoundError, KeyError):
+            return None
+        return entry["value"]
+
+    def _set_value(self, key: str, value: str) -> None:
+        path = self._path(key)
+        is_new = not path.exists()
+        entry = {"stored_at": time.time(), "value": value}
+        _atomic_write_text(path, json.dumps(entry))
+
+        with self._lock:
+            if self._n_entries is None:
+                self._n_entries = sum(1 for _ in self.path.glob("*.json"))
+            elif is_new:
+                self._n_entries += 1
+            if self._n_entries > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        n_kept = self.max_entries - self.max_entries // 10
+        paths = list(self.path.glob("*.json"))
+        paths.sort(key=_get_mtime)
+        for path in paths[: max(0, len(paths) - n_kept)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._n_entries = min(len(paths), n_kept)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            for path in self.path.glob("*.json"):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._n_entries = 0
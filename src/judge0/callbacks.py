@@ -0,0 +1,188 @@
+"""Local receiver of the results Judge0 sends to submission callback URLs."""
+
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .base_types import Status
+from .submission import Submission, Submissions
+
+# Maximum number of results kept for submissions nobody waits for (yet).
+DEFAULT_MAX_BUFFERED_RESULTS = 10_000
+
+DEFAULT_CALLBACK_TIMEOUT_SEC = 30.0
+
+
+class _CallbackServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Judge0 workers send the callbacks of a batch of submissions at once.
+    request_queue_size = 128
+
+
+def _make_handler(receiver: "CallbackReceiver"):
+    class CallbackHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_PUT(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                result = json.loads(self.rfile.read(length))
+                receiver._receive(result)
+            except (ValueError, TypeError, KeyError):
+                self.send_response(400)
+            else:
+                self.send_response(204)
+            self.end_headers()
+
+    return CallbackHandler
+
+
+class CallbackReceiver:
+    """HTTP server that receives the results of finished submissions.
+
+    Judge0 sends the result of a finished submission with a PUT request to the
+    submission's `callback_url`. The receiver runs a small server in a
+    background thread, and :func:`judge0.run` and :func:`judge0.wait` use it to
+    resolve submissions as soon as their results arrive, instead of polling
+    for them. Results may arrive before the request that creates the
+    submission returns its token, so they are buffered until waited for.
+
+    The receiver has to be reachable from the Judge0 server. If it runs behind
+    a proxy, a tunnel or a container network, pass the URL under which Judge0
+    reaches it as `public_url`.
+
+    Parameters
+    ----------
+    host : str, optional
+        Host the server listens on.
+    port : int, optional
+        Port the server listens on. By default, a free port is chosen.
+    public_url : str, optional
+        URL that Judge0 sends the results to. Defaults to the address the
+        server listens on.
+    max_buffered_results : int, optional
+        Maximum number of buffered results. The oldest ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        public_url: Optional[str] = None,
+        max_buffered_results: int = DEFAULT_MAX_BUFFERED_RESULTS,
+    ):
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self.max_buffered_results = max_buffered_results
+
+        self._results = OrderedDict()
+        self._condition = threading.Condition()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "CallbackReceiver":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def callback_url(self) -> str:
+        """URL to use as the `callback_url` of the submissions."""
+        if self.public_url is not None:
+            return self.public_url
+        if not self.is_running:
+            raise RuntimeError("Callback receiver is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Start the server in a background thread.
+
+        Does nothing if the server is already running.
+        """
+        if self.is_running:
+            return
+        self._server = _CallbackServer((self.host, self.port), _make_handler(self))
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="judge0-callbacks", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and drop the buffered results."""
+        if not self.is_running:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        with self._condition:
+            self._results.clear()
+
+    def _receive(self, result: dict) -> None:
+        token = str(result["token"])
+        # Intermediate results, if any, are left to the final one.
+        if Status(result["status"]["id"]) in (Status.IN_QUEUE, Status.PROCESSING):
+            return
+
+        with self._condition:
+            self._results[token] = result
+            while len(self._results) > self.max_buffered_results:
+                self._results.popitem(last=False)
+            self._condition.notify_all()
+
+    def wait(
+        self,
+        submissions: Submissions,
+        timeout: Optional[float] = DEFAULT_CALLBACK_TIMEOUT_SEC,
+    ) -> list[Submission]:
+        """Wait for the results of the submissions.
+
+        Submissions whose result arrived are updated with the attributes Judge0
+        sent, i.e. its default submission fields.
+
+        Parameters
+        ----------
+        submissions : Submissions
+            Created submissions with callback URL of the receiver.
+        timeout : float, optional
+            Maximum time to wait, in seconds. If None, wait until all results
+            arrive.
+
+        Returns
+        -------
+        list of Submission
+            Submissions whose result did not arrive in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = {str(submission.token): submission for submission in submissions}
+
+        with self._condition:
+            while True:
+                for token in [token for token in pending if token in self._results]:
+                    pending.pop(token).set_attributes(self._results.pop(token))
+                if not pending:
+                    break
+
+                remaining_time = None
+                if deadline is not None:
+                    remaining_time = deadline - time.monotonic()
+                    if remaining_time <= 0:
+                        break
+                self._condition.wait(remaining_time)
+
+        return list(pending.values())
@@ -0,0 +1,182 @@
+"""Circuit breaker that stops sending requests to a failing endpoint."""
+
+import threading
+import time
+
+from collections import deque
+from typing import Optional
+
+from .errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker of the requests of a client.
+
+    The breaker records the outcome of the last `window_size` requests. A
+    request fails if it raises a connection error, gets a server error
+    response, or takes longer than `latency_threshold_sec`. A 429 (Too Many
+    Requests) response is not a failure, since only the quota of a healthy
+    endpoint is exhausted, see :class:`judge0.RateLimiter`. Once at least
+    `min_requests` requests were recorded and the share of failed ones
+    reaches `failure_rate_threshold`, the circuit opens and requests fail
+    immediately with :class:`judge0.errors.CircuitOpenError`. After `open_duration_sec`
+    seconds the circuit is half-open: up to `half_open_max_requests` probe
+    requests are let through, and the circuit closes again if they succeed or
+    reopens if any of them fails.
+
+    Parameters
+    ----------
+    failure_rate_threshold : float, optional
+        Share of failed requests, in range (0, 1], that opens the circuit.
+    latency_threshold_sec : float, optional
+        Requests slower than this are counted as failed. By default, latency
+        is not taken into account.
+    window_size : int, optional
+        Number of the most recent requests the failure rate is computed from.
+    min_requests : int, optional
+        Minimum number of recorded requests before the circuit can open.
+    open_duration_sec : float, optional
+        Time the circuit stays open before probe requests are let through.
+    half_open_max_requests : int, optional
+        Maximum number of concurrent probe requests of a half-open circuit.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        latency_threshold_sec: Optional[float] = None,
+        window_size: int = 20,
+        min_requests: int = 5,
+        open_duration_sec: float = 30.0,
+        half_open_max_requests: int = 1,
+    ):
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError(
+                "Failure rate threshold must be in range (0, 1], "
+                f"got {failure_rate_threshold}."
+            )
+        self.failure_rate_threshold = failure_rate_threshold
+        self.latency_threshold_sec = latency_threshold_sec
+        self.window_size = window_size
+        self.min_requests = min_requests
+        self.open_duration_sec = open_duration_sec
+        self.half_open_max_requests = half_open_max_requests
+
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._n_probes = 0
+
+    def _update_state(self) -> None:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.open_duration_sec
+        ):
+            self._state = HALF_OPEN
+            self._n_probes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    @property
+    def state(self) -> str:
+        """State of the circuit, one of "closed", "open" or "half_open"."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def allows_requests(self) -> bool:
+        """Check if a request would be let through, without sending it."""
+        with self._lock:
+            self._update_state()
+            if self._state == OPEN:
+                return False
+            if self._state == HALF_OPEN:
+                return self._n_probes < self.half_open_max_requests
+            return True
+
+    def before_request(self) -> None:
+        """Register a request that is about to be sent.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open, or half-open with all probe requests
+            already in flight.
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == OPEN:
+                retry_in = self.open_duration_sec - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(
+                    f"Circuit is open after too many failed requests, requests "
+                    f"are let through again in {retry_in:.1f} seconds."
+                )
+            if self._state == HALF_OPEN:
+                if self._n_probes >= self.half_open_max_requests:
+                    raise CircuitOpenError(
+                        "Circuit is half-open and waits for the outcome of the "
+                        "probe requests."
+                    )
+                self._n_probes += 1
+
+    def record(self, success: bool, latency_sec: Optional[float] = None) -> None:
+        """Record the outcome of a request registered with
+        :meth:`before_request`.
+        """
+        if (
+            self.latency_threshold_sec is not None
+            and latency_sec is not None
+            and latency_sec > self.latency_threshold_sec
+        ):
+            success = False
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._n_probes = max(0, self._n_probes - 1)
+                if success:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open()
+                return
+            if self._state == OPEN:
+                # Outcome of a request sent before the circuit opened.
+                return
+
+            self._outcomes.append(success)
+            n_failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self.min_requests
+                and n_failures / len(self._outcomes) >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """Forget a request registered with :meth:`before_request` whose
+        outcome is unknown, e.g. because it was cancelled.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._n_probes = max(0, self._n_probes - 1)
+
+    def reset(self) -> None:
+        """Close the circuit and forget all recorded requests."""
+        with self._lock:
+            self._state = CLOSED
+            self._outcomes.clear()
+            self._n_probes = 0
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Check if a response status code signals that the endpoint is failing,
+    i.e. a server error.
+    """
+    return status_code >= 500
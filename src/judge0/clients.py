@@ -1,15 +1,52 @@
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import ClassVar, Optional, Union
 
 import requests
-
-from .base_types import Config, Iterable, Language, LanguageAlias
-from .data import LANGUAGE_TO_LANGUAGE_ID
-from .retry import RetryStrategy
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from .base_types import Config, Iterable, Language
+from .cache import METADATA_NAMES, MetadataCache
+from .circuit import CircuitBreaker, is_failure_status
+from .ratelimit import get_retry_after_sec, RateLimiter
+from .registry import LanguageRegistry, LanguageType
+from .retry import RequestRetryPolicy, RetryStrategy
 from .submission import Submission, Submissions
 from .utils import handle_too_many_requests_error_for_preview_client
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+def _is_connect_error(error: requests.RequestException) -> bool:
+    """Check if the request failed before the connection was established."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+
+class _RequestRetries:
+    """Number of times a single request was retried so far."""
+
+    def __init__(self):
+        self.n_rate_limit_retries = 0
+        self.n_retries = 0
+
+
+class _BaseClient(ABC):
+    """Functionality shared by the synchronous and asynchronous clients.
+
+    Holds the client metadata and decides about request retries, and builds
+    the requests of every endpoint. Subclasses only send the requests, either
+    blocking or awaitable, and call :meth:`_ensure_bootstrapped` before the
+    metadata is accessed.
+    """
 
-class Client:
     API_KEY_ENV: ClassVar[str] = None
 
     def __init__(
@@ -18,87 +55,576 @@ class Client:
         auth_headers,
         *,
         retry_strategy: Optional[RetryStrategy] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_retry: Optional[RequestRetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         self.endpoint = endpoint
         self.auth_headers = auth_headers
         self.retry_strategy = retry_strategy
+        self.metadata_cache = metadata_cache
+        self.rate_limiter = rate_limiter
+        self.request_retry = request_retry
+        self.circuit_breaker = circuit_breaker
+
+        self._languages = None
+        self._config = None
+        self._version = None
+        self._language_registry = None
+
+    def _get_request_headers(self, route: str) -> dict:
+        """Get the headers of a request to the given route."""
+        return self.auth_headers
+
+    def _before_request(self) -> float:
+        """Register a request with the circuit breaker and return its start
+        time.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        return time.monotonic()
+
+    def _record_outcome(self, success: bool, start_time: float) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(success, time.monotonic() - start_time)
+
+    def _release_circuit(self) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def _get_error_retry_delay(
+        self,
+        method: str,
+        start_time: float,
+        retries: _RequestRetries,
+        *,
+        connected: bool,
+    ) -> Optional[float]:
+        """Record a request that failed with a transport error.
+
+        Returns the time to wait before sending the request again, in
+        seconds, or None if the error should be raised.
+        """
+        self._record_outcome(False, start_time)
+        if (
+            self.request_retry is None
+            or retries.n_retries >= self.request_retry.max_retries
+            or not self.request_retry.is_retryable_error(method, connected=connected)
+        ):
+            return None
+        delay = self.request_retry.backoff_sec(retries.n_retries)
+        retries.n_retries += 1
+        return delay
+
+    def _get_response_retry_delay(
+        self, method: str, response, start_time: float, retries: _RequestRetries
+    ) -> Optional[float]:
+        """Record a response.
+
+        Returns the time to wait before sending the request again, in
+        seconds, or None if the response is final.
+        """
+        status_code = response.status_code
+        self._record_outcome(not is_failure_status(status_code), start_time)
+
+        if self.rate_limiter is not None and self.rate_limiter.should_retry(
+            status_code, response.headers, retries.n_rate_limit_retries
+        ):
+            # The rate limiter paces the retry on its own.
+            retries.n_rate_limit_retries += 1
+            return 0.0
+        if (
+            self.request_retry is not None
+            and retries.n_retries < self.request_retry.max_retries
+            and self.request_retry.is_retryable_status(method, status_code)
+        ):
+            delay = self.request_retry.backoff_sec(
+                retries.n_retries, get_retry_after_sec(response.headers)
+            )
+            retries.n_retries += 1
+            return delay
+        return None
+
+    def _load_cached_metadata(self) -> tuple[dict, list[str]]:
+        """Load the cached metadata and get the names of the missing ones."""
+        metadata = {}
+        if self.metadata_cache is not None:
+            metadata = self.metadata_cache.load(self.endpoint)
+        return metadata, [name for name in METADATA_NAMES if name not in metadata]
+
+    def _authentication_error(self) -> RuntimeError:
+        # Clients of self-hosted endpoints have no home page.
+        home_url = getattr(self, "HOME_URL", self.endpoint)
+        return RuntimeError(
+            f"Authentication failed. Visit {home_url} to get or review your "
+            "authentication credentials."
+        )
+
+    @staticmethod
+    def _get_metadata_getter(name: str) -> str:
+        if name not in METADATA_NAMES:
+            raise ValueError(f"Unknown metadata {name!r}.")
+        return f"get_{name}"
+
+    @staticmethod
+    def _dump_metadata(name: str, value):
+        if name == "languages":
+            return [language.model_dump() for language in value]
+        if name == "config_info":
+            return value.model_dump()
+        return value
+
+    def _set_metadata(self, metadata: dict, fetched_metadata: dict) -> None:
+        if self.metadata_cache is not None and fetched_metadata:
+            self.metadata_cache.store(self.endpoint, fetched_metadata)
+        metadata = {**metadata, **fetched_metadata}
+
+        self._languages = [Language(**lang) for lang in metadata["languages"]]
+        self._config = Config(**metadata["config_info"])
+        self._version = metadata["about"]["version"]
+
+    def _clear_metadata(self) -> None:
+        self._languages = None
+        self._config = None
+        self._version = None
+        self._language_registry = None
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.endpoint)
+
+    @abstractmethod
+    def _ensure_bootstrapped(self) -> None:
+        pass
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        return (
+            self._languages is not None
+            and self._config is not None
+            and self._version is not None
+        )
+
+    @property
+    def languages(self) -> list[Language]:
+        self._ensure_bootstrapped()
+        return self._languages
+
+    @property
+    def config(self) -> Config:
+        self._ensure_bootstrapped()
+        return self._config
+
+    @property
+    def version(self) -> str:
+        self._ensure_bootstrapped()
+        return self._version
+
+    @property
+    def language_registry(self) -> LanguageRegistry:
+        """Index of the languages supported by the client."""
+        registry = self._language_registry
+        if registry is None:
+            registry = LanguageRegistry(self.languages, self.version)
+            self._language_registry = registry
+        return registry
+
+    def get_language_id(self, language: LanguageType) -> int:
+        """Get language id corresponding to the language alias or name for the
+        client.
+        """
+        return self.language_registry.get_language_id(language)
+
+    @abstractmethod
+    def _get_wait_timeout(self, wait_timeout: float):
+        """Get the timeout of a request that waits for the result."""
+        pass
+
+    def _create_submission_request(
+        self, submission: Submission, wait: bool, wait_timeout: Optional[float]
+    ) -> dict:
+        # Check if the client supports the language specified in the submission.
+        if not self.language_registry.is_supported(submission.language):
+            raise RuntimeError(
+                f"Client {type(self).__name__} does not support language "
+                f"{submission.language!r}!"
+            )
+
+        wait = wait and self.config.enable_wait_result
+        params = {
+            "base64_encoded": "true",
+            "wait": str(wait).lower(),
+        }
+        if wait:
+            # Respond with all attributes, as they are fetched after polling.
+            params["fields"] = "*"
+        request = {
+            "method": "POST",
+            "path": "/submissions",
+            "route": "create_submission",
+            "json": submission.as_body(self),
+            "params": params,
+        }
+        if wait and wait_timeout is not None:
+            request["timeout"] = self._get_wait_timeout(wait_timeout)
+        return request
+
+    def _create_submissions_request(self, submissions: Submissions) -> dict:
+        unsupported_languages = self.language_registry.unsupported(
+            [submission.language for submission in submissions]
+        )
+        if unsupported_languages:
+            raise RuntimeError(
+                f"Client {type(self).__name__} does not support languages "
+                f"{unsupported_languages}!"
+            )
+
+        # TODO: Maybe raise an exception if the number of submissions is bigger
+        # than the batch size a client supports?
+
+        return {
+            "method": "POST",
+            "path": "/submissions/batch",
+            "route": "create_submissions",
+            "params": {"base64_encoded": "true"},
+            "json": {
+                "submissions": [submission.as_body(self) for submission in submissions]
+            },
+        }
+
+    @staticmethod
+    def _get_fields_params(fields: Optional[Union[str, Iterable[str]]]) -> dict:
+        params = {
+            "base64_encoded": "true",
+        }
+
+        if isinstance(fields, str):
+            fields = [fields]
+
+        if fields is not None:
+            params["fields"] = ",".join(fields)
+        else:
+            params["fields"] = "*"
+
+        return params
+
+    def _get_submission_request(
+        self, submission: Submission, fields: Optional[Union[str, Iterable[str]]]
+    ) -> dict:
+        return {
+            "method": "GET",
+            "path": f"/submissions/{submission.token}",
+            "route": "get_submission",
+            "params": self._get_fields_params(fields),
+        }
+
+    def _get_submissions_request(
+        self, submissions: Submissions, fields: Optional[Union[str, Iterable[str]]]
+    ) -> dict:
+        params = self._get_fields_params(fields)
+        params["tokens"] = ",".join(
+            [str(submission.token) for submission in submissions]
+        )
+        return {
+            "method": "GET",
+            "path": "/submissions/batch",
+            "route": "get_submissions",
+            "params": params,
+        }
+
+
+class Client(_BaseClient):
+    """Base class for all Judge0 clients.
+
+    Client metadata (languages, config info and version) is loaded lazily on
+    first use. All three are fetched concurrently in a single bootstrap step,
+    which can also be triggered explicitly with :meth:`bootstrap`. If a
+    metadata cache is provided, it is consulted before sending any request.
+
+    Parameters
+    ----------
+    endpoint : str
+        Base URL of the Judge0 API.
+    auth_headers : dict, optional
+        Headers used to authenticate requests.
+    retry_strategy : RetryStrategy, optional
+        Default retry strategy used while waiting for submissions.
+    metadata_cache : MetadataCache, optional
+        Cache of the languages, config info and version of the client.
+    timeout : float or tuple of float, optional
+        Timeout of every request, in seconds, as a single value or a
+        (connect timeout, read timeout) pair. By default, requests never time
+        out.
+    pool_connections : int, optional
+        Number of connection pools (one per host) to cache.
+    pool_maxsize : int, optional
+        Maximum number of connections kept alive per host. Should be at least
+        the number of threads that use the client concurrently.
+    pool_block : bool, optional
+        If True, block when all connections of a pool are in use instead of
+        opening additional, non-pooled connections.
+    keep_alive : bool, optional
+        If False, connections are closed after every request.
+    idle_timeout : float, optional
+        Close pooled connections that were idle for longer than this many
+        seconds before sending the next request.
+    prewarm_connections : int, optional
+        Number of connections to open when the client is created.
+    rate_limiter : RateLimiter, optional
+        Limiter that paces the client's requests and retries requests rejected
+        with status 429 (Too Many Requests).
+    request_retry : RequestRetryPolicy, optional
+        Policy for retrying requests that failed with a transient error, e.g.
+        a connection error or status 503. By default, requests are not
+        retried.
+    circuit_breaker : CircuitBreaker, optional
+        Circuit breaker that rejects requests while the endpoint is failing.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        auth_headers,
+        *,
+        retry_strategy: Optional[RetryStrategy] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        timeout: Optional[Union[float, tuple[float, float]]] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        idle_timeout: Optional[float] = None,
+        prewarm_connections: int = 0,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_retry: Optional[RequestRetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            auth_headers,
+            retry_strategy=retry_strategy,
+            metadata_cache=metadata_cache,
+            rate_limiter=rate_limiter,
+            request_retry=request_retry,
+            circuit_breaker=circuit_breaker,
+        )
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.pool_maxsize = pool_maxsize
+
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self._last_request_time = time.monotonic()
+
+        self._bootstrap_lock = threading.Lock()
+
+        if prewarm_connections > 0:
+            self.prewarm(prewarm_connections)
+
+    def _request(
+        self, method: str, path: str, *, route: str, **kwargs
+    ) -> requests.Response:
+        """Send a request to the client's endpoint.
+
+        Applies the client's headers and timeout, unless the request passes
+        its own timeout, and raises an HTTPError for error responses. The
+        route names the API operation, e.g. "about" or "get_submissions", and
+        is used by providers that route requests by headers. If the client
+        has a rate limiter, requests are paced by it and rate limited requests
+        are retried. If the client has a request retry policy, requests that
+        failed with a transient error are retried.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retries = _RequestRetries()
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self._close_idle_connections()
+            start_time = self._before_request()
+            try:
+                response = self.session.request(
+                    method,
+                    f"{self.endpoint}{path}",
+                    headers=self._get_request_headers(route),
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._get_error_retry_delay(
+                    method, start_time, retries, connected=not _is_connect_error(e)
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except requests.RequestException:
+                self._record_outcome(False, start_time)
+                raise
+            except BaseException:
+                self._release_circuit()
+                raise
+            self._last_request_time = time.monotonic()
+
+            delay = self._get_response_retry_delay(
+                method, response, start_time, retries
+            )
+            if delay is None:
+                break
+            time.sleep(delay)
 
-        # TODO: Should be handled differently.
+        response.raise_for_status()
+        return response
+
+    def _close_idle_connections(self) -> None:
+        # Pooled connections that were idle for too long are likely closed by
+        # the server or a proxy, so drop them instead of failing on reuse.
+        if (
+            self.idle_timeout is not None
+            and time.monotonic() - self._last_request_time > self.idle_timeout
+        ):
+            for adapter in self.session.adapters.values():
+                adapter.poolmanager.clear()
+
+    def prewarm(self, n_connections: int = 1) -> None:
+        """Open connections to the client's endpoint ahead of the first request.
+
+        At most `pool_maxsize` connections are opened, as no more can be kept
+        in the connection pool, and connections in use by other threads count
+        towards the limit. Prewarming is best effort: it is skipped if the
+        connection pool does not support it and stops at the first connection
+        that cannot be opened.
+
+        Parameters
+        ----------
+        n_connections : int
+            Number of connections to open and keep in the connection pool.
+        """
+        adapter = self.session.get_adapter(self.endpoint)
+        pool = adapter.poolmanager.connection_from_url(self.endpoint)
+        # urllib3 has no public API to open connections in advance.
+        get_conn = getattr(pool, "_get_conn", None)
+        put_conn = getattr(pool, "_put_conn", None)
+        if get_conn is None or put_conn is None:
+            return
+
+        connections = []
         try:
-            self.languages = self.get_languages()
-            self.config = self.get_config_info()
-        except Exception as e:
-            raise RuntimeError(
-                f"Authentication failed. Visit {self.HOME_URL} to get or "
-                "review your authentication credentials."
-            ) from e
+            for _ in range(min(n_connections, self.pool_maxsize)):
+                try:
+                    # Never block on a pool that has no free slots left.
+                    connection = get_conn(timeout=0)
+                except urllib3.exceptions.EmptyPoolError:
+                    break
+                try:
+                    connection.connect()
+                except (OSError, urllib3.exceptions.HTTPError):
+                    # Return the slot of the failed connection to the pool,
+                    # as urllib3 does, without the connection itself.
+                    connection.close()
+                    put_conn(None)
+                    break
+                connections.append(connection)
+        finally:
+            for connection in connections:
+                put_conn(connection)
+
+    def _fetch_metadata(self, name: str):
+        return self._dump_metadata(
+            name, getattr(self, self._get_metadata_getter(name))()
+        )
+
+    def bootstrap(self) -> None:
+        """Fetch languages, config info and version of the client.
+
+        Does nothing if the client is already bootstrapped.
+        """
+        if self.is_bootstrapped:
+            return
+
+        with self._bootstrap_lock:
+            if self.is_bootstrapped:
+                return
+
+            metadata, missing_names = self._load_cached_metadata()
+            try:
+                if len(missing_names) > 1:
+                    with ThreadPoolExecutor(max_workers=len(missing_names)) as executor:
+                        values = list(executor.map(self._fetch_metadata, missing_names))
+                else:
+                    values = [self._fetch_metadata(name) for name in missing_names]
+            except Exception as e:
+                raise self._authentication_error() from e
+
+            self._set_metadata(metadata, dict(zip(missing_names, values)))
+
+    def _ensure_bootstrapped(self) -> None:
+        self.bootstrap()
+
+    def invalidate_metadata(self) -> None:
+        """Drop the loaded and cached metadata, so it is fetched again on next
+        use.
+        """
+        with self._bootstrap_lock:
+            self._clear_metadata()
 
     def __del__(self):
         self.session.close()
 
     @handle_too_many_requests_error_for_preview_client
     def get_about(self) -> dict:
-        response = self.session.get(
-            f"{self.endpoint}/about",
-            headers=self.auth_headers,
-        )
-        response.raise_for_status()
+        response = self._request("GET", "/about", route="about")
         return response.json()
 
     @handle_too_many_requests_error_for_preview_client
     def get_config_info(self) -> Config:
-        response = self.session.get(
-            f"{self.endpoint}/config_info",
-            headers=self.auth_headers,
-        )
-        response.raise_for_status()
+        response = self._request("GET", "/config_info", route="config_info")
         return Config(**response.json())
 
     @handle_too_many_requests_error_for_preview_client
     def get_language(self, language_id: int) -> Language:
-        request_url = f"{self.endpoint}/languages/{language_id}"
-        response = self.session.get(request_url, headers=self.auth_headers)
-        response.raise_for_status()
+        response = self._request("GET", f"/languages/{language_id}", route="language")
         return Language(**response.json())
 
     @handle_too_many_requests_error_for_preview_client
     def get_languages(self) -> list[Language]:
-        request_url = f"{self.endpoint}/languages"
-        response = self.session.get(request_url, headers=self.auth_headers)
-        response.raise_for_status()
+        response = self._request("GET", "/languages", route="languages")
         return [Language(**lang_dict) for lang_dict in response.json()]
 
     @handle_too_many_requests_error_for_preview_client
     def get_statuses(self) -> list[dict]:
-        response = self.session.get(
-            f"{self.endpoint}/statuses",
-            headers=self.auth_headers,
-        )
-        response.raise_for_status()
+        response = self._request("GET", "/statuses", route="statuses")
         return response.json()
 
-    @property
-    def version(self):
-        if not hasattr(self, "_version"):
-            _version = self.get_about()["version"]
-            setattr(self, "_version", _version)
-        return self._version
+    def is_language_supported(self, language: LanguageType) -> bool:
+        """Check if language is supported by the client."""
+        return self.language_registry.is_supported(language)
 
-    def get_language_id(self, language: Union[LanguageAlias, int]) -> int:
-        """Get language id corresponding to the language alias for the client."""
-        if isinstance(language, LanguageAlias):
-            supported_language_ids = LANGUAGE_TO_LANGUAGE_ID[self.version]
-            language = supported_language_ids.get(language, -1)
-        return language
+    def get_unsupported_languages(
+        self, languages: Iterable[LanguageType]
+    ) -> list[LanguageType]:
+        """Get the languages that are not supported by the client."""
+        return self.language_registry.unsupported(languages)
 
-    def is_language_supported(self, language: Union[LanguageAlias, int]) -> bool:
-        """Check if language is supported by the client."""
-        language_id = self.get_language_id(language)
-        return any(language_id == lang.id for lang in self.languages)
+    def _get_wait_timeout(self, wait_timeout: float) -> tuple[float, float]:
+        connect_timeout = (
+            self.timeout[0] if isinstance(self.timeout, tuple) else self.timeout
+        )
+        return (connect_timeout, wait_timeout)
 
     @handle_too_many_requests_error_for_preview_client
-    def create_submission(self, submission: Submission) -> Submission:
+    def create_submission(
+        self,
+        submission: Submission,
+        *,
+        wait: bool = False,
+        wait_timeout: Optional[float] = None,
+    ) -> Submission:
         """Send submission for execution to a client.
 
         Directly send a submission to create_submission route for execution.
@@ -107,33 +633,23 @@ class Client:
         ----------
         submission : Submission
             A submission to create.
+        wait : bool, optional
+            If True and the client's config enables waiting for the result,
+            the server responds only after the submission is done, saving the
+            polling round trips. Otherwise, the submission is only created.
+        wait_timeout : float, optional
+            Read timeout of a waiting request, in seconds. Defaults to the
+            client's timeout.
 
         Returns
         -------
         Submission
-            A submission with updated token attribute.
+            A submission with updated token attribute and, if the server
+            waited for it, the attributes of the finished submission.
         """
-        # Check if the client supports the language specified in the submission.
-        if not self.is_language_supported(language=submission.language):
-            raise RuntimeError(
-                f"Client {type(self).__name__} does not support language with "
-                f"id {submission.language}!"
-            )
-
-        params = {
-            "base64_encoded": "true",
-            "wait": "false",
-        }
-
-        body = submission.as_body(self)
-
-        response = self.session.post(
-            f"{self.endpoint}/submissions",
-            json=body,
-            params=params,
-            headers=self.auth_headers,
+        response = self._request(
+            **self._create_submission_request(submission, wait, wait_timeout)
         )
-        response.raise_for_status()
 
         submission.set_attributes(response.json())
 
@@ -161,24 +677,7 @@ class Client:
         Submission
             A Submission with updated attributes.
         """
-        params = {
-            "base64_encoded": "true",
-        }
-
-        if isinstance(fields, str):
-            fields = [fields]
-
-        if fields is not None:
-            params["fields"] = ",".join(fields)
-        else:
-            params["fields"] = "*"
-
-        response = self.session.get(
-            f"{self.endpoint}/submissions/{submission.token}",
-            params=params,
-            headers=self.auth_headers,
-        )
-        response.raise_for_status()
+        response = self._request(**self._get_submission_request(submission, fields))
 
         submission.set_attributes(response.json())
 
@@ -201,25 +700,7 @@ class Client:
         Submissions
             A sequence of submissions with updated token attribute.
         """
-        for submission in submissions:
-            if not self.is_language_supported(language=submission.language):
-                raise RuntimeError(
-                    f"Client {type(self).__name__} does not support language "
-                    f"{submission.language}!"
-                )
-
-        # TODO: Maybe raise an exception if the number of submissions is bigger
-        # than the batch size a client supports?
-
-        submissions_body = [submission.as_body(self) for submission in submissions]
-
-        response = self.session.post(
-            f"{self.endpoint}/submissions/batch",
-            headers=self.auth_headers,
-            params={"base64_encoded": "true"},
-            json={"submissions": submissions_body},
-        )
-        response.raise_for_status()
+        response = self._request(**self._create_submissions_request(submissions))
 
         for submission, attrs in zip(submissions, response.json()):
             submission.set_attributes(attrs)
@@ -249,27 +730,7 @@ class Client:
         Submissions
             A sequence of submissions with updated attributes.
         """
-        params = {
-            "base64_encoded": "true",
-        }
-
-        if isinstance(fields, str):
-            fields = [fields]
-
-        if fields is not None:
-            params["fields"] = ",".join(fields)
-        else:
-            params["fields"] = "*"
-
-        tokens = ",".join([submission.token for submission in submissions])
-        params["tokens"] = tokens
-
-        response = self.session.get(
-            f"{self.endpoint}/submissions/batch",
-            params=params,
-            headers=self.auth_headers,
-        )
-        response.raise_for_status()
+        response = self._request(**self._get_submissions_request(submissions, fields))
 
         for submission, attrs in zip(submissions, response.json()["submissions"]):
             submission.set_attributes(attrs)
@@ -293,8 +754,11 @@ class ATD(Client):
             **kwargs,
         )
 
-    def _update_endpoint_header(self, header_value):
-        self.auth_headers["x-apihub-endpoint"] = header_value
+    def _get_request_headers(self, route: str) -> dict:
+        # AllThingsDev routes requests by the endpoint header. It is set per
+        # request, so a single client can be shared between threads.
+        endpoint_id = getattr(self, f"DEFAULT_{route.upper()}_ENDPOINT")
+        return {**self.auth_headers, "x-apihub-endpoint": endpoint_id}
 
 
 class ATDJudge0CE(ATD):
@@ -334,52 +798,6 @@ class ATDJudge0CE(ATD):
             **kwargs,
         )
 
-    def get_about(self) -> dict:
-        self._update_endpoint_header(self.DEFAULT_ABOUT_ENDPOINT)
-        return super().get_about()
-
-    def get_config_info(self) -> Config:
-        self._update_endpoint_header(self.DEFAULT_CONFIG_INFO_ENDPOINT)
-        return super().get_config_info()
-
-    def get_language(self, language_id) -> Language:
-        self._update_endpoint_header(self.DEFAULT_LANGUAGE_ENDPOINT)
-        return super().get_language(language_id)
-
-    def get_languages(self) -> list[Language]:
-        self._update_endpoint_header(self.DEFAULT_LANGUAGES_ENDPOINT)
-        return super().get_languages()
-
-    def get_statuses(self) -> list[dict]:
-        self._update_endpoint_header(self.DEFAULT_STATUSES_ENDPOINT)
-        return super().get_statuses()
-
-    def create_submission(self, submission: Submission) -> Submission:
-        self._update_endpoint_header(self.DEFAULT_CREATE_SUBMISSION_ENDPOINT)
-        return super().create_submission(submission)
-
-    def get_submission(
-        self,
-        submission: Submission,
-        *,
-        fields: Optional[Union[str, Iterable[str]]] = None,
-    ) -> Submission:
-        self._update_endpoint_header(self.DEFAULT_GET_SUBMISSION_ENDPOINT)
-        return super().get_submission(submission, fields=fields)
-
-    def create_submissions(self, submissions: Submissions) -> Submissions:
-        self._update_endpoint_header(self.DEFAULT_CREATE_SUBMISSIONS_ENDPOINT)
-        return super().create_submissions(submissions)
-
-    def get_submissions(
-        self,
-        submissions: Submissions,
-        *,
-        fields: Optional[Union[str, Iterable[str]]] = None,
-    ) -> Submissions:
-        self._update_endpoint_header(self.DEFAULT_GET_SUBMISSIONS_ENDPOINT)
-        return super().get_submissions(submissions, fields=fields)
-
 
 class ATDJudge0ExtraCE(ATD):
     """AllThingsDev client for Extra CE flavor."""
@@ -419,52 +837,6 @@ class ATDJudge0ExtraCE(ATD):
             **kwargs,
         )
 
-    def get_about(self) -> dict:
-        self._update_endpoint_header(self.DEFAULT_ABOUT_ENDPOINT)
-        return super().get_about()
-
-    def get_config_info(self) -> Config:
-        self._update_endpoint_header(self.DEFAULT_CONFIG_INFO_ENDPOINT)
-        return super().get_config_info()
-
-    def get_language(self, language_id) -> Language:
-        self._update_endpoint_header(self.DEFAULT_LANGUAGE_ENDPOINT)
-        return super().get_language(language_id)
-
-    def get_languages(self) -> list[Language]:
-        self._update_endpoint_header(self.DEFAULT_LANGUAGES_ENDPOINT)
-        return super().get_languages()
-
-    def get_statuses(self) -> list[dict]:
-        self._update_endpoint_header(self.DEFAULT_STATUSES_ENDPOINT)
-        return super().get_statuses()
-
-    def create_submission(self, submission: Submission) -> Submission:
-        self._update_endpoint_header(self.DEFAULT_CREATE_SUBMISSION_ENDPOINT)
-        return super().create_submission(submission)
-
-    def get_submission(
-        self,
-        submission: Submission,
-        *,
-        fields: Optional[Union[str, Iterable[str]]] = None,
-    ) -> Submission:
-        self._update_endpoint_header(self.DEFAULT_GET_SUBMISSION_ENDPOINT)
-        return super().get_submission(submission, fields=fields)
-
-    def create_submissions(self, submissions: Submissions) -> Submissions:
-        self._update_endpoint_header(self.DEFAULT_CREATE_SUBMISSIONS_ENDPOINT)
-        return super().create_submissions(submissions)
-
-    def get_submissions(
-        self,
-        submissions: Submissions,
-        *,
-        fields: Optional[Union[str, Iterable[str]]] = None,
-    ) -> Submissions:
-        self._update_endpoint_header(self.DEFAULT_GET_SUBMISSIONS_ENDPOINT)
-        return super().get_submissions(submissions, fields=fields)
-
 
 class Rapid(Client):
     """Base class for all RapidAPI clients."""
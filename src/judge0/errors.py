@@ -7,3 +7,21 @@ class PreviewClientLimitError(RuntimeError):
 
 class ClientResolutionError(RuntimeError):
     """Failed resolution of an unspecified client."""
+
+
+class SubmissionBatchError(RuntimeError):
+    """One or more concurrently sent batches of submissions failed.
+
+    Attributes
+    ----------
+    errors : dict of int to Exception
+        Exceptions of the failed batches, keyed by the batch index.
+    """
+
+    def __init__(self, message: str, errors: dict):
+        super().__init__(message)
+        self.errors = errors
+
+
+class CircuitOpenError(RuntimeError):
+    """Request rejected by an open circuit breaker of the client."""
@@ -0,0 +1,302 @@
+"""Packing of test cases into a single multi-file submission.
+
+Running every test case as its own submission compiles the program once per
+test case. A packed submission is a multi-file program that contains the
+source code, all the inputs and a runner script: the program is compiled
+once and then run on every input, and the output of every run is reported
+in the submission's stdout, from which the results of the individual test
+cases are unpacked.
+"""
+
+import json
+
+from base64 import b64decode
+from typing import TYPE_CHECKING
+
+from .base_types import Language, Status
+from .common import batched
+from .filesystem import File, Filesystem
+from .submission import Submission, Submissions
+
+if TYPE_CHECKING:
+    from .clients import Client
+
+MULTI_FILE_LANGUAGE_ID = 89
+
+# Request fields that differ between the test cases of a packed submission.
+TEST_CASE_FIELDS = ("stdin", "expected_output")
+
+# Time limits of a test case, paired with the config attribute of their
+# maximum. The config attribute of the default has the name of the limit.
+_TIME_LIMITS = (
+    ("cpu_time_limit", "max_cpu_time_limit"),
+    ("wall_time_limit", "max_wall_time_limit"),
+)
+
+CASE_MARKER = "@@judge0-case"
+
+# Exit codes of a process killed by a signal are 128 + the signal number.
+_SIGNAL_EXIT_CODE_OFFSET = 128
+_SIGNAL_STATUSES = {
+    6: Status.RUNTIME_ERROR_SIGABRT,
+    8: Status.RUNTIME_ERROR_SIGFPE,
+    11: Status.RUNTIME_ERROR_SIGSEGV,
+    25: Status.RUNTIME_ERROR_SIGXFSZ,
+}
+
+_RUN_SCRIPT = """\
+#!/bin/bash
+run_case() {{
+    local start end status
+    start=$(date +%s%N)
+    {run_cmd} < "inputs/$1" > "outputs/$1.out" {stderr_redirect}
+    status=$?
+    touch "outputs/$1.err"
+    end=$(date +%s%N)
+    echo "{marker} $1 $status $(( (end - start) / 1000 ))"
+    base64 -w0 "outputs/$1.out"; echo
+    base64 -w0 "outputs/$1.err"; echo
+}}
+mkdir -p outputs
+for i in $(seq 0 {last_case}); do
+    run_case "$i"
+done
+"""
+
+
+def _program_key(client: "Client", submission: Submission) -> str:
+    body = submission.as_body(client)
+    for field in TEST_CASE_FIELDS:
+        body.pop(field, None)
+    return json.dumps(body, sort_keys=True)
+
+
+def group_by_program(client: "Client", submissions: Submissions) -> list[Submissions]:
+    """Group the submissions that run the same program on different test
+    cases, in the order of their first occurrence.
+    """
+    groups = {}
+    for submission in submissions:
+        groups.setdefault(_program_key(client, submission), []).append(submission)
+    return list(groups.values())
+
+
+def _get_time_limits(client: "Client", submission: Submission) -> dict[str, float]:
+    config = client.config
+    return {
+        attr: getattr(submission, attr) or getattr(config, attr)
+        for attr, _ in _TIME_LIMITS
+    }
+
+
+def split_by_time_limits(
+    client: "Client", submissions: Submissions
+) -> list[Submissions]:
+    """Split submissions of the same program into chunks that can be packed.
+
+    The time limits of a packed submission are the sum of the limits of its
+    test cases, so every chunk has at most as many test cases as fit into the
+    client's maximum time limits.
+    """
+    config = client.config
+    time_limits = _get_time_limits(client, submissions[0])
+    chunk_size = min(
+        int(getattr(config, max_attr) // time_limits[attr])
+        for attr, max_attr in _TIME_LIMITS
+    )
+    return [list(chunk) for chunk in batched(submissions, max(1, chunk_size))]
+
+
+def _get_language(client: "Client", language_id: int) -> Language:
+    # Languages listed by the /languages endpoint have only their id and
+    # name, so the details of a language are fetched on first use and kept
+    # in the client's registry.
+    language = client.language_registry.get(language_id)
+    if language is None or language.run_cmd is None:
+        language = client.get_language(language_id)
+        client.language_registry.add(language)
+    return language
+
+
+def pack_submissions(client: "Client", submissions: Submissions) -> Submission:
+    """Pack submissions of the same program into a single submission.
+
+    The CPU and wall time limits of the packed submission are the sums of the
+    limits of the test cases, capped at the client's maximum time limits, see
+    :func:`split_by_time_limits`. Other limits, e.g. the maximum size of the
+    output, apply to all test cases together.
+
+    Parameters
+    ----------
+    client : Client
+        Client the packed submission is created on.
+    submissions : Submissions
+        Submissions that differ only in their stdin and expected output.
+
+    Returns
+    -------
+    Submission
+        Multi-file submission that runs the program on every stdin.
+
+    Raises
+    ------
+    ValueError
+        If the submissions run different programs, or the language of the
+        program cannot be packed.
+    """
+    submission = submissions[0]
+    if any(
+        _program_key(client, other) != _program_key(client, submission)
+        for other in submissions[1:]
+    ):
+        raise ValueError("Only submissions of the same program can be packed.")
+
+    language_id = client.get_language_id(submission.language)
+    language = _get_language(client, language_id)
+    if language_id == MULTI_FILE_LANGUAGE_ID or not (
+        language.source_file and language.run_cmd
+    ):
+        raise ValueError(f"Submissions in language {language.name!r} cannot be packed.")
+
+    files = []
+    if submission.additional_files is not None:
+        files.extend(Filesystem(content=submission.additional_files).files)
+    files.append(File(name=language.source_file, content=submission.source_code))
+    files.extend(
+        File(name=f"inputs/{idx}", content=other.stdin or "")
+        for idx, other in enumerate(submissions)
+    )
+
+    compile_cmd = "true"
+    if language.compile_cmd:
+        compile_cmd = language.compile_cmd.replace(
+            "%s", submission.compiler_options or ""
+        )
+    files.append(File(name="compile", content=f"#!/bin/bash\n{compile_cmd}\n"))
+
+    run_cmd = language.run_cmd
+    if submission.command_line_arguments:
+        run_cmd = f"{run_cmd} {submission.command_line_arguments}"
+    if submission.redirect_stderr_to_stdout:
+        stderr_redirect = "2>&1"
+    else:
+        stderr_redirect = '2> "outputs/$1.err"'
+    run_script = _RUN_SCRIPT.format(
+        run_cmd=run_cmd,
+        stderr_redirect=stderr_redirect,
+        marker=CASE_MARKER,
+        last_case=len(submissions) - 1,
+    )
+    files.append(File(name="run", content=run_script))
+
+    packed_submission = submission.pre_execution_copy()
+    packed_submission.source_code = ""
+    packed_submission.language = MULTI_FILE_LANGUAGE_ID
+    packed_submission.additional_files = Filesystem(content=files)
+    packed_submission.compiler_options = None
+    packed_submission.command_line_arguments = None
+    packed_submission.redirect_stderr_to_stdout = None
+    packed_submission.stdin = None
+    packed_submission.expected_output = None
+    time_limits = _get_time_limits(client, submission)
+    for attr, max_attr in _TIME_LIMITS:
+        setattr(
+            packed_submission,
+            attr,
+            min(
+                time_limits[attr] * len(submissions),
+                getattr(client.config, max_attr),
+            ),
+        )
+    return packed_submission
+
+
+def _parse_cases(stdout: str) -> dict[int, tuple[int, float, str, str]]:
+    cases = {}
+    lines = stdout.split("\n")
+    for idx, line in enumerate(lines):
+        if not line.startswith(CASE_MARKER) or idx + 2 >= len(lines):
+            continue
+        try:
+            _, case_idx, exit_code, time_usec = line.split()
+            case_stdout, case_stderr = (
+                b64decode(value).decode(errors="backslashreplace")
+                for value in (lines[idx + 1], lines[idx + 2])
+            )
+        except ValueError:
+            continue
+        cases[int(case_idx)] = (
+            int(exit_code),
+            int(time_usec) / 1e6,
+            case_stdout,
+            case_stderr,
+        )
+    return cases
+
+
+def _get_status(submission: Submission, exit_code: int) -> Status:
+    if exit_code > _SIGNAL_EXIT_CODE_OFFSET:
+        signal = exit_code - _SIGNAL_EXIT_CODE_OFFSET
+        return _SIGNAL_STATUSES.get(signal, Status.RUNTIME_ERROR_OTHER)
+    if exit_code != 0:
+        return Status.RUNTIME_ERROR_NZEC
+    if submission.expected_output is not None and (
+        (submission.stdout or "").strip() != submission.expected_output.strip()
+    ):
+        return Status.WRONG_ANSWER
+    return Status.ACCEPTED
+
+
+def unpack_submissions(
+    packed_submission: Submission, submissions: Submissions
+) -> Submissions:
+    """Set the results of the test cases of a finished packed submission.
+
+    Every submission gets the stdout, stderr, exit code and wall time of its
+    test case, and a status derived from them as Judge0 would. Test cases
+    without a result, e.g. because the program failed to compile or the
+    packed submission exceeded its time limit, get the status and messages
+    of the packed submission.
+
+    Parameters
+    ----------
+    packed_submission : Submission
+        Finished submission created by :func:`pack_submissions`.
+    submissions : Submissions
+        The packed submissions, in the same order.
+    """
+    cases = _parse_cases(packed_submission.stdout or "")
+    for idx, submission in enumerate(submissions):
+        submission.token = packed_submission.token
+        submission.compile_output = packed_submission.compile_output
+        submission.created_at = packed_submission.created_at
+        submission.finished_at = packed_submission.finished_at
+
+        if idx not in cases:
+            submission.stdout = None
+            submission.stderr = packed_submission.stderr
+            submission.message = packed_submission.message
+            submission.exit_code = packed_submission.exit_code
+            submission.exit_signal = packed_submission.exit_signal
+            submission.status = packed_submission.status
+            if submission.status == Status.ACCEPTED:
+                submission.status = Status.INTERNAL_ERROR
+                submission.message = "Result of the test case is missing."
+            continue
+
+        exit_code, time_sec, stdout, stderr = cases[idx]
+        submission.stdout = stdout or None
+        submission.stderr = stderr or None
+        submission.message = None
+        submission.time = time_sec
+        submission.wall_time = time_sec
+        submission.memory = None
+        if exit_code > _SIGNAL_EXIT_CODE_OFFSET:
+            submission.exit_code = None
+            submission.exit_signal = exit_code - _SIGNAL_EXIT_CODE_OFFSET
+        else:
+            submission.exit_code = exit_code
+            submission.exit_signal = None
+        submission.status = _get_status(submission, exit_code)
+
+    return submissions
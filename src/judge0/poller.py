@@ -0,0 +1,271 @@
+"""Background poller that is shared by all waiters of a client."""
+
+import threading
+import time
+
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Union
+
+from .base_types import Iterable
+from .common import batched
+from .retry import _get_retry_strategy, RetryStrategy
+from .submission import Submission, Submissions
+
+# Minimal projection of submission fields that is requested while polling
+# for the submission status.
+POLLING_FIELDS = ("token", "status")
+
+
+class _Waiter:
+    def __init__(
+        self,
+        submissions: list[Submission],
+        fields,
+        future: Future,
+        retry_strategy: RetryStrategy,
+    ):
+        self.submissions = submissions
+        self.fields = fields
+        self.future = future
+        self.retry_strategy = retry_strategy
+        self.start_time = time.monotonic()
+
+    def pending(self) -> list[Submission]:
+        elapsed_time = time.monotonic() - self.start_time
+        return [
+            submission
+            for submission in self.submissions
+            if not submission.is_done()
+            and (
+                submission.max_wait_time is None
+                or elapsed_time < submission.max_wait_time
+            )
+        ]
+
+
+class Poller:
+    """Background poller of the submissions of a client.
+
+    Threads that wait for submissions register them with the poller instead
+    of polling on their own. Every round, the poller requests the status of
+    all registered submissions in batches of the client's
+    `max_submission_batch_size`, fetches the fields of the finished ones and
+    resolves the waiters whose submissions are all done. With many threads
+    waiting for a few submissions each, this saves most of the requests.
+
+    The polling thread is started when the first submissions are registered
+    and stops when there is nothing left to wait for. Every waiter gets its
+    own copy of the retry strategy, and once its copy is done, the waiter is
+    resolved with its unfinished submissions, as with :func:`judge0.wait`.
+    The shared rounds are scheduled by another copy of the strategy, which
+    starts over whenever it is done. Use :func:`get_poller` to get the poller
+    shared by all users of a client.
+
+    Parameters
+    ----------
+    client : Client or ClientPool
+        Client of the submissions.
+    retry_strategy : RetryStrategy, optional
+        Strategy scheduling the polling rounds. Defaults to the client's
+        retry strategy.
+    """
+
+    def __init__(self, client, *, retry_strategy: Optional[RetryStrategy] = None):
+        self.client = client
+        self.retry_strategy = retry_strategy
+
+        self._lock = threading.Lock()
+        self._waiters = []
+        self._thread = None
+
+    def submit(
+        self,
+        submissions: Union[Submission, Submissions],
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Future:
+        """Register submissions to wait for.
+
+        Parameters
+        ----------
+        submissions : Submission or Submissions
+            Created submissions to wait for.
+        fields : str or sequence of str, optional
+            Submission attributes fetched for the finished submissions.
+            Defaults to all attributes.
+
+        Returns
+        -------
+        Future
+            Future that resolves to the submissions once all of them are done
+            or their `max_wait_time` expired, or to the error of a failed
+            request.
+        """
+        future = Future()
+        if isinstance(submissions, Submission):
+            submissions_list = [submissions]
+        else:
+            submissions_list = list(submissions)
+
+        retry_strategy = _get_retry_strategy(self.client, self.retry_strategy)
+        with self._lock:
+            self._waiters.append(
+                _Waiter(submissions_list, fields, future, retry_strategy)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="judge0-poller", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def wait(
+        self,
+        submissions: Union[Submission, Submissions],
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Submission, Submissions]:
+        """Wait for the submissions to finish.
+
+        Parameters
+        ----------
+        submissions : Submission or Submissions
+            Created submissions to wait for.
+        fields : str or sequence of str, optional
+            Submission attributes fetched for the finished submissions.
+            Defaults to all attributes.
+        timeout : float, optional
+            Maximum time to wait, in seconds. Submissions that are not done in
+            time are returned unfinished.
+        """
+        future = self.submit(submissions, fields=fields)
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._waiters = [
+                    waiter for waiter in self._waiters if waiter.future is not future
+                ]
+        return submissions
+
+    def _run(self) -> None:
+        retry_strategy = _get_retry_strategy(self.client, self.retry_strategy)
+        while True:
+            with self._lock:
+                waiters = list(self._waiters)
+                if not waiters:
+                    self._thread = None
+                    return
+            try:
+                finished_by_waiter = self._poll(waiters)
+            except Exception as e:
+                self._resolve(waiters, exception=e)
+                continue
+
+            all_pending = []
+            all_finished = []
+            resolved_waiters = []
+            for waiter in waiters:
+                pending = waiter.pending()
+                finished = finished_by_waiter.get(waiter, [])
+                all_pending.extend(pending)
+                all_finished.extend(finished)
+                if not pending:
+                    resolved_waiters.append(waiter)
+                    continue
+                # Every waiter spends its own budget, counted from its
+                # registration, regardless of the waiters it shares rounds with.
+                waiter.retry_strategy.observe(pending, finished)
+                waiter.retry_strategy.step()
+                if waiter.retry_strategy.is_done():
+                    resolved_waiters.append(waiter)
+            self._resolve(resolved_waiters)
+
+            retry_strategy.observe(all_pending, all_finished)
+            if len(resolved_waiters) == len(waiters):
+                continue
+            retry_strategy.wait()
+            retry_strategy.step()
+            if retry_strategy.is_done():
+                retry_strategy.reset()
+
+    def _get_batches(self, submissions, fields) -> None:
+        batch_size = self.client.config.max_submission_batch_size
+        for batch in batched(submissions, batch_size):
+            if len(batch) > 1:
+                self.client.get_submissions(batch, fields=fields)
+            else:
+                self.client.get_submission(batch[0], fields=fields)
+
+    def _poll(self, waiters: list[_Waiter]) -> dict[_Waiter, list[Submission]]:
+        """Poll the submissions of the waiters once.
+
+        Returns the submissions of every waiter that finished in this round.
+        """
+        pending_by_waiter = [(waiter, waiter.pending()) for waiter in waiters]
+
+        # Waiters of the same submission share a single request for it.
+        submissions_by_token = {}
+        for _, pending in pending_by_waiter:
+            for submission in pending:
+                submissions_by_token.setdefault(str(submission.token), []).append(
+                    submission
+                )
+        if not submissions_by_token:
+            return {}
+        self._get_batches(
+            [submissions[0] for submissions in submissions_by_token.values()],
+            POLLING_FIELDS,
+        )
+
+        finished_by_fields = {}
+        finished_by_waiter = {}
+        for waiter, pending in pending_by_waiter:
+            for submission in pending:
+                polled_submission = submissions_by_token[str(submission.token)][0]
+                if polled_submission.is_done():
+                    submission.status = polled_submission.status
+                    finished_by_fields.setdefault(
+                        _fields_key(waiter.fields), []
+                    ).append(submission)
+                    finished_by_waiter.setdefault(waiter, []).append(submission)
+
+        for fields, submissions in finished_by_fields.items():
+            self._get_batches(submissions, fields)
+        return finished_by_waiter
+
+    def _resolve(
+        self, waiters: list[_Waiter], exception: Optional[Exception] = None
+    ) -> None:
+        resolved_waiters = set(waiters)
+        with self._lock:
+            self._waiters = [
+                waiter for waiter in self._waiters if waiter not in resolved_waiters
+            ]
+        for waiter in waiters:
+            if exception is not None:
+                waiter.future.set_exception(exception)
+            else:
+                waiter.future.set_result(waiter.submissions)
+
+
+def _fields_key(fields: Optional[Union[str, Iterable[str]]]):
+    if fields is None or isinstance(fields, str):
+        return fields
+    return tuple(fields)
+
+
+_pollers_lock = threading.Lock()
+
+
+def get_poller(client) -> Poller:
+    """Get the poller shared by all waiters of the client.
+
+    The poller is created on first use and lives as long as the client.
+    """
+    with _pollers_lock:
+        poller = getattr(client, "_poller", None)
+        if poller is None:
+            poller = client._poller = Poller(client)
+        return poller
@@ -0,0 +1,432 @@
+"""Pools of clients that share the load of submissions."""
+
+import itertools
+import math
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Container, Optional, Sequence, Union
+
+from .base_types import Config, Iterable
+from .clients import Client
+from .errors import CircuitOpenError
+from .registry import LanguageType
+from .retry import RetryStrategy
+from .submission import Submission, Submissions
+
+DEFAULT_PROBE_INTERVAL_SEC = 60.0
+
+_pool_ids = itertools.count()
+
+
+class ClientPool:
+    """Pool of clients that spreads submissions across its members.
+
+    A pool can be used wherever a client is expected, e.g. as the `client`
+    argument of :func:`judge0.run` or :func:`judge0.wait`. Every submission
+    (or batch of submissions) is created on a single member of the pool that
+    supports its languages, and every submission remembers which member owns
+    it, so waiting for the submissions polls the right member.
+
+    Members whose circuit breaker is open are skipped when creating
+    submissions, and their submissions are left unchanged while polling, so
+    the pool keeps working as long as one of its members does.
+
+    Parameters
+    ----------
+    clients : sequence of Client
+        Members of the pool, e.g. clients of different providers, clients with
+        different API keys or clients of several self-hosted endpoints.
+    weights : sequence of float, optional
+        Relative capacity of every member. Defaults to equal weights.
+    strategy : {"round_robin", "least_outstanding", "priority", "latency"}, optional
+        Strategy for choosing the member that creates the submissions.
+        "round_robin" spreads submissions in proportion to the weights.
+        "least_outstanding" chooses the member with the fewest in-flight
+        requests relative to its weight, breaking ties by round-robin.
+        "priority" chooses the first member in order, and fails over to the
+        next one while its circuit breaker is open. "latency" chooses the
+        member with the lowest round-trip time, see :meth:`probe`.
+    retry_strategy : RetryStrategy, optional
+        Default retry strategy used while waiting for submissions.
+    probe_interval_sec : float, optional
+        Time after which the round-trip times measured for the "latency"
+        strategy are measured again.
+    """
+
+    STRATEGIES: ClassVar[tuple[str, ...]] = (
+        "round_robin",
+        "least_outstanding",
+        "priority",
+        "latency",
+    )
+
+    def __init__(
+        self,
+        clients: Sequence[Client],
+        *,
+        weights: Optional[Sequence[float]] = None,
+        strategy: str = "round_robin",
+        retry_strategy: Optional[RetryStrategy] = None,
+        probe_interval_sec: float = DEFAULT_PROBE_INTERVAL_SEC,
+    ) -> None:
+        if len(clients) == 0:
+            raise ValueError("Client pool requires at least one client.")
+        if weights is None:
+            weights = [1] * len(clients)
+        if len(weights) != len(clients):
+            raise ValueError(
+                f"Expected {len(clients)} weights, one for every client, "
+                f"got {len(weights)}."
+            )
+        if any(weight <= 0 for weight in weights):
+            raise ValueError(f"Weights must be positive, got {list(weights)}.")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy!r}, expected one of {self.STRATEGIES}."
+            )
+
+        self.clients = list(clients)
+        self.weights = list(weights)
+        self.strategy = strategy
+        self.retry_strategy = retry_strategy
+        self.probe_interval_sec = probe_interval_sec
+
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._latencies = [math.inf] * len(self.clients)
+        self._probed_at = None
+        self._current_weights = [0] * len(self.clients)
+        self._outstanding_requests = [0] * len(self.clients)
+        self._id = next(_pool_ids)
+        self._config = None
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __iter__(self):
+        return iter(self.clients)
+
+    def bootstrap(self) -> None:
+        """Concurrently bootstrap all clients of the pool.
+
+        Clients that fail to bootstrap are skipped until they recover. Raises
+        the error of the first client if none of the clients bootstrapped.
+        """
+
+        def bootstrap_client(client):
+            try:
+                client.bootstrap()
+            except Exception as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            errors = list(executor.map(bootstrap_client, self.clients))
+        if all(error is not None for error in errors):
+            raise errors[0]
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        return all(client.is_bootstrapped for client in self.clients)
+
+    @property
+    def config(self) -> Config:
+        """Config of the first client, restricted to the smallest batch size
+        of all clients, so that every batch fits any member of the pool.
+        """
+        if self._config is not None:
+            return self._config
+
+        self.bootstrap()
+        clients = [client for client in self.clients if client.is_bootstrapped]
+        config = clients[0].config.model_copy(
+            update={
+                "max_submission_batch_size": min(
+                    client.config.max_submission_batch_size for client in clients
+                )
+            }
+        )
+        # Clients that are down might have a smaller batch size once they
+        # recover, so the config is final only when all clients are known.
+        if len(clients) == len(self.clients):
+            self._config = config
+        return config
+
+    @property
+    def version(self) -> str:
+        """Judge0 version of the first client of the pool that is reachable."""
+        if not self.is_bootstrapped:
+            self.bootstrap()
+        return next(client.version for client in self.clients if client.is_bootstrapped)
+
+    def probe(self) -> list[float]:
+        """Measure the round-trip time of every client of the pool.
+
+        Every client is sent a request to the /about endpoint, concurrently.
+        The measured times are used by the "latency" strategy until they are
+        older than `probe_interval_sec`.
+
+        Returns
+        -------
+        list of float
+            Round-trip time of every client in seconds, infinite for clients
+            whose request failed.
+        """
+
+        def probe_client(client):
+            start_time = time.monotonic()
+            try:
+                client.get_about()
+            except Exception:
+                return math.inf
+            return time.monotonic() - start_time
+
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            latencies = list(executor.map(probe_client, self.clients))
+
+        with self._lock:
+            self._latencies = latencies
+            self._probed_at = time.monotonic()
+        return latencies
+
+    def _get_latencies(self) -> list[float]:
+        def is_stale():
+            return (
+                self._probed_at is None
+                or time.monotonic() - self._probed_at >= self.probe_interval_sec
+            )
+
+        # Only one thread probes the clients. The others wait for the first
+        # measurement, but afterwards keep using the previous one meanwhile.
+        if is_stale() and self._probe_lock.acquire(blocking=self._probed_at is None):
+            try:
+                if is_stale():
+                    self.probe()
+            finally:
+                self._probe_lock.release()
+        return self._latencies
+
+    @staticmethod
+    def _allows_requests(client: Client) -> bool:
+        return (
+            client.circuit_breaker is None or client.circuit_breaker.allows_requests()
+        )
+
+    def get_language_id(self, language: LanguageType) -> int:
+        """Get the language id of the first client of the pool that supports
+        the language, or -1 if none does.
+
+        Clients that are not reachable are skipped.
+        """
+        errors = []
+        for client in self.clients:
+            try:
+                if client.is_language_supported(language):
+                    return client.get_language_id(language)
+            except Exception as e:
+                errors.append(e)
+        if len(errors) == len(self.clients):
+            raise errors[0]
+        return -1
+
+    def is_language_supported(self, language: LanguageType) -> bool:
+        """Check if language is supported by any client of the pool."""
+        return not self.get_unsupported_languages([language])
+
+    def get_unsupported_languages(
+        self, languages: Iterable[LanguageType]
+    ) -> list[LanguageType]:
+        """Get the languages that are not supported by any client of the pool.
+
+        Clients that are not reachable are skipped.
+        """
+        unsupported_languages = list(languages)
+        errors = []
+        for client in self.clients:
+            if not unsupported_languages:
+                break
+            try:
+                unsupported_languages = client.get_unsupported_languages(
+                    unsupported_languages
+                )
+            except Exception as e:
+                errors.append(e)
+        if len(errors) == len(self.clients):
+            raise errors[0]
+        return unsupported_languages
+
+    def _next_round_robin(self, candidates: list[int]) -> int:
+        # Smooth weighted round-robin, which interleaves the members instead
+        # of sending runs of consecutive requests to the heaviest one.
+        for idx in candidates:
+            self._current_weights[idx] += self.weights[idx]
+        selected = max(candidates, key=lambda idx: self._current_weights[idx])
+        self._current_weights[selected] -= sum(self.weights[idx] for idx in candidates)
+        return selected
+
+    def _acquire(
+        self, languages: list[LanguageType], excluded: Container[int] = ()
+    ) -> int:
+        candidates = []
+        n_open_circuits = 0
+        error = None
+        for idx, client in enumerate(self.clients):
+            if idx in excluded or not self._allows_requests(client):
+                n_open_circuits += 1
+                continue
+            try:
+                if not client.get_unsupported_languages(languages):
+                    candidates.append(idx)
+            except Exception as e:
+                # The client failed to bootstrap, e.g. it is down.
+                error = error or e
+
+        if not candidates and n_open_circuits > 0:
+            raise CircuitOpenError(
+                f"Circuits of {n_open_circuits} clients in the pool are open and "
+                f"none of the other clients supports all languages {languages}."
+            ) from error
+        if not candidates and error is not None:
+            raise error
+        if not candidates:
+            raise RuntimeError(
+                f"None of the clients in the pool supports all languages "
+                f"{languages}!"
+            )
+
+        if self.strategy == "latency":
+            latencies = self._get_latencies()
+
+        with self._lock:
+            if self.strategy == "priority":
+                selected = candidates[0]
+            elif self.strategy == "latency":
+                # Ties, e.g. all probes failed, are resolved by priority.
+                selected = min(candidates, key=lambda idx: latencies[idx])
+            else:
+                if self.strategy == "least_outstanding":
+                    load = {
+                        idx: self._outstanding_requests[idx] / self.weights[idx]
+                        for idx in candidates
+                    }
+                    min_load = min(load.values())
+                    candidates = [idx for idx in candidates if load[idx] == min_load]
+                selected = self._next_round_robin(candidates)
+            self._outstanding_requests[selected] += 1
+        return selected
+
+    def _create(self, submissions: Submissions, create) -> Submissions:
+        # Fail over to the next member if the circuit of the selected one
+        # opened in the meantime. No request was sent in that case, so
+        # submissions cannot be created twice.
+        excluded = set()
+        while True:
+            idx = self._acquire(
+                [submission.language for submission in submissions], excluded
+            )
+            try:
+                create(self.clients[idx])
+            except CircuitOpenError:
+                excluded.add(idx)
+                continue
+            finally:
+                self._release(idx)
+            self._set_owner(submissions, idx)
+            return submissions
+
+    def _release(self, idx: int) -> None:
+        with self._lock:
+            self._outstanding_requests[idx] -= 1
+
+    def _set_owner(self, submissions: Submissions, idx: int) -> None:
+        # The owner is kept by the submission rather than by the pool, so the
+        # pool does not grow with every submission it ever created.
+        for submission in submissions:
+            submission._pool_owner = (self._id, idx)
+
+    def _get_owner_idx(self, submission: Submission) -> int:
+        owner = submission._pool_owner
+        if owner is None or owner[0] != self._id:
+            raise ValueError(
+                f"Submission {submission.token} was not created through "
+                "this client pool."
+            )
+        return owner[1]
+
+    def get_owner(self, submission: Submission) -> Client:
+        """Get the client of the pool that created the submission.
+
+        Raises
+        ------
+        ValueError
+            If the submission was not created through the pool.
+        """
+        return self.clients[self._get_owner_idx(submission)]
+
+    def create_submission(
+        self,
+        submission: Submission,
+        *,
+        wait: bool = False,
+        wait_timeout: Optional[float] = None,
+    ) -> Submission:
+        """Create a submission on one of the clients of the pool.
+
+        See :meth:`judge0.clients.Client.create_submission` for the `wait`
+        and `wait_timeout` arguments.
+        """
+        self._create(
+            [submission],
+            lambda client: client.create_submission(
+                submission, wait=wait, wait_timeout=wait_timeout
+            ),
+        )
+        return submission
+
+    def create_submissions(self, submissions: Submissions) -> Submissions:
+        """Create a batch of submissions on one of the clients of the pool.
+
+        Cannot handle more submissions than the pool config supports.
+        """
+        return self._create(
+            submissions, lambda client: client.create_submissions(submissions)
+        )
+
+    def get_submission(
+        self,
+        submission: Submission,
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Submission:
+        """Get submission status from the client that created it."""
+        return self.get_owner(submission).get_submission(submission, fields=fields)
+
+    def get_submissions(
+        self,
+        submissions: Submissions,
+        *,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Submissions:
+        """Get submissions status from the clients that created them.
+
+        Cannot handle more submissions than the pool config supports.
+        Submissions of clients whose circuit is open are left unchanged.
+        """
+        submissions_by_owner = {}
+        for submission in submissions:
+            idx = self._get_owner_idx(submission)
+            submissions_by_owner.setdefault(idx, []).append(submission)
+
+        for idx, owned_submissions in submissions_by_owner.items():
+            client = self.clients[idx]
+            try:
+                if len(owned_submissions) > 1:
+                    client.get_submissions(owned_submissions, fields=fields)
+                else:
+                    client.get_submission(owned_submissions[0], fields=fields)
+            except CircuitOpenError:
+                continue
+
+        return submissions
@@ -0,0 +1,313 @@
+"""Client-side rate limiting of requests to the Judge0 API."""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Union
+
+from .cache import _atomic_write_text, get_default_cache_directory
+
+HTTP_TOO_MANY_REQUESTS = 429
+
+# Response headers with the number of requests left in the current window and
+# the time until the window resets, as sent by the IETF RateLimit draft, the
+# common X-RateLimit convention and RapidAPI, respectively.
+RATE_LIMIT_HEADERS = (
+    ("ratelimit-remaining", "ratelimit-reset"),
+    ("x-ratelimit-remaining", "x-ratelimit-reset"),
+    ("x-ratelimit-requests-remaining", "x-ratelimit-requests-reset"),
+)
+
+# Reset values larger than this are Unix timestamps rather than durations.
+_MIN_RESET_TIMESTAMP = 1_000_000_000
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def get_retry_after_sec(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the delay requested by the Retry-After header, in seconds.
+
+    Supports both the delay-seconds and the HTTP-date forms of the header.
+    Returns None if the header is missing or malformed.
+    """
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+
+    delay = _parse_float(value)
+    if delay is None:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, delay)
+
+
+def get_rate_limit_reset_sec(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the time until the rate limit window resets, in seconds, if the
+    rate limit headers report that no requests are left in the window.
+    """
+    for remaining_header, reset_header in RATE_LIMIT_HEADERS:
+        remaining = _parse_float(headers.get(remaining_header))
+        if remaining is None or remaining > 0:
+            continue
+        reset = _parse_float(headers.get(reset_header))
+        if reset is None:
+            continue
+        if reset > _MIN_RESET_TIMESTAMP:
+            reset -= time.time()
+        return max(0.0, reset)
+    return None
+
+
+class RateLimiter:
+    """Token bucket rate limiter of client requests.
+
+    Every request takes a token from the bucket, which is refilled at `rate`
+    tokens per second up to `burst` tokens. Besides the configured rate, the
+    limiter follows the provider's quota: requests are paused when the rate
+    limit response headers report an exhausted window, and responses with
+    status 429 (Too Many Requests) are retried after the delay requested by
+    the `Retry-After` header, or after an exponential backoff if there is
+    none. A limiter can be shared by several clients that use the same quota.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Maximum number of requests per second. By default, requests are paced
+        only by the response headers.
+    burst : int, optional
+        Maximum number of requests sent at once. Defaults to the rate, rounded
+        up to a whole request.
+    max_retries : int, optional
+        Maximum number of retries of a request rejected with status 429.
+    initial_backoff_sec : float, optional
+        Delay before the first retry if the response does not specify one. It
+        is doubled on every following retry.
+    max_backoff_sec : float, optional
+        Maximum delay before a retry. A request is not retried if the provider
+        asks to wait longer.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        *,
+        max_retries: int = 5,
+        initial_backoff_sec: float = 1.0,
+        max_backoff_sec: float = 60.0,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}.")
+        if burst is None:
+            burst = math.ceil(rate) if rate is not None else 1
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}.")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.initial_backoff_sec = initial_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    def _initial_state(self) -> dict:
+        return {
+            "tokens": float(self.burst),
+            "refill_time": self._clock(),
+            "paused_until": 0.0,
+        }
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict]:
+        """Exclusive access to the bucket state."""
+        with self._lock:
+            yield self._state
+
+    def _try_acquire(self) -> float:
+        """Take a token if possible, otherwise return the time to wait."""
+        with self._locked_state() as state:
+            now = self._clock()
+            if now < state["paused_until"]:
+                return state["paused_until"] - now
+            if self.rate is None:
+                return 0.0
+
+            state["tokens"] = min(
+                self.burst,
+                state["tokens"] + max(0.0, now - state["refill_time"]) * self.rate,
+            )
+            state["refill_time"] = now
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0.0
+            return (1 - state["tokens"]) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request can be sent."""
+        while (wait_time := self._try_acquire()) > 0:
+            time.sleep(wait_time)
+
+    async def async_acquire(self) -> None:
+        """Wait until a request can be sent without blocking the event loop."""
+        while (wait_time := self._try_acquire()) > 0:
+            await asyncio.sleep(wait_time)
+
+    def pause(self, duration_sec: float) -> None:
+        """Hold back all requests for the given number of seconds."""
+        with self._locked_state() as state:
+            state["paused_until"] = max(
+                state["paused_until"], self._clock() + duration_sec
+            )
+
+    def should_retry(
+        self, status_code: int, headers: Mapping[str, str], n_retries: int
+    ) -> bool:
+        """Update the limiter from a response and decide whether to retry it.
+
+        Parameters
+        ----------
+        status_code : int
+            Status code of the response.
+        headers : Mapping
+            Case-insensitive headers of the response.
+        n_retries : int
+            Number of times the request was already retried.
+
+        Returns
+        -------
+        bool
+            True if the request was rejected by the rate limit and should be
+            sent again. Following requests are paused for the backoff delay.
+        """
+        reset_sec = get_rate_limit_reset_sec(headers)
+        if reset_sec is not None and reset_sec <= self.max_backoff_sec:
+            self.pause(reset_sec)
+
+        if status_code != HTTP_TOO_MANY_REQUESTS or n_retries >= self.max_retries:
+            return False
+
+        delay = get_retry_after_sec(headers)
+        if delay is None:
+            delay = reset_sec
+        if delay is None:
+            delay = self.initial_backoff_sec * 2**n_retries
+            delay = min(delay * (1 + random.random() / 2), self.max_backoff_sec)
+        if delay > self.max_backoff_sec:
+            return False
+
+        self.pause(delay)
+        return True
+
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after ten attempts, one second apart.
+                continue
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileRateLimiter(RateLimiter):
+    """Rate limiter shared by all processes on a host.
+
+    Works like :class:`RateLimiter`, but the token bucket and the pauses
+    requested by the provider are kept in a file that is locked on every
+    access, so all processes that use the same `key` share a single request
+    budget. Using the API key as the key keeps every process that uses it
+    under its quota.
+
+    Parameters
+    ----------
+    key : str
+        Name of the shared budget, e.g. the API key. Only its hash is stored.
+    rate : float, optional
+        Maximum number of requests per second of all processes together.
+    burst : int, optional
+        Maximum number of requests sent at once by all processes together.
+    directory : str or Path, optional
+        Directory of the shared state. Defaults to the `ratelimit`
+        subdirectory of :func:`judge0.cache.get_default_cache_directory`.
+    **kwargs
+        Other arguments of :class:`RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        *,
+        directory: Optional[Union[str, Path]] = None,
+        **kwargs,
+    ):
+        if directory is None:
+            directory = get_default_cache_directory() / "ratelimit"
+        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        self.path = Path(directory) / f"{key_hash}.json"
+        self.lock_path = Path(directory) / f"{key_hash}.lock"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(rate, burst, **kwargs)
+
+    def _clock(self) -> float:
+        # Monotonic clocks are not comparable between processes.
+        return time.time()
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict]:
+        with self._lock:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                _lock_file(fd)
+                try:
+                    try:
+                        state = json.loads(self.path.read_text())
+                    except (OSError, ValueError):
+                        state = self._initial_state()
+                    yield state
+                    _atomic_write_text(self.path, json.dumps(state))
+                finally:
+                    _unlock_file(fd)
+            finally:
+                os.close(fd)
@@ -0,0 +1,88 @@
+from typing import Optional, Union
+
+from .base_types import Iterable, Language, LanguageAlias
+from .data import LANGUAGE_TO_LANGUAGE_ID
+
+LanguageType = Union[LanguageAlias, int, str]
+
+
+class LanguageRegistry:
+    """Index of the languages supported by a client.
+
+    Languages can be looked up in constant time by their id, by a
+    `LanguageAlias` (resolved for the client's version) or by their name,
+    e.g. "Python (3.8.1)".
+
+    Parameters
+    ----------
+    languages : sequence of Language
+        Languages supported by the client.
+    version : str
+        Judge0 version of the client.
+    """
+
+    def __init__(self, languages: Iterable[Language], version: str):
+        self.languages = list(languages)
+        self.version = version
+        self._languages_by_id = {language.id: language for language in self.languages}
+        self._language_ids_by_name = {
+            language.name.lower(): language.id for language in self.languages
+        }
+        self._language_ids_by_alias = LANGUAGE_TO_LANGUAGE_ID.get(version, {})
+
+    def add(self, language: Language) -> None:
+        """Add the language, replacing the language with the same id.
+
+        Used to keep the details of a language, e.g. its compile and run
+        commands, which the /languages endpoint does not list.
+        """
+        self.languages = [
+            other for other in self.languages if other.id != language.id
+        ] + [language]
+        self._languages_by_id[language.id] = language
+        self._language_ids_by_name[language.name.lower()] = language.id
+
+    def __len__(self) -> int:
+        return len(self.languages)
+
+    def __iter__(self):
+        return iter(self.languages)
+
+    def __contains__(self, language: LanguageType) -> bool:
+        return self.is_supported(language)
+
+    def get_language_id(self, language: LanguageType) -> int:
+        """Get the language id corresponding to the language alias, name or id.
+
+        Returns -1 for aliases and names that are not known for the client.
+        """
+        if isinstance(language, LanguageAlias):
+            return self._language_ids_by_alias.get(language, -1)
+        if isinstance(language, str):
+            return self._language_ids_by_name.get(language.strip().lower(), -1)
+        return language
+
+    def get(self, language: LanguageType) -> Optional[Language]:
+        """Get the language corresponding to the language alias, name or id."""
+        return self._languages_by_id.get(self.get_language_id(language))
+
+    def is_supported(self, language: LanguageType) -> bool:
+        """Check if the language is supported."""
+        return self.get_language_id(language) in self._languages_by_id
+
+    def unsupported(self, languages: Iterable[LanguageType]) -> list[LanguageType]:
+        """Get all languages that are not supported, in a single pass.
+
+        Every distinct language is checked only once.
+        """
+        unsupported = []
+        checked = set()
+        for language in languages:
+            # Aliases are IntEnums, so they have to be told apart from ids.
+            key = (type(language) is LanguageAlias, language)
+            if key in checked:
+                continue
+            checked.add(key)
+            if not self.is_supported(language):
+                unsupported.append(language)
+        return unsupported
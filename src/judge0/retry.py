@@ -1,5 +1,12 @@
+import asyncio
+import copy
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from .submission import Submissions
 
 
 class RetryStrategy(ABC):
@@ -11,44 +18,97 @@ class RetryStrategy(ABC):
     def wait(self) -> None:
         pass
 
+    async def async_wait(self) -> None:
+        """Wait without blocking the event loop.
+
+        Falls back to running the blocking `wait` in a worker thread. Override
+        it to sleep with `asyncio.sleep` instead.
+        """
+        await asyncio.to_thread(self.wait)
+
     def step(self) -> None:
         pass
 
+    def reset(self) -> None:
+        """Reset the state of the strategy.
+
+        Called at the start of every wait on a shallow copy of the strategy,
+        so a single strategy object can be reused across waits and shared by
+        concurrent ones. State that outlives a wait has to be kept in a
+        mutable attribute that the copies share.
+        """
+        pass
+
+    def observe(
+        self,
+        pending_submissions: Submissions,
+        finished_submissions: Submissions,
+    ) -> None:
+        """Observe the outcome of a polling round.
+
+        Called after every polling round with the submissions that are still
+        pending and the submissions that finished in that round. Adaptive
+        strategies can use it to schedule the next poll.
+        """
+        pass
+
 
 class MaxRetries(RetryStrategy):
-    """Check for submissions status every 100 ms and retry a maximum of
-    `max_retries` times."""
+    """Check for submissions status every `wait_time_sec` seconds and retry a
+    maximum of `max_retries` times.
+    """
 
-    def __init__(self, max_retries: int = 20):
+    def __init__(self, max_retries: int = 20, wait_time_sec: float = 0.1):
         self.n_retries = 0
         self.max_retries = max_retries
+        self.wait_time_sec = wait_time_sec
 
     def step(self):
         self.n_retries += 1
 
+    def reset(self):
+        self.n_retries = 0
+
     def wait(self):
-        time.sleep(0.1)
+        time.sleep(self.wait_time_sec)
+
+    async def async_wait(self):
+        await asyncio.sleep(self.wait_time_sec)
 
     def is_done(self) -> bool:
         return self.n_retries >= self.max_retries
 
 
 class MaxWaitTime(RetryStrategy):
-    """Check for submissions status every 100 ms and wait for all submissions
-    a maximum of `max_wait_time` (seconds)."""
+    """Check for submissions status every `wait_time_sec` seconds and wait for
+    all submissions a maximum of `max_wait_time_sec` seconds.
+
+    The wait time is measured with a monotonic clock from the start of the
+    wait, so the time spent in requests counts towards the limit.
+    """
 
-    def __init__(self, max_wait_time_sec: float = 5 * 60):
+    def __init__(self, max_wait_time_sec: float = 5 * 60, wait_time_sec: float = 0.1):
         self.max_wait_time_sec = max_wait_time_sec
-        self.total_wait_time = 0
+        self.wait_time_sec = wait_time_sec
+        self.start_time = None
 
-    def step(self):
-        self.total_wait_time += 0.1
+    def reset(self):
+        self.start_time = time.monotonic()
+
+    def remaining_time_sec(self) -> float:
+        """Time left until the maximum wait time is reached, in seconds."""
+        if self.start_time is None:
+            self.reset()
+        return self.max_wait_time_sec - (time.monotonic() - self.start_time)
 
     def wait(self):
-        time.sleep(0.1)
+        time.sleep(max(0, min(self.wait_time_sec, self.remaining_time_sec())))
+
+    async def async_wait(self):
+        await asyncio.sleep(max(0, min(self.wait_time_sec, self.remaining_time_sec())))
 
     def is_done(self):
-        return self.total_wait_time >= self.max_wait_time_sec
+        return self.remaining_time_sec() <= 0
 
 
 class RegularPeriodRetry(RetryStrategy):
@@ -60,5 +120,269 @@ class RegularPeriodRetry(RetryStrategy):
     def wait(self):
         time.sleep(self.wait_time_sec)
 
+    async def async_wait(self):
+        await asyncio.sleep(self.wait_time_sec)
+
     def is_done(self) -> bool:
         return False
+
+
+class ExponentialBackoffRetry(RetryStrategy):
+    """Check for submissions status with exponentially growing periods.
+
+    The period starts at `initial_period_sec`, is multiplied by `multiplier`
+    after every retry and is capped at `max_period_sec`. Every wait is
+    shortened by a random fraction of up to `jitter` of the period, so that
+    many concurrent waiters do not poll in lockstep. Retries indefinitely
+    unless `max_retries` is set.
+    """
+
+    def __init__(
+        self,
+        initial_period_sec: float = 0.1,
+        max_period_sec: float = 5.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        max_retries: Optional[int] = None,
+    ):
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"Jitter must be in range [0, 1], got {jitter}.")
+        self.initial_period_sec = initial_period_sec
+        self.max_period_sec = max_period_sec
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_retries = max_retries
+        self.n_retries = 0
+        self.period_sec = min(initial_period_sec, max_period_sec)
+
+    def wait_time_sec(self) -> float:
+        """Duration of the next wait, in seconds."""
+        return self.period_sec * (1 - self.jitter * random.random())
+
+    def step(self):
+        self.n_retries += 1
+        self.period_sec = min(self.period_sec * self.multiplier, self.max_period_sec)
+
+    def reset(self):
+        self.n_retries = 0
+        self.period_sec = min(self.initial_period_sec, self.max_period_sec)
+
+    def wait(self):
+        time.sleep(self.wait_time_sec())
+
+    async def async_wait(self):
+        await asyncio.sleep(self.wait_time_sec())
+
+    def is_done(self) -> bool:
+        return self.max_retries is not None and self.n_retries >= self.max_retries
+
+
+class EstimatedTimeRetry(RetryStrategy):
+    """Schedule the next check for submissions status at their estimated
+    completion time.
+
+    The turnaround time (queue time plus execution time) is estimated with an
+    exponential moving average over the `finished_at - created_at` times of
+    the finished submissions. Until the estimate is reached the strategy
+    sleeps for the remaining estimated time, afterwards the period backs off
+    exponentially. The period is always kept within
+    [`min_period_sec`, `max_period_sec`] and never exceeds the largest
+    `wall_time_limit` (or `cpu_time_limit`) of the pending submissions.
+    Retries indefinitely.
+
+    Every wait runs on a copy of the strategy, see
+    :meth:`RetryStrategy.reset`, but the turnaround time estimate is shared
+    by all copies, so it is kept between waits.
+    """
+
+    def __init__(
+        self,
+        min_period_sec: float = 0.1,
+        max_period_sec: float = 5.0,
+        smoothing: float = 0.5,
+    ):
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"Smoothing must be in range (0, 1], got {smoothing}.")
+        self.min_period_sec = min_period_sec
+        self.max_period_sec = max_period_sec
+        self.smoothing = smoothing
+        self.period_sec = min_period_sec
+        self.start_time = None
+        # Shallow copies share the estimate, as it is kept in a mutable object.
+        self._estimate = {"turnaround_time_sec": None}
+        self._estimate_lock = threading.Lock()
+
+    @property
+    def turnaround_time_sec(self) -> Optional[float]:
+        """Estimated turnaround time of a submission, in seconds."""
+        return self._estimate["turnaround_time_sec"]
+
+    def _update_estimate(self, turnaround_time: float) -> None:
+        with self._estimate_lock:
+            if self._estimate["turnaround_time_sec"] is None:
+                self._estimate["turnaround_time_sec"] = turnaround_time
+            else:
+                self._estimate["turnaround_time_sec"] = (
+                    self.smoothing * turnaround_time
+                    + (1 - self.smoothing) * self._estimate["turnaround_time_sec"]
+                )
+
+    def observe(
+        self,
+        pending_submissions: Submissions,
+        finished_submissions: Submissions,
+    ) -> None:
+        now = time.monotonic()
+        if self.start_time is None:
+            self.start_time = now
+
+        for submission in finished_submissions:
+            if submission.created_at is None or submission.finished_at is None:
+                continue
+            self._update_estimate(
+                (submission.finished_at - submission.created_at).total_seconds()
+            )
+
+        elapsed_time = now - self.start_time
+        if (
+            self.turnaround_time_sec is not None
+            and elapsed_time < self.turnaround_time_sec
+        ):
+            period = self.turnaround_time_sec - elapsed_time
+        else:
+            period = 2 * self.period_sec
+
+        time_limits = [
+            submission.wall_time_limit or submission.cpu_time_limit
+            for submission in pending_submissions
+            if submission.wall_time_limit or submission.cpu_time_limit
+        ]
+        max_period = self.max_period_sec
+        if time_limits:
+            max_period = min(max_period, max(time_limits))
+
+        self.period_sec = max(self.min_period_sec, min(period, max_period))
+
+    def reset(self):
+        self.period_sec = self.min_period_sec
+        self.start_time = time.monotonic()
+
+    def wait(self):
+        time.sleep(self.period_sec)
+
+    async def async_wait(self):
+        await asyncio.sleep(self.period_sec)
+
+    def is_done(self) -> bool:
+        return False
+
+
+def _get_retry_strategy(
+    client, retry_strategy: Optional[RetryStrategy]
+) -> RetryStrategy:
+    """Get the strategy of a single wait, defaulting to the client's one."""
+    if retry_strategy is None:
+        if client.retry_strategy is None:
+            retry_strategy = RegularPeriodRetry()
+        else:
+            retry_strategy = client.retry_strategy
+
+    # Work on a fresh copy so that the strategy shared by the client is
+    # neither exhausted nor modified by concurrent waits.
+    retry_strategy = copy.copy(retry_strategy)
+    retry_strategy.reset()
+    return retry_strategy
+
+
+class RequestRetryPolicy:
+    """Retry policy of HTTP requests that failed with a transient error.
+
+    Unlike a :class:`RetryStrategy`, which schedules polling for submission
+    status, the policy is applied by a client to every single request. A
+    request is retried after a connection error or a response with one of the
+    `status_codes`, after an exponential backoff with jitter, or after the
+    delay requested by the `Retry-After` header.
+
+    Retries are idempotency-aware. Requests with idempotent methods, e.g.
+    polling for submissions with GET, are always retried. Requests with other
+    methods, e.g. creating submissions with POST, are only retried if the
+    connection could not be established, since otherwise the server may have
+    already processed them and the retry could create duplicate submissions.
+    Set `retry_non_idempotent` to retry them in all cases.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        Maximum number of retries of a request.
+    initial_backoff_sec : float, optional
+        Delay before the first retry, doubled on every following retry.
+    max_backoff_sec : float, optional
+        Maximum delay before a retry.
+    jitter : float, optional
+        Maximum random fraction by which every delay is shortened.
+    status_codes : iterable of int, optional
+        Response status codes that are retried.
+    retry_non_idempotent : bool, optional
+        Retry requests with non-idempotent methods in all cases.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_backoff_sec: float = 0.5,
+        max_backoff_sec: float = 10.0,
+        jitter: float = 0.5,
+        status_codes: Iterable[int] = (502, 503, 504),
+        retry_non_idempotent: bool = False,
+    ):
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"Jitter must be in range [0, 1], got {jitter}.")
+        self.max_retries = max_retries
+        self.initial_backoff_sec = initial_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def _is_idempotent(self, method: str) -> bool:
+        return self.retry_non_idempotent or method.upper() in self.IDEMPOTENT_METHODS
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        """Check if a request that got a response with the status code should
+        be retried.
+        """
+        return status_code in self.status_codes and self._is_idempotent(method)
+
+    def is_retryable_error(self, method: str, *, connected: bool) -> bool:
+        """Check if a request that failed with a connection error should be
+        retried.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the request.
+        connected : bool
+            Whether the connection was established before the error, i.e.
+            the request might have reached the server.
+        """
+        return not connected or self._is_idempotent(method)
+
+    def backoff_sec(
+        self, n_retries: int, retry_after_sec: Optional[float] = None
+    ) -> float:
+        """Delay before the next retry, in seconds.
+
+        Parameters
+        ----------
+        n_retries : int
+            Number of times the request was already retried.
+        retry_after_sec : float, optional
+            Delay requested by the server, which takes precedence over the
+            backoff.
+        """
+        if retry_after_sec is not None:
+            return min(retry_after_sec, self.max_backoff_sec)
+        backoff = min(self.initial_backoff_sec * 2**n_retries, self.max_backoff_sec)
+        return backoff * (1 - self.jitter * random.random())
@@ -2,7 +2,7 @@ import copy
 from datetime import datetime
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, UUID4
+from pydantic import BaseModel, ConfigDict, Field, field_validator, PrivateAttr, UUID4
 
 from .base_types import Iterable, LanguageAlias, Status
 from .common import decode, encode
@@ -74,8 +74,10 @@ class Submission(BaseModel):
     ----------
     source_code : str, optional
         The source code to be executed.
-    language : LanguageAlias or int, optional
-        The programming language of the source code. Defaults to `LanguageAlias.PYTHON`.
+    language : LanguageAlias, int or str, optional
+        The programming language of the source code, given as an alias, a
+        language id or a language name (e.g. "Python (3.8.1)"). Defaults to
+        `LanguageAlias.PYTHON`.
     additional_files : base64 encoded string, optional
         Additional files that should be available alongside the source code.
         Value of this string should represent the content of a .zip that
@@ -124,10 +126,13 @@ class Submission(BaseModel):
         Number of times the code should be executed.
     callback_url : str, optional
         URL for a callback to report execution results or status.
+    max_wait_time : float, optional
+        Maximum time to wait for the submission to finish, in seconds. Only
+        used on the client side while waiting, and not sent to Judge0.
     """
 
     source_code: Optional[str] = Field(default=None, repr=True)
-    language: Union[LanguageAlias, int] = Field(
+    language: Union[LanguageAlias, int, str] = Field(
         default=LanguageAlias.PYTHON,
         repr=True,
     )
@@ -154,6 +159,9 @@ class Submission(BaseModel):
     number_of_runs: Optional[int] = Field(default=None, repr=True)
     callback_url: Optional[str] = Field(default=None, repr=True)
 
+    # Client-side submission attributes.
+    max_wait_time: Optional[float] = Field(default=None, repr=True)
+
     # Post-execution submission attributes.
     stdout: Optional[str] = Field(default=None, repr=True)
     stderr: Optional[str] = Field(default=None, repr=True)
@@ -170,6 +178,10 @@ class Submission(BaseModel):
     memory: Optional[float] = Field(default=None, repr=True)
     post_execution_filesystem: Optional[Filesystem] = Field(default=None, repr=True)
 
+    # Id of the client pool that created the submission and the index of the
+    # member of the pool that owns it, see judge0.ClientPool.
+    _pool_owner: Optional[tuple[int, int]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(extra="ignore")
 
     @field_validator(*ENCODED_FIELDS, mode="before")
@@ -272,6 +284,7 @@ class Submission(BaseModel):
         for attr in REQUEST_FIELDS:
             setattr(new_submission, attr, copy.deepcopy(getattr(self, attr)))
         new_submission.language = self.language
+        new_submission.max_wait_time = self.max_wait_time
         return new_submission
 
     def __iter__(self):
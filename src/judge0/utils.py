@@ -3,16 +3,39 @@
 from functools import wraps
 from http import HTTPStatus
 
-from requests import HTTPError
-
 from .errors import PreviewClientLimitError
 
+PREVIEW_CLIENT_CLASS_NAMES = (
+    "SuluJudge0CE",
+    "SuluJudge0ExtraCE",
+    "AsyncSuluJudge0CE",
+    "AsyncSuluJudge0ExtraCE",
+)
+
 
 def is_http_too_many_requests_error(exception: Exception) -> bool:
+    # Both requests.HTTPError and httpx.HTTPStatusError carry the response
+    # that caused them.
+    response = getattr(exception, "response", None)
     return (
-        isinstance(exception, HTTPError)
-        and exception.response is not None
-        and exception.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        response is not None
+        and getattr(response, "status_code", None) == HTTPStatus.TOO_MANY_REQUESTS
+    )
+
+
+def is_preview_client(instance) -> bool:
+    """Check if the instance is a preview (no API key) version of a client."""
+    return (
+        instance.__class__.__name__ in PREVIEW_CLIENT_CLASS_NAMES
+        and getattr(instance, "api_key", None) is None
+    )
+
+
+def _preview_client_limit_error(instance) -> PreviewClientLimitError:
+    return PreviewClientLimitError(
+        "You are using a preview version of a client and "
+        f"you've hit a rate limit on it. Visit {instance.HOME_URL} "
+        "to get your authentication credentials."
     )
 
 
@@ -21,28 +44,32 @@ def handle_too_many_requests_error_for_preview_client(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except HTTPError as err:
-            if is_http_too_many_requests_error(exception=err):
-                # If the raised exception is inside the one of the Sulu clients
-                # let's check if we are dealing with the implicit client.
-                if args:
-                    instance = args[0]
-                    class_name = instance.__class__.__name__
-                    # Check if we are using a preview version of the client.
-                    if (
-                        class_name in ("SuluJudge0CE", "SuluJudge0ExtraCE")
-                        and instance.api_key is None
-                    ):
-                        raise PreviewClientLimitError(
-                            "You are using a preview version of a client and "
-                            f"you've hit a rate limit on it. Visit {instance.HOME_URL} "
-                            "to get your authentication credentials."
-                        ) from err
-                else:
-                    raise err from None
-            else:
-                raise err from None
         except Exception as err:
+            # If the raised exception is inside the one of the Sulu clients
+            # let's check if we are dealing with the implicit client.
+            if (
+                is_http_too_many_requests_error(exception=err)
+                and args
+                and is_preview_client(args[0])
+            ):
+                raise _preview_client_limit_error(args[0]) from err
+            raise err from None
+
+    return wrapper
+
+
+def handle_too_many_requests_error_for_async_preview_client(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as err:
+            if (
+                is_http_too_many_requests_error(exception=err)
+                and args
+                and is_preview_client(args[0])
+            ):
+                raise _preview_client_limit_error(args[0]) from err
             raise err from None
 
     return wrapper
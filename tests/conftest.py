@@ -1,13 +1,150 @@
+import json
 import os
+import threading
+import uuid
+
+from collections import Counter
 
 import pytest
+import requests
 from dotenv import load_dotenv
 
-from judge0 import clients
+from judge0 import clients, RegularPeriodRetry
+from judge0.base_types import Config, Language
+from judge0.common import encode
 
 load_dotenv()
 
 
+class StubClient(clients.Client):
+    """Client of an in-memory Judge0 server.
+
+    A submission is done after its status was requested `n_polls` times, and
+    its stdout is its stdin. The stub counts the calls of every method, logs
+    them in order and tracks the largest number of submissions in flight,
+    i.e. created but not yet reported as done.
+    """
+
+    def __init__(self, n_polls: int = 2, **kwargs):
+        kwargs.setdefault("retry_strategy", RegularPeriodRetry(0))
+        super().__init__("http://judge0.stub", None, **kwargs)
+        self._version = "1.13.1"
+        self._languages = [Language(id=71, name="Python (3.8.1)")]
+        self._config = Config.model_construct(
+            enable_additional_files=False,
+            enable_wait_result=False,
+            max_queue_size=100,
+            max_submission_batch_size=20,
+        )
+        self.n_polls = n_polls
+        self.calls = Counter()
+        self.log = []
+        self.n_in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._submissions = {}
+
+    def _record_call(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            self.log.append(name)
+
+    def _create(self, submission):
+        token = str(uuid.uuid4())
+        with self._lock:
+            self._submissions[token] = {"stdin": submission.stdin, "polls": 0}
+            self.n_in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.n_in_flight)
+        submission.token = token
+        return submission
+
+    def _get(self, submission, fields):
+        with self._lock:
+            state = self._submissions[str(submission.token)]
+            state["polls"] += 1
+            done = state["polls"] >= self.n_polls
+            if state["polls"] == self.n_polls:
+                self.n_in_flight -= 1
+        attrs = {
+            "token": str(submission.token),
+            "status": {"id": 3 if done else 1},
+            "stdout": encode(state["stdin"] or "") if done else None,
+        }
+        if fields is not None and fields != "*":
+            fields = [fields] if isinstance(fields, str) else fields
+            attrs = {key: value for key, value in attrs.items() if key in fields}
+        submission.set_attributes(attrs)
+        return submission
+
+    def create_submission(self, submission, *, wait=False, wait_timeout=None):
+        self._record_call("create_submission")
+        return self._create(submission)
+
+    def create_submissions(self, submissions):
+        self._record_call("create_submissions")
+        return [self._create(submission) for submission in submissions]
+
+    def get_submission(self, submission, *, fields=None):
+        self._record_call("get_submission")
+        return self._get(submission, fields)
+
+    def get_submissions(self, submissions, *, fields=None):
+        self._record_call("get_submissions")
+        return [self._get(submission, fields) for submission in submissions]
+
+
+@pytest.fixture
+def stub_client():
+    return StubClient()
+
+
+def make_response(
+    status_code: int = 200, json_data=None, headers: dict = None
+) -> requests.Response:
+    """Make a response of the requests library."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(json_data).encode()
+    return response
+
+
+class ScriptedSession:
+    """Replacement of a session's `request` that replays scripted outcomes.
+
+    Every outcome is either a response that is returned or an exception that
+    is raised. The methods of the sent requests are logged in order.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.methods = []
+
+    def request(self, method, url, **kwargs):
+        self.methods.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def script_responses(monkeypatch):
+    """Replay the outcomes instead of sending the requests of the client."""
+
+    def script(client, outcomes) -> ScriptedSession:
+        session = ScriptedSession(outcomes)
+        monkeypatch.setattr(client.session, "request", session.request)
+        return session
+
+    return script
+
+
+@pytest.fixture(name="make_response")
+def make_response_fixture():
+    return make_response
+
+
 @pytest.fixture(scope="session")
 def judge0_ce_client():
     api_key = os.getenv("JUDGE0_TEST_API_KEY")
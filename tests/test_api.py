@@ -1,8 +1,17 @@
+import copy
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
 import judge0
 import pytest
+import requests
 
-from judge0 import Flavor, LanguageAlias, Submission
+from judge0 import Flavor, LanguageAlias, MaxRetries, Status, Submission
 from judge0.api import _resolve_client
+from judge0.errors import SubmissionBatchError
+from judge0.poller import get_poller, POLLING_FIELDS
 
 DEFAULT_CLIENTS = (
     "atd_ce_client",
@@ -104,3 +113,391 @@ def test_resolve_client_common_extra_ce_client():
         _resolve_client(submissions=submissions)
         is judge0.JUDGE0_IMPLICIT_EXTRA_CE_CLIENT
     )
+
+
+def test_as_completed(request):
+    client = request.getfixturevalue("judge0_ce_client")
+    submissions = [
+        Submission(source_code=f"print({i})", expected_output=f"{i}") for i in range(42)
+    ]
+    submissions = judge0.async_execute(client=client, submissions=submissions)
+
+    finished = list(judge0.as_completed(client=client, submissions=submissions))
+
+    assert len(finished) == len(submissions)
+    assert all(submission.is_done() for submission in finished)
+
+
+def test_pipelined_run(request):
+    client = request.getfixturevalue("judge0_ce_client")
+    test_cases = [(f"{i}", f"{i}") for i in range(42)]
+
+    submissions = judge0.run(
+        client=client,
+        source_code="print(input())",
+        test_cases=test_cases,
+        pipeline=True,
+    )
+
+    assert len(submissions) == len(test_cases)
+    assert all(submission.status == Status.ACCEPTED for submission in submissions)
+
+
+def test_offline_pipelined_run_overlaps_creation_and_polling(stub_client, monkeypatch):
+    create_submissions = stub_client.create_submissions
+
+    def slow_create_submissions(submissions):
+        time.sleep(0.05)
+        return create_submissions(submissions)
+
+    monkeypatch.setattr(stub_client, "create_submissions", slow_create_submissions)
+    test_cases = [(f"{i}", f"{i}") for i in range(60)]
+
+    submissions = judge0.run(
+        client=stub_client,
+        source_code="print(input())",
+        test_cases=test_cases,
+        pipeline=True,
+    )
+
+    assert [submission.stdout for submission in submissions] == [
+        f"{i}" for i in range(60)
+    ]
+    assert stub_client.calls["create_submissions"] == 3
+    # Created batches are polled for while the next ones are being created.
+    last_create_idx = (
+        len(stub_client.log) - 1 - stub_client.log[::-1].index("create_submissions")
+    )
+    assert "get_submissions" in stub_client.log[:last_create_idx]
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 4, 7])
+def test_offline_run_with_bounded_in_flight_window(stub_client, max_in_flight):
+    stub_client.n_polls = 3
+    test_cases = [(f"{i}", f"{i}") for i in range(30)]
+
+    submissions = judge0.run(
+        client=stub_client,
+        source_code="print(input())",
+        test_cases=test_cases,
+        max_in_flight=max_in_flight,
+    )
+
+    assert all(submission.status == Status.ACCEPTED for submission in submissions)
+    assert stub_client.max_in_flight == max_in_flight
+
+
+def test_in_flight_window_reports_batches_not_created(stub_client):
+    stub_client.n_polls = 100
+    stub_client.retry_strategy = MaxRetries(max_retries=1, wait_time_sec=0)
+    test_cases = [(f"{i}", f"{i}") for i in range(6)]
+
+    with pytest.raises(SubmissionBatchError) as exc_info:
+        judge0.run(
+            client=stub_client,
+            source_code="print(input())",
+            test_cases=test_cases,
+            max_in_flight=2,
+        )
+
+    assert set(exc_info.value.errors) == {1, 2}
+
+
+def test_in_flight_window_must_admit_submissions(stub_client):
+    with pytest.raises(ValueError):
+        judge0.run(
+            client=stub_client,
+            source_code="print(input())",
+            test_cases=[("1", "1"), ("2", "2")],
+            max_in_flight=0,
+        )
+
+
+def test_wait_polls_status_and_fetches_finished_submissions_once(
+    stub_client, monkeypatch
+):
+    stub_client.n_polls = 3
+    get_submissions = stub_client.get_submissions
+    requested_fields = []
+
+    def recording_get_submissions(submissions, *, fields=None):
+        requested_fields.append(fields)
+        return get_submissions(submissions, fields=fields)
+
+    monkeypatch.setattr(stub_client, "get_submissions", recording_get_submissions)
+    submissions = judge0.api.create_submissions(
+        client=stub_client,
+        submissions=[
+            Submission(source_code="print(input())", stdin=f"{i}") for i in range(3)
+        ],
+    )
+
+    judge0.wait(client=stub_client, submissions=submissions, fields=["stdout"])
+
+    assert requested_fields == [POLLING_FIELDS] * 3 + [["stdout"]]
+    assert [submission.stdout for submission in submissions] == ["0", "1", "2"]
+    assert stub_client.calls["get_submission"] == 0
+
+
+def test_concurrent_batches_keep_submission_order(stub_client, monkeypatch):
+    stub_client.n_polls = 1
+    stub_client.config.max_submission_batch_size = 3
+    create_submissions = stub_client.create_submissions
+    lock = threading.Lock()
+    n_concurrent = 0
+    max_concurrent = 0
+
+    def slow_create_submissions(submissions):
+        nonlocal n_concurrent, max_concurrent
+        with lock:
+            n_concurrent += 1
+            max_concurrent = max(max_concurrent, n_concurrent)
+        # Later batches finish first.
+        time.sleep(0.01 * (10 - int(submissions[0].stdin) // 3))
+        try:
+            return create_submissions(submissions)
+        finally:
+            with lock:
+                n_concurrent -= 1
+
+    monkeypatch.setattr(stub_client, "create_submissions", slow_create_submissions)
+    submissions = [
+        Submission(source_code="print(input())", stdin=f"{i}") for i in range(10)
+    ]
+
+    result = judge0.api.create_submissions(
+        client=stub_client, submissions=submissions, max_workers=4
+    )
+    judge0.api.get_submissions(client=stub_client, submissions=result, max_workers=4)
+
+    assert max_concurrent > 1
+    assert [submission.stdin for submission in result] == [f"{i}" for i in range(10)]
+    assert [submission.stdout for submission in result] == [f"{i}" for i in range(10)]
+    assert stub_client.calls["create_submissions"] == 3
+    assert stub_client.calls["create_submission"] == 1
+
+
+def test_concurrent_batches_aggregate_errors(stub_client, monkeypatch):
+    stub_client.config.max_submission_batch_size = 2
+    create_submissions = stub_client.create_submissions
+
+    def failing_create_submissions(submissions):
+        if submissions[0].stdin in ("2", "6"):
+            raise requests.HTTPError(f"Batch of {submissions[0].stdin} failed.")
+        return create_submissions(submissions)
+
+    monkeypatch.setattr(stub_client, "create_submissions", failing_create_submissions)
+    submissions = [
+        Submission(source_code="print(input())", stdin=f"{i}") for i in range(8)
+    ]
+
+    with pytest.raises(SubmissionBatchError) as exc_info:
+        judge0.api.create_submissions(
+            client=stub_client, submissions=submissions, max_workers=4
+        )
+
+    assert set(exc_info.value.errors) == {1, 3}
+    assert all(
+        isinstance(error, requests.HTTPError)
+        for error in exc_info.value.errors.values()
+    )
+    # Submissions of the other batches are still created.
+    assert [
+        idx for idx, submission in enumerate(submissions) if submission.token is None
+    ] == [2, 3, 6, 7]
+
+
+def test_run_with_bounded_in_flight_window(request):
+    client = request.getfixturevalue("judge0_ce_client")
+    test_cases = [(f"{i}", f"{i}") for i in range(12)]
+
+    submissions = judge0.run(
+        client=client,
+        source_code="print(input())",
+        test_cases=test_cases,
+        max_in_flight=5,
+    )
+
+    assert len(submissions) == len(test_cases)
+    assert all(submission.status == Status.ACCEPTED for submission in submissions)
+    assert [submission.stdout for submission in submissions] == [
+        f"{i}\n" for i in range(12)
+    ]
+
+
+def test_run_with_server_wait(request):
+    client = request.getfixturevalue("judge0_ce_client")
+
+    submission = judge0.run(
+        client=client,
+        source_code="print(input())",
+        stdin="42",
+        server_wait=True,
+    )
+
+    assert submission.status == Status.ACCEPTED
+    assert submission.stdout == "42\n"
+
+
+def stub_server_wait(stub_client, monkeypatch, error):
+    stub_client.config.wall_time_limit = 5.0
+    stub_client.config.number_of_runs = 2
+    create_submission = stub_client.create_submission
+    wait_timeouts = []
+
+    def create_submission_with_timeout(submission, *, wait=False, wait_timeout=None):
+        if wait:
+            wait_timeouts.append(wait_timeout)
+            raise error()
+        return create_submission(submission)
+
+    monkeypatch.setattr(
+        stub_client, "create_submission", create_submission_with_timeout
+    )
+    return wait_timeouts
+
+
+def test_server_wait_connect_timeout_falls_back_to_polling(stub_client, monkeypatch):
+    stub_server_wait(stub_client, monkeypatch, requests.ConnectTimeout)
+
+    submission = judge0.run(
+        client=stub_client, source_code="print(input())", stdin="42", server_wait=True
+    )
+
+    assert submission.status == Status.ACCEPTED
+    assert stub_client.calls["create_submission"] == 1
+
+
+def test_server_wait_read_timeout_is_not_created_again(stub_client, monkeypatch):
+    wait_timeouts = stub_server_wait(stub_client, monkeypatch, requests.ReadTimeout)
+
+    with pytest.raises(requests.ReadTimeout):
+        judge0.run(
+            client=stub_client,
+            source_code="print(input())",
+            stdin="42",
+            server_wait=True,
+        )
+
+    assert wait_timeouts == [5.0 * 2 + judge0.api.SERVER_WAIT_TIMEOUT_MARGIN_SEC]
+    assert stub_client.calls["create_submission"] == 0
+
+
+def test_wait_with_shared_poller(request):
+    client = request.getfixturevalue("judge0_ce_client")
+    submissions = [
+        Submission(source_code=f"print({i})", language=LanguageAlias.PYTHON)
+        for i in range(4)
+    ]
+    judge0.api.create_submissions(client=client, submissions=submissions)
+
+    with ThreadPoolExecutor(max_workers=len(submissions)) as executor:
+        list(
+            executor.map(
+                lambda submission: judge0.wait(
+                    client=client, submissions=submission, shared_poller=True
+                ),
+                submissions,
+            )
+        )
+
+    assert [submission.stdout for submission in submissions] == [
+        f"{i}\n" for i in range(4)
+    ]
+
+
+def test_shared_poller_polls_once_per_round(stub_client, monkeypatch):
+    n_waiters = 8
+    submissions = judge0.api.create_submissions(
+        client=stub_client,
+        submissions=[
+            Submission(source_code="print(input())", stdin=f"{i}") for i in range(2)
+        ],
+    )
+    poller = get_poller(stub_client)
+    all_registered = threading.Event()
+    get_submissions = stub_client.get_submissions
+
+    def gated_get_submissions(submissions, *, fields=None):
+        # Start polling only once all waiters are registered.
+        all_registered.wait(5)
+        return get_submissions(submissions, fields=fields)
+
+    monkeypatch.setattr(stub_client, "get_submissions", gated_get_submissions)
+
+    with ThreadPoolExecutor(max_workers=n_waiters) as executor:
+        futures = [
+            executor.submit(
+                judge0.wait,
+                client=stub_client,
+                submissions=copy.deepcopy(submissions),
+                shared_poller=True,
+            )
+            for _ in range(n_waiters)
+        ]
+        while len(poller._waiters) < n_waiters:
+            time.sleep(0.001)
+        all_registered.set()
+        results = [future.result() for future in futures]
+
+    assert all(
+        [submission.stdout for submission in result] == ["0", "1"] for result in results
+    )
+    # Two status polling rounds and a single fetch of the finished submissions.
+    assert stub_client.calls["get_submissions"] == stub_client.n_polls + 1
+    assert stub_client.calls["get_submission"] == 0
+
+
+def test_shared_poller_uses_client_retry_strategy(stub_client):
+    stub_client.n_polls = 100
+    stub_client.retry_strategy = MaxRetries(max_retries=2, wait_time_sec=0)
+    submission = judge0.api.create_submissions(
+        client=stub_client,
+        submissions=Submission(source_code="print(input())", stdin="1"),
+    )
+
+    judge0.wait(client=stub_client, submissions=submission, shared_poller=True)
+
+    assert not submission.is_done()
+    assert stub_client.calls["get_submission"] == 2
+
+
+def test_shared_poller_keeps_budget_of_late_waiters(stub_client):
+    stub_client.n_polls = 100
+    stub_client.retry_strategy = MaxRetries(max_retries=6, wait_time_sec=0.02)
+    first, second = judge0.api.create_submissions(
+        client=stub_client,
+        submissions=[
+            Submission(source_code="print(input())", stdin=f"{i}") for i in range(2)
+        ],
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            judge0.wait, client=stub_client, submissions=first, shared_poller=True
+        )
+        while stub_client.calls["get_submission"] < 4:
+            time.sleep(0.001)
+        judge0.wait(client=stub_client, submissions=second, shared_poller=True)
+        future.result()
+
+    polls = {token: state["polls"] for token, state in stub_client._submissions.items()}
+    # The late waiter is polled as often as if it waited on its own.
+    assert polls[str(first.token)] == 6
+    assert polls[str(second.token)] == 6
+
+
+def test_run_with_deduplication(request):
+    client = request.getfixturevalue("judge0_ce_client")
+    test_cases = [("1", "1"), ("2", "2"), ("1", "1")]
+
+    submissions = judge0.run(
+        client=client,
+        source_code="print(input())",
+        test_cases=test_cases,
+        deduplicate=True,
+    )
+
+    assert [submission.stdout for submission in submissions] == ["1\n", "2\n", "1\n"]
+    assert submissions[0].token == submissions[2].token
+    assert submissions[0].token != submissions[1].token
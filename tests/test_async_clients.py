@@ -0,0 +1,154 @@
+import asyncio
+import os
+
+import pytest
+
+from judge0 import aio, async_clients, Flavor, MaxRetries, Status, Submission
+from judge0.base_types import Config, Language
+from judge0.errors import SubmissionBatchError
+
+DEFAULT_CLIENTS = (
+    (async_clients.AsyncATDJudge0CE, "JUDGE0_ATD_API_KEY"),
+    (async_clients.AsyncATDJudge0ExtraCE, "JUDGE0_ATD_API_KEY"),
+    (async_clients.AsyncRapidJudge0CE, "JUDGE0_RAPID_API_KEY"),
+    (async_clients.AsyncRapidJudge0ExtraCE, "JUDGE0_RAPID_API_KEY"),
+    (async_clients.AsyncSuluJudge0CE, "JUDGE0_SULU_API_KEY"),
+    (async_clients.AsyncSuluJudge0ExtraCE, "JUDGE0_SULU_API_KEY"),
+)
+
+
+def test_metadata_requires_bootstrap():
+    client = async_clients.AsyncClient("http://localhost", None)
+
+    assert not client.is_bootstrapped
+    with pytest.raises(RuntimeError):
+        client.languages
+
+
+@pytest.mark.parametrize("client_class,api_key_env", DEFAULT_CLIENTS)
+def test_bootstrap(client_class, api_key_env):
+    async def bootstrap():
+        async with client_class(os.getenv(api_key_env)) as client:
+            return client.languages, client.config, client.version
+
+    languages, config, version = asyncio.run(bootstrap())
+
+    assert len(languages) > 0
+    assert config.max_submission_batch_size > 0
+    assert version
+
+
+def test_run(request):
+    sync_client = request.getfixturevalue("judge0_ce_client")
+
+    async def run():
+        async with async_clients.AsyncClient(
+            sync_client.endpoint, sync_client.auth_headers
+        ) as client:
+            submissions = [
+                Submission(source_code=f"print({i})", expected_output=f"{i}")
+                for i in range(42)
+            ]
+            return await aio.run(client=client, submissions=submissions)
+
+    results = asyncio.run(run())
+
+    assert len(results) == 42
+    assert all(result.status == Status.ACCEPTED for result in results)
+
+
+class StubAsyncClient(async_clients.AsyncClient):
+    """Async client that tracks the number of concurrently created batches."""
+
+    def __init__(self):
+        super().__init__("http://judge0.stub", None)
+        self._version = "1.13.1"
+        self._languages = [Language(id=71, name="Python (3.8.1)")]
+        self._config = Config.model_construct(max_submission_batch_size=2)
+        self.n_concurrent = 0
+        self.max_concurrent = 0
+        # Ids of the submissions whose batch fails to be created.
+        self.failing_submissions = set()
+
+    async def create_submissions(self, submissions):
+        self.n_concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.n_concurrent)
+        await asyncio.sleep(0.01)
+        self.n_concurrent -= 1
+        if any(
+            id(submission) in self.failing_submissions for submission in submissions
+        ):
+            raise RuntimeError("Batch failed.")
+        for submission in submissions:
+            submission.token = str(id(submission))
+        return submissions
+
+    async def create_submission(self, submission, **kwargs):
+        return (await self.create_submissions([submission]))[0]
+
+    async def get_submissions(self, submissions, *, fields=None):
+        # Submissions are done on the second poll.
+        for submission in submissions:
+            done = submission.status in (Status.IN_QUEUE, Status.ACCEPTED)
+            submission.status = Status.ACCEPTED if done else Status.IN_QUEUE
+        return submissions
+
+    async def get_submission(self, submission, *, fields=None):
+        return (await self.get_submissions([submission], fields=fields))[0]
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_create_submissions_bounds_concurrent_batches(max_workers):
+    client = StubAsyncClient()
+    submissions = [Submission(source_code=f"print({i})") for i in range(20)]
+
+    created = asyncio.run(
+        aio.create_submissions(
+            client=client, submissions=submissions, max_workers=max_workers
+        )
+    )
+
+    assert created == submissions
+    assert all(submission.token is not None for submission in created)
+    assert client.max_concurrent == max_workers
+
+
+def test_create_submissions_reports_failed_batches():
+    client = StubAsyncClient()
+    submissions = [Submission(source_code=f"print({i})") for i in range(10)]
+    client.failing_submissions = {id(submissions[2]), id(submissions[7])}
+
+    with pytest.raises(SubmissionBatchError) as exc_info:
+        asyncio.run(aio.create_submissions(client=client, submissions=submissions))
+
+    assert set(exc_info.value.errors) == {1, 3}
+    # The other batches are still created.
+    assert [
+        idx for idx, submission in enumerate(submissions) if submission.token is None
+    ] == [2, 3, 6, 7]
+
+
+def test_wait_polls_until_done():
+    client = StubAsyncClient()
+    submissions = [Submission(source_code=f"print({i})") for i in range(5)]
+
+    async def create_and_wait():
+        await aio.create_submissions(client=client, submissions=submissions)
+        return await aio.wait(
+            client=client, submissions=submissions, retry_strategy=MaxRetries(5, 0)
+        )
+
+    asyncio.run(create_and_wait())
+
+    assert all(submission.status == Status.ACCEPTED for submission in submissions)
+
+
+def test_implicit_client_is_bound_to_event_loop():
+    async def get_clients():
+        return aio.get_client(Flavor.CE), aio.get_client(Flavor.CE)
+
+    first_client, same_client = asyncio.run(get_clients())
+    second_client, _ = asyncio.run(get_clients())
+
+    assert first_client is same_client
+    assert first_client is not second_client
@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import judge0
+import pytest
+
+from judge0 import DirectoryResultCache, MetadataCache, ResultCache, Status, Submission
+
+ENDPOINT = "https://judge0-ce.example.com"
+
+
+def test_metadata_cache_roundtrip(tmp_path):
+    cache = MetadataCache(tmp_path)
+
+    assert cache.get(ENDPOINT, "about") is None
+
+    cache.set(ENDPOINT, "about", {"version": "1.14.0"})
+
+    assert cache.get(ENDPOINT, "about") == {"version": "1.14.0"}
+    assert cache.load(ENDPOINT) == {"about": {"version": "1.14.0"}}
+    assert cache.get("https://other.example.com", "about") is None
+
+
+def test_metadata_cache_ttl(tmp_path):
+    cache = MetadataCache(tmp_path, ttl_sec=-1)
+    cache.set(ENDPOINT, "about", {"version": "1.14.0"})
+
+    assert cache.get(ENDPOINT, "about") is None
+
+
+def test_metadata_cache_invalidate(tmp_path):
+    cache = MetadataCache(tmp_path)
+    cache.store(ENDPOINT, {"about": {"version": "1.14.0"}, "languages": []})
+
+    cache.invalidate(ENDPOINT, "about")
+
+    assert cache.load(ENDPOINT) == {"languages": []}
+
+    cache.invalidate()
+
+    assert cache.load(ENDPOINT) == {}
+
+
+def finished_submission(stdout="42\n", status=Status.ACCEPTED):
+    submission = Submission(source_code="print(42)")
+    submission.set_attributes(
+        {
+            "token": "8f3bca0e-a2c9-4a2b-b4a6-86a0b7f2f1b2",
+            "status": {"id": status.value},
+            "stdout": "NDIK",
+            "time": "0.01",
+            "memory": 3000,
+            "finished_at": "2024-09-25T12:36:48.012Z",
+        }
+    )
+    return submission
+
+
+@pytest.mark.parametrize("cache_class", [ResultCache, DirectoryResultCache])
+def test_result_cache_roundtrip(cache_class, tmp_path):
+    cache = cache_class(tmp_path)
+    submission = Submission(source_code="print(42)")
+
+    assert not cache.load("key", submission)
+
+    cache.store("key", finished_submission())
+
+    assert cache.load("key", submission)
+    assert submission.status == Status.ACCEPTED
+    assert submission.stdout == "42\n"
+    assert submission.time == 0.01
+    assert submission.finished_at.year == 2024
+    assert submission.token is None
+
+
+@pytest.mark.parametrize("cache_class", [ResultCache, DirectoryResultCache])
+def test_result_cache_eviction(cache_class, tmp_path):
+    cache = cache_class(tmp_path, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.store(key, finished_submission())
+
+    loaded = [cache.load(key, Submission()) for key in ("a", "b", "c")]
+    assert loaded.count(True) == 2
+
+    cache = cache_class(tmp_path, ttl_sec=-1)
+    assert not any(cache.load(key, Submission()) for key in ("a", "b", "c"))
+
+
+def test_result_cache_deterministic_only():
+    accepted = finished_submission()
+    time_limit_exceeded = finished_submission(status=Status.TIME_LIMIT_EXCEEDED)
+
+    assert ResultCache.is_cacheable(accepted)
+    assert not ResultCache.is_cacheable(time_limit_exceeded)
+    assert ResultCache.is_cacheable(time_limit_exceeded, deterministic_only=False)
+    assert not ResultCache.is_cacheable(Submission())
+
+
+def test_directory_result_cache_scans_only_to_evict(tmp_path, monkeypatch):
+    cache = DirectoryResultCache(tmp_path, max_entries=100)
+    n_scans = 0
+    glob = Path.glob
+
+    def counting_glob(self, pattern):
+        nonlocal n_scans
+        n_scans += 1
+        return glob(self, pattern)
+
+    monkeypatch.setattr(Path, "glob", counting_glob)
+    for i in range(300):
+        cache.store(f"{i}", finished_submission())
+
+    assert len(list(cache.path.glob("*.json"))) <= 100
+    # One count on the first store and an eviction every tenth of the entries.
+    assert n_scans <= 25
+    # The most recently stored entries are kept.
+    assert cache.load("299", Submission())
+
+
+def test_run_without_waiting_skips_result_cache(stub_client, tmp_path):
+    cache = ResultCache(tmp_path)
+    judge0.run(
+        client=stub_client,
+        source_code="print(input())",
+        stdin="1",
+        result_cache=cache,
+    )
+
+    submission = judge0.async_run(
+        client=stub_client,
+        source_code="print(input())",
+        stdin="1",
+        result_cache=cache,
+    )
+
+    assert stub_client.calls["create_submission"] == 2
+    assert submission.token is not None
+    assert not submission.is_done()
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+import requests
+
+from judge0 import CallbackReceiver, Status, Submission, wait
+from judge0.common import encode
+
+TOKEN = "8f3bca0e-a2c9-4a2b-b4a6-86a0b7f2f1b2"
+
+
+def send_result(receiver, token, status_id=3, stdout="42\n"):
+    return requests.put(
+        receiver.callback_url,
+        json={"token": token, "status": {"id": status_id}, "stdout": encode(stdout)},
+    )
+
+
+def test_result_received_before_wait():
+    with CallbackReceiver() as receiver:
+        assert send_result(receiver, TOKEN).status_code == 204
+
+        submission = Submission(source_code="print(42)", token=TOKEN)
+        pending = receiver.wait([submission], timeout=1)
+
+    assert pending == []
+    assert submission.status == Status.ACCEPTED
+    assert submission.stdout == "42\n"
+
+
+def test_unfinished_and_missing_results_are_pending():
+    with CallbackReceiver() as receiver:
+        send_result(receiver, TOKEN, status_id=2)
+        submission = Submission(source_code="print(42)", token=TOKEN)
+
+        assert receiver.wait([submission], timeout=0.05) == [submission]
+        assert submission.status is None
+
+
+def test_invalid_result_is_rejected():
+    with CallbackReceiver() as receiver:
+        response = requests.put(receiver.callback_url, data="not json")
+
+    assert response.status_code == 400
+
+
+def test_callback_url_requires_running_receiver():
+    with pytest.raises(RuntimeError):
+        CallbackReceiver().callback_url
+
+    receiver = CallbackReceiver(public_url="https://example.com/judge0")
+    assert receiver.callback_url == "https://example.com/judge0"
+
+
+def test_wait_polls_submissions_with_other_callback_url(stub_client):
+    with CallbackReceiver() as receiver:
+        send_result(receiver, TOKEN)
+        received = Submission(
+            source_code="print(42)", token=TOKEN, callback_url=receiver.callback_url
+        )
+        polled = stub_client.create_submission(
+            Submission(
+                source_code="print(input())",
+                stdin="7",
+                callback_url="https://example.com/judge0",
+            )
+        )
+
+        start_time = time.monotonic()
+        wait(
+            client=stub_client,
+            submissions=[received, polled],
+            callback_receiver=receiver,
+            callback_timeout=5,
+        )
+
+    assert time.monotonic() - start_time < 1
+    assert received.stdout == "42\n"
+    assert polled.status == Status.ACCEPTED
+    assert polled.stdout == "7"
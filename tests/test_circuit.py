@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from judge0 import CircuitBreaker, Client, RateLimiter
+from judge0.async_clients import AsyncClient
+from judge0.errors import CircuitOpenError
+
+
+def test_circuit_opens_on_failure_rate():
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, min_requests=4)
+
+    for success in [True, False, True]:
+        breaker.before_request()
+        breaker.record(success)
+    assert breaker.state == "closed"
+
+    breaker.before_request()
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_slow_requests_count_as_failures():
+    breaker = CircuitBreaker(latency_threshold_sec=1.0, min_requests=2)
+
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record(True, latency_sec=2.0)
+
+    assert breaker.state == "open"
+
+
+def test_half_open_circuit_probes():
+    breaker = CircuitBreaker(min_requests=1, open_duration_sec=0.05)
+    breaker.before_request()
+    breaker.record(False)
+
+    time.sleep(0.05)
+    assert breaker.state == "half_open"
+
+    breaker.before_request()
+    # Only a single probe request is let through at a time.
+    assert not breaker.allows_requests()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record(True)
+    assert breaker.state == "closed"
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker(min_requests=1, open_duration_sec=0.05)
+    breaker.before_request()
+    breaker.record(False)
+    time.sleep(0.05)
+
+    breaker.before_request()
+    breaker.record(False)
+
+    assert breaker.state == "open"
+
+
+def half_open_breaker():
+    breaker = CircuitBreaker(min_requests=1, open_duration_sec=0.05)
+    breaker.before_request()
+    breaker.record(False)
+    time.sleep(0.05)
+    return breaker
+
+
+def test_probe_with_unexpected_error_is_recorded(monkeypatch):
+    breaker = half_open_breaker()
+    client = Client("http://localhost:1", None, circuit_breaker=breaker)
+
+    def request(*args, **kwargs):
+        raise requests.exceptions.ChunkedEncodingError()
+
+    monkeypatch.setattr(client.session, "request", request)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.get_about()
+
+    assert breaker.state == "open"
+
+
+def test_cancelled_probe_is_released(monkeypatch):
+    breaker = half_open_breaker()
+    client = AsyncClient("http://localhost:1", None, circuit_breaker=breaker)
+
+    async def request(*args, **kwargs):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(client.session, "request", request)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(client._request("GET", "/about", route="about"))
+
+    assert breaker.state == "half_open"
+    assert breaker.allows_requests()
+
+
+def test_rate_limited_responses_are_not_failures(script_responses, make_response):
+    breaker = CircuitBreaker(min_requests=2)
+    client = Client(
+        "http://localhost:1",
+        None,
+        circuit_breaker=breaker,
+        rate_limiter=RateLimiter(max_retries=5),
+    )
+    session = script_responses(
+        client,
+        [make_response(429, headers={"Retry-After": "0"})] * 5
+        + [make_response(200, {"version": "1.13.1"})],
+    )
+
+    assert client.get_about() == {"version": "1.13.1"}
+    assert len(session.methods) == 6
+    assert breaker.state == "closed"
@@ -1,4 +1,13 @@
+import socket
+import threading
+import time
+
 import pytest
+import requests
+from judge0 import ATDJudge0CE, Client, RateLimiter, RequestRetryPolicy, SuluJudge0CE
+from judge0.clients import _BaseClient
+from judge0.data import LANGUAGE_TO_LANGUAGE_ID
+from judge0.errors import PreviewClientLimitError
 
 DEFAULT_CLIENTS = (
     "atd_ce_client",
@@ -44,3 +53,217 @@ def test_is_language_supported_multi_file_submission(client, request):
 def test_is_language_supported_non_valid_lang_id(client, request):
     client = request.getfixturevalue(client)
     assert not client.is_language_supported(-1)
+
+
+def test_client_metadata_is_loaded_lazily():
+    # No request is sent on construction, so an unreachable endpoint is fine.
+    client = Client("http://localhost:1", None)
+
+    assert not client.is_bootstrapped
+
+
+def test_base_client_is_abstract():
+    with pytest.raises(TypeError):
+        _BaseClient("http://localhost:1", None)
+
+
+def test_authentication_error_of_self_hosted_client(script_responses, make_response):
+    client = Client("http://localhost:1", None)
+    script_responses(client, [make_response(401)] * 3)
+
+    with pytest.raises(RuntimeError, match="Visit http://localhost:1 "):
+        client.config
+
+
+def test_client_connection_pool_options():
+    client = Client(
+        "http://localhost:1",
+        None,
+        timeout=(1, 5),
+        pool_maxsize=32,
+        keep_alive=False,
+    )
+
+    assert client.pool_maxsize == 32
+    assert client.session.headers["Connection"] == "close"
+    assert client.timeout == (1, 5)
+
+
+@pytest.fixture
+def listening_socket():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(32)
+    connections = []
+
+    def accept():
+        while True:
+            try:
+                connections.append(server.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield server, connections
+    server.close()
+    for connection in connections:
+        connection.close()
+
+
+@pytest.mark.parametrize("pool_block", [False, True])
+def test_prewarm_is_capped_at_pool_size(listening_socket, pool_block):
+    server, connections = listening_socket
+    host, port = server.getsockname()
+
+    Client(
+        f"http://{host}:{port}",
+        None,
+        pool_maxsize=4,
+        pool_block=pool_block,
+        prewarm_connections=10,
+    )
+
+    time.sleep(0.1)
+    assert len(connections) == 4
+
+
+def test_prewarm_of_unreachable_endpoint_is_skipped():
+    with socket.socket() as unused_socket:
+        unused_socket.bind(("127.0.0.1", 0))
+        host, port = unused_socket.getsockname()
+
+    client = Client(
+        f"http://{host}:{port}",
+        None,
+        pool_maxsize=2,
+        pool_block=True,
+        prewarm_connections=2,
+    )
+
+    pool = client.session.get_adapter(client.endpoint).poolmanager.connection_from_url(
+        client.endpoint
+    )
+    # The failed connection is not kept, but its slot is not lost either.
+    assert pool.pool.qsize() == 2
+    assert all(connection is None for connection in pool.pool.queue)
+
+
+@pytest.mark.parametrize("client", DEFAULT_CLIENTS)
+def test_bootstrap(client, request):
+    client = request.getfixturevalue(client)
+    client.bootstrap()
+
+    assert client.is_bootstrapped
+    assert client.version in LANGUAGE_TO_LANGUAGE_ID
+
+
+def test_atd_endpoint_header_is_request_local():
+    client = ATDJudge0CE("api_key")
+
+    headers = client._get_request_headers("get_submissions")
+
+    assert headers["x-apihub-endpoint"] == client.DEFAULT_GET_SUBMISSIONS_ENDPOINT
+    assert "x-apihub-endpoint" not in client.auth_headers
+
+
+def test_request_retries_unavailable_get(script_responses, make_response):
+    client = Client(
+        "http://localhost:1",
+        None,
+        request_retry=RequestRetryPolicy(initial_backoff_sec=0, jitter=0),
+    )
+    session = script_responses(
+        client,
+        [make_response(503), make_response(503), make_response(json_data={})],
+    )
+
+    assert client.get_about() == {}
+    assert session.methods == ["GET"] * 3
+
+
+def test_request_retry_honours_retry_after(script_responses, make_response):
+    client = Client(
+        "http://localhost:1",
+        None,
+        request_retry=RequestRetryPolicy(initial_backoff_sec=0, jitter=0),
+    )
+    script_responses(
+        client,
+        [
+            make_response(503, headers={"Retry-After": "0.1"}),
+            make_response(json_data={}),
+        ],
+    )
+
+    start_time = time.monotonic()
+    client.get_about()
+
+    assert time.monotonic() - start_time >= 0.09
+
+
+def test_request_retry_does_not_resend_sent_post(script_responses, make_response):
+    client = Client(
+        "http://localhost:1",
+        None,
+        request_retry=RequestRetryPolicy(initial_backoff_sec=0, jitter=0),
+    )
+    session = script_responses(client, [requests.ReadTimeout(), make_response(503)])
+
+    with pytest.raises(requests.ReadTimeout):
+        client._request("POST", "/submissions", route="create_submission")
+    # The server may have created the submission already.
+    assert session.methods == ["POST"]
+
+    with pytest.raises(requests.HTTPError):
+        client._request("POST", "/submissions", route="create_submission")
+    assert session.methods == ["POST"] * 2
+
+
+def test_request_retry_resends_unsent_post(script_responses, make_response):
+    client = Client(
+        "http://localhost:1",
+        None,
+        request_retry=RequestRetryPolicy(initial_backoff_sec=0, jitter=0),
+    )
+    session = script_responses(
+        client, [requests.ConnectTimeout(), make_response(json_data={"token": "1"})]
+    )
+
+    response = client._request("POST", "/submissions", route="create_submission")
+
+    assert response.json() == {"token": "1"}
+    assert session.methods == ["POST"] * 2
+
+
+def test_rate_limited_request_is_retried(script_responses, make_response):
+    client = Client("http://localhost:1", None, rate_limiter=RateLimiter())
+    too_many_requests = make_response(429, headers={"Retry-After": "0"})
+    session = script_responses(
+        client, [too_many_requests, too_many_requests, make_response(json_data={})]
+    )
+
+    assert client.get_about() == {}
+    assert session.methods == ["GET"] * 3
+
+
+def test_rate_limited_request_fails_after_max_retries(script_responses, make_response):
+    client = Client("http://localhost:1", None, rate_limiter=RateLimiter(max_retries=2))
+    session = script_responses(
+        client, [make_response(429, headers={"Retry-After": "0"})] * 3
+    )
+
+    with pytest.raises(requests.HTTPError) as exc_info:
+        client.get_about()
+
+    assert exc_info.value.response.status_code == 429
+    assert len(session.methods) == 3
+
+
+def test_rate_limited_preview_client_fails_after_max_retries(
+    script_responses, make_response
+):
+    client = SuluJudge0CE(rate_limiter=RateLimiter(max_retries=1))
+    script_responses(client, [make_response(429, headers={"Retry-After": "0"})] * 2)
+
+    with pytest.raises(PreviewClientLimitError):
+        client.get_about()
@@ -0,0 +1,242 @@
+import io
+import shutil
+import subprocess
+import zipfile
+
+from base64 import b64encode
+
+import pytest
+
+from judge0 import async_execute, Status, Submission
+from judge0.base_types import Config, Language
+from judge0.common import encode
+from judge0.packing import (
+    CASE_MARKER,
+    group_by_program,
+    MULTI_FILE_LANGUAGE_ID,
+    pack_submissions,
+    split_by_time_limits,
+    unpack_submissions,
+)
+from judge0.registry import LanguageRegistry
+
+PYTHON = Language(
+    id=100, name="Python", source_file="script.py", run_cmd="python3 script.py"
+)
+BASH = Language(id=46, name="Bash", source_file="script.sh", run_cmd="bash script.sh")
+CPP = Language(
+    id=105,
+    name="C++",
+    source_file="main.cpp",
+    compile_cmd="g++ %s main.cpp",
+    run_cmd="./a.out",
+)
+
+
+class StubClient:
+    def __init__(self, language, listed_language=None):
+        self.language = language
+        self.language_registry = LanguageRegistry(
+            [listed_language or language], "1.13.1"
+        )
+        self.config = Config.model_construct(
+            cpu_time_limit=5,
+            max_cpu_time_limit=15,
+            wall_time_limit=10,
+            max_wall_time_limit=20,
+        )
+        self.n_get_language_calls = 0
+
+    def get_language_id(self, language):
+        return self.language.id
+
+    def get_language(self, language_id):
+        self.n_get_language_calls += 1
+        return self.language
+
+
+def case_output(idx, exit_code, stdout, stderr="", time_usec=1500):
+    return (
+        f"{CASE_MARKER} {idx} {exit_code} {time_usec}\n"
+        f"{b64encode(stdout.encode()).decode()}\n"
+        f"{b64encode(stderr.encode()).decode()}\n"
+    )
+
+
+def finished_packed_submission(stdout, status_id=3):
+    packed_submission = Submission(source_code="")
+    packed_submission.set_attributes(
+        {"token": "packed", "status": {"id": status_id}, "stdout": encode(stdout)}
+    )
+    return packed_submission
+
+
+def test_group_by_program():
+    client = StubClient(PYTHON)
+    submissions = [
+        Submission(source_code="print(input())", stdin="1"),
+        Submission(source_code="print(42)", stdin="1"),
+        Submission(source_code="print(input())", stdin="2", expected_output="2"),
+    ]
+
+    groups = group_by_program(client, submissions)
+
+    assert groups == [[submissions[0], submissions[2]], [submissions[1]]]
+
+
+def test_pack_submissions():
+    client = StubClient(CPP)
+    submissions = [
+        Submission(source_code="int main() {}", stdin=stdin, compiler_options="-O2")
+        for stdin in ("1", "2")
+    ]
+
+    packed_submission = pack_submissions(client, submissions)
+
+    assert packed_submission.language == MULTI_FILE_LANGUAGE_ID
+    assert packed_submission.stdin is None
+    assert packed_submission.compiler_options is None
+    with zipfile.ZipFile(io.BytesIO(packed_submission.additional_files.encode())) as f:
+        files = {name: f.read(name).decode() for name in f.namelist()}
+    assert files["main.cpp"] == "int main() {}"
+    assert files["inputs/0"] == "1"
+    assert files["inputs/1"] == "2"
+    assert "g++ -O2 main.cpp" in files["compile"]
+    assert "./a.out < " in files["run"]
+
+
+def test_pack_scales_time_limits():
+    client = StubClient(PYTHON)
+    submissions = [
+        Submission(source_code="print(input())", stdin=stdin, cpu_time_limit=2)
+        for stdin in ("1", "2", "3")
+    ]
+
+    packed_submission = pack_submissions(client, submissions)
+
+    assert packed_submission.cpu_time_limit == 6
+    # Capped at the maximum wall time limit.
+    assert packed_submission.wall_time_limit == 20
+
+
+def test_split_by_time_limits():
+    client = StubClient(PYTHON)
+    submissions = [
+        Submission(source_code="print(input())", stdin=f"{i}") for i in range(5)
+    ]
+
+    chunks = split_by_time_limits(client, submissions)
+
+    assert chunks == [submissions[:2], submissions[2:4], submissions[4:]]
+
+
+def test_language_details_are_fetched_once():
+    client = StubClient(PYTHON, listed_language=Language(id=100, name="Python"))
+    submissions = [
+        Submission(source_code="print(input())", stdin=stdin) for stdin in ("1", "2")
+    ]
+
+    pack_submissions(client, submissions)
+    pack_submissions(client, submissions)
+
+    assert client.n_get_language_calls == 1
+    assert client.language_registry.get(100) == PYTHON
+
+
+def test_pack_different_programs():
+    client = StubClient(PYTHON)
+    submissions = [Submission(source_code="print(1)"), Submission(source_code="")]
+
+    with pytest.raises(ValueError):
+        pack_submissions(client, submissions)
+
+
+def test_unpack_submissions():
+    submissions = [
+        Submission(source_code="", stdin="a", expected_output="a"),
+        Submission(source_code="", stdin="b", expected_output="a"),
+        Submission(source_code="", stdin="c"),
+        Submission(source_code="", stdin="d"),
+    ]
+    packed_submission = finished_packed_submission(
+        case_output(0, 0, "a\n")
+        + case_output(1, 0, "b\n", "warning\n")
+        + case_output(2, 139, "")
+        + case_output(3, 3, "d\n")
+    )
+
+    unpack_submissions(packed_submission, submissions)
+
+    assert [submission.status for submission in submissions] == [
+        Status.ACCEPTED,
+        Status.WRONG_ANSWER,
+        Status.RUNTIME_ERROR_SIGSEGV,
+        Status.RUNTIME_ERROR_NZEC,
+    ]
+    assert submissions[1].stdout == "b\n"
+    assert submissions[1].stderr == "warning\n"
+    assert submissions[1].time == 0.0015
+    assert submissions[2].exit_signal == 11
+    assert submissions[3].exit_code == 3
+    assert all(submission.token == "packed" for submission in submissions)
+
+
+@pytest.mark.parametrize(
+    "status_id,expected_status",
+    [(3, Status.INTERNAL_ERROR), (5, Status.TIME_LIMIT_EXCEEDED)],
+)
+def test_unpack_missing_test_cases(status_id, expected_status):
+    submissions = [Submission(source_code="", stdin=stdin) for stdin in ("a", "b")]
+    packed_submission = finished_packed_submission(
+        case_output(0, 0, "a\n"), status_id=status_id
+    )
+
+    unpack_submissions(packed_submission, submissions)
+
+    assert submissions[0].status == Status.ACCEPTED
+    assert submissions[1].status == expected_status
+    assert submissions[1].stdout is None
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="Requires bash.")
+@pytest.mark.parametrize("redirect_stderr_to_stdout", [False, True])
+def test_packed_runtime_error(tmp_path, redirect_stderr_to_stdout):
+    client = StubClient(BASH)
+    submissions = [
+        Submission(
+            source_code="echo out; echo err >&2; exit $(cat)",
+            stdin=stdin,
+            redirect_stderr_to_stdout=redirect_stderr_to_stdout,
+        )
+        for stdin in ("0", "3")
+    ]
+    packed_submission = pack_submissions(client, submissions)
+    with zipfile.ZipFile(io.BytesIO(packed_submission.additional_files.encode())) as f:
+        f.extractall(tmp_path)
+    result = subprocess.run(
+        ["bash", "run"], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+
+    unpack_submissions(finished_packed_submission(result.stdout), submissions)
+
+    assert [submission.status for submission in submissions] == [
+        Status.ACCEPTED,
+        Status.RUNTIME_ERROR_NZEC,
+    ]
+    assert submissions[1].exit_code == 3
+    if redirect_stderr_to_stdout:
+        assert submissions[1].stdout == "out\nerr\n"
+        assert submissions[1].stderr is None
+    else:
+        assert submissions[1].stdout == "out\n"
+        assert submissions[1].stderr == "err\n"
+
+
+def test_pack_without_waiting():
+    with pytest.raises(ValueError):
+        async_execute(
+            client=StubClient(PYTHON),
+            source_code="print(input())",
+            test_cases=[("1", "1"), ("2", "2")],
+            pack_test_cases=True,
+        )
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from judge0 import Client, ClientPool, run, Submission
+from judge0.errors import CircuitOpenError
+
+
+def make_pool(n_clients, **kwargs):
+    return ClientPool(
+        [Client(f"http://localhost:{i + 1}", None) for i in range(n_clients)],
+        **kwargs,
+    )
+
+
+def test_weighted_round_robin():
+    pool = make_pool(3, weights=[3, 1, 1])
+
+    selected = [pool._next_round_robin([0, 1, 2]) for _ in range(10)]
+
+    assert selected.count(0) == 6
+    assert selected.count(1) == 2
+    assert selected.count(2) == 2
+    # Smooth round-robin interleaves the heaviest client with the others.
+    assert selected[:3] != [0, 0, 0]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"weights": [1]},
+        {"weights": [1, 0]},
+        {"strategy": "random"},
+    ],
+)
+def test_invalid_pool_arguments(kwargs):
+    with pytest.raises(ValueError):
+        make_pool(2, **kwargs)
+
+
+def test_latency_strategy_prefers_fastest_client(monkeypatch):
+    pool = make_pool(3, strategy="latency")
+    monkeypatch.setattr(pool, "probe", lambda: [0.3, 0.1, float("inf")])
+    pool._latencies = [0.3, 0.1, float("inf")]
+    pool._probed_at = time.monotonic()
+    for client in pool:
+        monkeypatch.setattr(client, "get_unsupported_languages", lambda _: [])
+
+    assert pool._acquire([71]) == 1
+
+
+def test_unknown_submission_owner():
+    pool = make_pool(2)
+    submission = Submission(token="b7032b8b-86da-40b4-b9d3-b1f5e2b4ee1e")
+
+    with pytest.raises(ValueError):
+        pool.get_owner(submission)
+
+
+def test_create_fails_over_to_next_client(stub_client, monkeypatch):
+    failing_client = type(stub_client)()
+
+    def create_submissions(submissions):
+        raise CircuitOpenError("Circuit is open.")
+
+    monkeypatch.setattr(failing_client, "create_submissions", create_submissions)
+    pool = ClientPool([failing_client, stub_client], strategy="priority")
+    submissions = [
+        Submission(source_code="print(input())", stdin=f"{i}") for i in range(2)
+    ]
+
+    pool.create_submissions(submissions)
+    pool.get_submissions(submissions)
+
+    assert all(pool.get_owner(submission) is stub_client for submission in submissions)
+    assert stub_client.calls["create_submissions"] == 1
+    assert stub_client.calls["get_submissions"] == 1
+    # Owners are kept by the submissions, not by the pool.
+    with pytest.raises(ValueError):
+        ClientPool([stub_client]).get_owner(submissions[0])
+
+
+def test_run_with_pool(judge0_ce_client, judge0_extra_ce_client):
+    pool = ClientPool([judge0_ce_client, judge0_extra_ce_client])
+
+    submissions = run(
+        client=pool,
+        submissions=[Submission(source_code=f"print({i})") for i in range(4)],
+    )
+
+    assert [submission.stdout for submission in submissions] == [
+        f"{i}\n" for i in range(4)
+    ]
+    assert {pool.get_owner(submission) for submission in submissions} == set(pool)
+
+
+def test_implicit_client_fails_over_between_providers(monkeypatch):
+    import judge0
+
+    monkeypatch.setattr(judge0, "JUDGE0_IMPLICIT_CE_CLIENT", None)
+    monkeypatch.setattr(judge0, "_load_dotenv", lambda: None)
+    for client_class in judge0.clients.CE:
+        monkeypatch.delenv(client_class.API_KEY_ENV, raising=False)
+    monkeypatch.setenv("JUDGE0_RAPID_API_KEY", "rapid_api_key")
+    monkeypatch.setenv("JUDGE0_ATD_API_KEY", "atd_api_key")
+    monkeypatch.delenv("JUDGE0_CLIENT_SELECTION", raising=False)
+
+    # Without the opt-in, the implicit client stays a single client.
+    assert isinstance(judge0._get_implicit_client(judge0.CE), judge0.Client)
+
+    monkeypatch.setattr(judge0, "JUDGE0_IMPLICIT_CE_CLIENT", None)
+    monkeypatch.setenv("JUDGE0_CLIENT_SELECTION", "priority")
+
+    client = judge0._get_implicit_client(judge0.CE)
+
+    assert isinstance(client, ClientPool)
+    assert client.strategy == "priority"
+    assert all(member.circuit_breaker is not None for member in client)
+
+    monkeypatch.setattr(judge0, "JUDGE0_IMPLICIT_CE_CLIENT", None)
+    monkeypatch.setenv("JUDGE0_CLIENT_SELECTION", "latency")
+
+    assert judge0._get_implicit_client(judge0.CE).strategy == "latency"
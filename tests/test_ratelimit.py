@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from judge0 import FileRateLimiter, RateLimiter
+from judge0.ratelimit import get_rate_limit_reset_sec, get_retry_after_sec
+from requests.structures import CaseInsensitiveDict
+
+
+@pytest.mark.parametrize(
+    "headers,expected_delay",
+    [
+        [{}, None],
+        [{"Retry-After": "3"}, 3],
+        [{"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0],
+        [{"Retry-After": "soon"}, None],
+    ],
+)
+def test_get_retry_after_sec(headers, expected_delay):
+    assert get_retry_after_sec(CaseInsensitiveDict(headers)) == expected_delay
+
+
+@pytest.mark.parametrize(
+    "headers,expected_reset",
+    [
+        [{"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"}, None],
+        [{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}, 10],
+        [{"RateLimit-Remaining": "0", "RateLimit-Reset": "2"}, 2],
+        [
+            {
+                "X-RateLimit-Requests-Remaining": "0",
+                "X-RateLimit-Requests-Reset": "7",
+            },
+            7,
+        ],
+    ],
+)
+def test_get_rate_limit_reset_sec(headers, expected_reset):
+    assert get_rate_limit_reset_sec(CaseInsensitiveDict(headers)) == expected_reset
+
+
+def test_rate_limiter_paces_requests():
+    limiter = RateLimiter(rate=50, burst=1)
+
+    start_time = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    assert time.monotonic() - start_time >= 0.09
+
+
+def test_rate_limiter_retries_too_many_requests():
+    limiter = RateLimiter(max_retries=2, max_backoff_sec=10)
+    headers = CaseInsensitiveDict({"Retry-After": "0.05"})
+
+    assert limiter.should_retry(429, headers, n_retries=0)
+    assert not limiter.should_retry(429, headers, n_retries=2)
+    assert not limiter.should_retry(500, headers, n_retries=0)
+
+    start_time = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start_time >= 0.04
+
+
+def test_rate_limiter_does_not_wait_beyond_max_backoff():
+    limiter = RateLimiter(max_backoff_sec=1)
+    headers = CaseInsensitiveDict({"Retry-After": "3600"})
+
+    assert not limiter.should_retry(429, headers, n_retries=0)
+
+
+def test_file_rate_limiter_shares_budget(tmp_path):
+    limiter = FileRateLimiter("api_key", rate=1, burst=1, directory=tmp_path)
+    other_limiter = FileRateLimiter("api_key", rate=1, burst=1, directory=tmp_path)
+
+    limiter.acquire()
+
+    assert other_limiter._try_acquire() > 0
+    assert "api_key" not in str(limiter.path)
+
+
+def test_file_rate_limiter_shares_pauses(tmp_path):
+    limiter = FileRateLimiter("api_key", directory=tmp_path)
+    other_limiter = FileRateLimiter("api_key", directory=tmp_path)
+    unrelated_limiter = FileRateLimiter("other_api_key", directory=tmp_path)
+
+    limiter.pause(60)
+
+    assert other_limiter._try_acquire() > 0
+    assert unrelated_limiter._try_acquire() == 0
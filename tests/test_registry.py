@@ -0,0 +1,45 @@
+import pytest
+
+from judge0 import Language, LanguageAlias
+from judge0.registry import LanguageRegistry
+
+LANGUAGES = [
+    Language(id=2, name="C++ (GCC 9.2.0)"),
+    Language(id=71, name="Python (3.8.1)"),
+    Language(id=100, name="Python (3.12.5)"),
+]
+
+
+@pytest.fixture
+def registry():
+    return LanguageRegistry(LANGUAGES, "1.14.0")
+
+
+@pytest.mark.parametrize(
+    "language,expected_id",
+    [
+        [100, 100],
+        [LanguageAlias.PYTHON, 100],
+        [LanguageAlias.PYTHON_FOR_ML, -1],
+        ["Python (3.8.1)", 71],
+        ["python (3.8.1)", 71],
+        ["Brainfuck", -1],
+    ],
+)
+def test_get_language_id(registry, language, expected_id):
+    assert registry.get_language_id(language) == expected_id
+
+
+def test_is_supported(registry):
+    assert registry.is_supported(71)
+    assert registry.is_supported("Python (3.12.5)")
+    assert not registry.is_supported(-1)
+    assert registry.get(LanguageAlias.PYTHON) == LANGUAGES[2]
+
+
+def test_unsupported_tells_aliases_and_ids_apart(registry):
+    # LanguageAlias.CPP == 1 is not supported in version 1.14.0 because it maps
+    # to id 105, while id 2 is supported.
+    languages = [2, LanguageAlias.CPP, 2, LanguageAlias.CPP, 71]
+
+    assert registry.unsupported(languages) == [LanguageAlias.CPP]
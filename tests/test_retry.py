@@ -0,0 +1,144 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from judge0 import (
+    EstimatedTimeRetry,
+    ExponentialBackoffRetry,
+    MaxRetries,
+    MaxWaitTime,
+    RequestRetryPolicy,
+    Submission,
+)
+from judge0.api import _get_retry_strategy
+
+
+def test_exponential_backoff_is_capped():
+    retry_strategy = ExponentialBackoffRetry(
+        initial_period_sec=0.1, max_period_sec=1.0, multiplier=2.0, jitter=0.0
+    )
+
+    periods = []
+    for _ in range(10):
+        periods.append(retry_strategy.wait_time_sec())
+        retry_strategy.step()
+
+    assert periods[:4] == pytest.approx([0.1, 0.2, 0.4, 0.8])
+    assert periods[4:] == pytest.approx([1.0] * 6)
+    assert not retry_strategy.is_done()
+
+
+def test_exponential_backoff_jitter():
+    retry_strategy = ExponentialBackoffRetry(initial_period_sec=1.0, jitter=0.5)
+
+    for _ in range(100):
+        assert 0.5 <= retry_strategy.wait_time_sec() <= 1.0
+
+
+def test_exponential_backoff_max_retries():
+    retry_strategy = ExponentialBackoffRetry(max_retries=2)
+
+    retry_strategy.step()
+    assert not retry_strategy.is_done()
+    retry_strategy.step()
+    assert retry_strategy.is_done()
+
+
+def test_estimated_time_uses_turnaround_time():
+    retry_strategy = EstimatedTimeRetry(min_period_sec=0.1, max_period_sec=10.0)
+    created_at = datetime(2024, 1, 1)
+    finished = Submission(
+        source_code="",
+        created_at=created_at,
+        finished_at=created_at + timedelta(seconds=3),
+    )
+
+    retry_strategy.observe([Submission(source_code="")], [finished])
+
+    assert 2.5 < retry_strategy.period_sec <= 3.0
+
+
+def test_estimated_time_is_kept_between_waits():
+    retry_strategy = EstimatedTimeRetry()
+    created_at = datetime(2024, 1, 1)
+    finished = Submission(
+        source_code="",
+        created_at=created_at,
+        finished_at=created_at + timedelta(seconds=3),
+    )
+
+    # Every wait runs on its own copy of the strategy.
+    _get_retry_strategy(None, retry_strategy).observe([], [finished])
+
+    assert retry_strategy.turnaround_time_sec == pytest.approx(3.0)
+    assert _get_retry_strategy(None, retry_strategy).turnaround_time_sec == (
+        pytest.approx(3.0)
+    )
+
+
+def test_estimated_time_respects_time_limits():
+    retry_strategy = EstimatedTimeRetry(min_period_sec=0.1, max_period_sec=10.0)
+    pending = Submission(source_code="", wall_time_limit=0.5)
+
+    for _ in range(10):
+        retry_strategy.observe([pending], [])
+
+    assert retry_strategy.period_sec == pytest.approx(0.5)
+
+
+def test_max_wait_time_counts_wall_clock_time():
+    retry_strategy = MaxWaitTime(max_wait_time_sec=0.2, wait_time_sec=0.01)
+    retry_strategy.reset()
+
+    time.sleep(0.2)
+
+    assert retry_strategy.is_done()
+
+    retry_strategy.reset()
+
+    assert not retry_strategy.is_done()
+
+
+def test_max_retries_reset():
+    retry_strategy = MaxRetries(max_retries=1)
+    retry_strategy.step()
+    assert retry_strategy.is_done()
+
+    retry_strategy.reset()
+
+    assert not retry_strategy.is_done()
+
+
+@pytest.mark.parametrize(
+    "method,status_code,expected",
+    [
+        ["GET", 503, True],
+        ["GET", 500, False],
+        ["POST", 503, False],
+    ],
+)
+def test_request_retry_policy_status(method, status_code, expected):
+    policy = RequestRetryPolicy()
+    assert policy.is_retryable_status(method, status_code) == expected
+
+
+def test_request_retry_policy_guards_non_idempotent_requests():
+    policy = RequestRetryPolicy()
+
+    assert policy.is_retryable_error("GET", connected=True)
+    assert policy.is_retryable_error("POST", connected=False)
+    assert not policy.is_retryable_error("POST", connected=True)
+
+    policy = RequestRetryPolicy(retry_non_idempotent=True)
+
+    assert policy.is_retryable_error("POST", connected=True)
+    assert policy.is_retryable_status("POST", 503)
+
+
+def test_request_retry_policy_backoff():
+    policy = RequestRetryPolicy(initial_backoff_sec=1, max_backoff_sec=5, jitter=0)
+
+    assert [policy.backoff_sec(n) for n in range(4)] == [1, 2, 4, 5]
+    assert policy.backoff_sec(0, retry_after_sec=3) == 3
+    assert policy.backoff_sec(0, retry_after_sec=60) == 5